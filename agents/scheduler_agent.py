@@ -11,6 +11,7 @@ import schedule
 from champion.autopilot import run_champion_autopilot
 from mongo_service import get_collection
 from utils import champion_data
+from utils.recurrence import get_materializer
 from services.google.sync_task import start_google_sync
 
 
@@ -71,3 +72,17 @@ class SchedulerAgent:
             "\U0001f4c5 Google Calendar sync every %s minutes scheduled via loop",
             minutes,
         )
+
+    def schedule_recurrence_materializer(self, at: str = "03:00") -> None:
+        """Extend materialised event occurrences nightly (and once now)."""
+
+        def extend_job() -> None:
+            try:
+                get_materializer(self.mongo_db).extend()
+            except Exception:  # noqa: BLE001 - log exception only
+                logging.exception("Extending event occurrences failed")
+
+        extend_job()
+        job = schedule.every().day.at(at).do(extend_job)
+        self.jobs.append(job)
+        logging.info("\U0001f4c5 Event occurrences extended daily at %s", at)
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, Tuple
 
 import logging
 from i18n_tools.generate_key_list import update_key_list
@@ -18,21 +18,25 @@ class TranslationAgent:
     def __init__(self, lang_dir: str | Path = "translations"):
         self.lang_dir = Path(lang_dir)
 
-    def _load_translations(self) -> Dict[str, Dict[str, str]]:
-        data: Dict[str, Dict[str, str]] = {}
-        for path in self.lang_dir.glob("*.json"):
-            try:
-                with path.open(encoding="utf-8") as f:
-                    data[path.stem] = json.load(f)
-            except json.JSONDecodeError:
-                data[path.stem] = {}
-        return data
+    def _languages(self) -> list[str]:
+        """Language codes from the directory listing (no file is parsed)."""
+        return sorted(path.stem for path in self.lang_dir.glob("*.json"))
+
+    def _load_language(self, lang: str) -> Dict[str, str]:
+        try:
+            with (self.lang_dir / f"{lang}.json").open(encoding="utf-8") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            return {}
+
+    def _iter_translations(self) -> Iterator[Tuple[str, Dict[str, str]]]:
+        """Yield one language at a time so only one catalog is held in memory."""
+        for lang in self._languages():
+            yield lang, self._load_language(lang)
 
     def sync(self) -> None:
         """Synchronise all translation files with a unified key set."""
 
-        data = self._load_translations()
-
         keys_file = Path("translation_keys.json")
         try:
             keys = update_key_list(self.lang_dir / "en.json", keys_file)
@@ -40,21 +44,30 @@ class TranslationAgent:
             logger.warning("Failed to update key list: %s", e)
             keys = []
 
+        # One parse per catalog: only the key sets are kept, not the texts.
         all_keys = set(keys)
-        if data:
-            all_keys.update(*data.values())
+        present: Dict[str, set[str]] = {}
+        for lang, entries in self._iter_translations():
+            present[lang] = set(entries)
+            all_keys.update(entries)
 
-        for lang, entries in data.items():
-            missing = [k for k in all_keys if k not in entries]
+        for lang, known in present.items():
+            missing = [k for k in all_keys if k not in known]
             if not missing:
                 continue
+            # Catalogs that lack keys are loaded again to be rewritten.
+            entries = self._load_language(lang)
             for key in missing:
                 entries[key] = ""
             with (self.lang_dir / f"{lang}.json").open("w", encoding="utf-8") as f:
                 json.dump(entries, f, indent=2, ensure_ascii=False)
 
-    def auto_translate_missing(self) -> None:
-        """Fill missing translations using the auto_fill helper."""
+    def auto_translate_missing(self, translator=None) -> None:
+        """Fill missing translations of all languages in one batched MT run.
+
+        ``translator`` defaults to :func:`i18n_tools.auto_fill.get_translator`;
+        already translated source strings come from the translation memory.
+        """
 
         from i18n_tools import auto_fill
 
@@ -63,16 +76,11 @@ class TranslationAgent:
         auto_fill.TRANSLATIONS_DIR = self.lang_dir
         try:
             data = auto_fill.load_all()
-            base = data.get(auto_fill.BASE_LANG, {})
             all_keys = set().union(*data.values()) if data else set()
-
-            for lang, entries in data.items():
-                missing = [k for k in all_keys if not entries.get(k)]
-                if not missing:
-                    continue
-                for key in missing:
-                    source = base.get(key, key)
-                    entries[key] = auto_fill.translate(source, lang)
-                auto_fill.save_lang(lang, entries)
+            missing = {
+                lang: [k for k in all_keys if not entries.get(k)] for lang, entries in data.items()
+            }
+            for lang in auto_fill.fill_all(data, missing, translator):
+                auto_fill.save_lang(lang, data[lang])
         finally:
             auto_fill.TRANSLATIONS_DIR = original_dir
@@ -18,10 +18,12 @@ from flask import (
 from werkzeug.utils import secure_filename
 
 from agents.webhook_agent import WebhookAgent
+from fur_lang.catalog import write_atomic
 from fur_lang.i18n import t
 from mongo_service import get_collection
 from utils.discord_util import require_roles
 from utils.poster_generator import generate_event_poster
+from utils.recurrence import get_materializer
 from web.auth.decorators import r4_required
 
 admin = Blueprint("admin", __name__)
@@ -50,14 +52,18 @@ def create_event():
         event_time = request.form.get("event_date")
         description = request.form.get("description")
         try:
-            get_collection("events").insert_one(
-                {
-                    "title": title,
-                    "event_time": event_time,
-                    "created_by": 1,
-                    "description": description,
-                }
-            )
+            collection = get_collection("events")
+            event = {
+                "title": title,
+                "event_time": event_time,
+                "created_by": 1,
+                "description": description,
+                "role": request.form.get("role"),
+                "recurrence": request.form.get("recurrence"),
+            }
+            collection.insert_one(event)
+            if event["recurrence"]:
+                get_materializer(collection.database).materialize(event)
             flash(t("event_created", default="Event created"), "success")
             return redirect(url_for("admin.events"))
         except Exception as e:
@@ -79,7 +85,13 @@ def dashboard():
         doc = coll.find_one({"_id": f"dm_image_{_t}"})
         dm_settings[_t] = doc.get("value") if doc else ""
 
-    return render_template("admin/dashboard.html", dm_settings=dm_settings)
+    from services.google.calendar_sync import SYNC_STATE_COLLECTION, sync_status
+
+    calendar_sync = sync_status(get_collection(SYNC_STATE_COLLECTION).database)
+
+    return render_template(
+        "admin/dashboard.html", dm_settings=dm_settings, calendar_sync=calendar_sync
+    )
 
 
 @require_roles(["R4", "ADMIN"])
@@ -132,6 +144,9 @@ def edit_event():
         }
         try:
             collection.update_one({"_id": ObjectId(event_id)}, {"$set": update})
+            if update["recurrence"] or event.get("recurrence"):
+                # Only this series' future occurrences are recomputed.
+                get_materializer(collection.database).materialize({**event, **update})
             flash(t("event_updated", default="Event updated"), "success")
             return redirect(url_for("admin.events"))
         except Exception as e:
@@ -209,7 +224,7 @@ def tools():
 @r4_required
 @admin.route("/translations_editor", methods=["GET", "POST"])
 def translations_editor():
-    from fur_lang.i18n import get_supported_languages, translations
+    from fur_lang.i18n import get_supported_languages, swap_translations
 
     supported_languages = get_supported_languages()
     selected_language = (
@@ -241,9 +256,9 @@ def translations_editor():
                 updated[key] = v
         if file_path:
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(updated, f, indent=2, ensure_ascii=False)
-            translations[selected_language] = updated
+            # Atomar ersetzen: andere Worker und der Bot laden per Watcher nach
+            write_atomic(file_path, json.dumps(updated, indent=2, ensure_ascii=False))
+            swap_translations(selected_language, updated)
             data = updated
 
     return render_template(
@@ -3,6 +3,8 @@ from __future__ import annotations
 from flask import Blueprint, Response
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
 
+from bot import dm_ledger, outbound_queue  # noqa: F401 – registers bot send metrics
+
 monitoring = Blueprint("monitoring", __name__)
 
 # Metrics
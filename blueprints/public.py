@@ -15,7 +15,7 @@ from flask import (
     url_for,
 )
 
-from fur_lang.i18n import get_supported_languages, t
+from fur_lang.i18n import language_table, t
 from mongo_service import get_collection
 from web.auth.decorators import login_required, r3_required
 
@@ -30,7 +30,7 @@ def landing():
 @public.route("/set_language")
 def set_language():
     lang = request.args.get("lang")
-    if lang in get_supported_languages():
+    if lang in language_table():
         session["lang"] = lang
     return redirect(request.referrer or url_for("public.landing"))
 
@@ -10,6 +10,7 @@ import os
 import aiohttp
 
 from config import Config
+from fur_lang.i18n import start_watcher
 
 from .translator import MyTranslator
 
@@ -95,7 +96,13 @@ async def run_bot(max_retries: int = 3) -> None:
     bot = await create_bot()
 
     if USE_DISCORD_BOT:
+        start_watcher()
         await load_extensions(bot)
+        translator = bot.tree.translator
+        if isinstance(translator, MyTranslator):
+            # Befehlsübersetzungen einmalig vorberechnen statt pro Sync
+            count = await translator.precompute(bot.tree)
+            log.info("🌍 Befehlstabelle bereit (%s Einträge)", count)
 
         for attempt in range(1, max_retries + 1):
             try:
@@ -9,18 +9,26 @@ import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 
+from bot.dm_ledger import OUTCOME_SENT, OUTCOME_SUPPRESSED, deliver, ledger
+from bot.outbound_queue import LANE_BULK, LANE_INTERACTION
 from config import Config
 from fur_lang.i18n import t
 from mongo_service import get_collection
 from services.calendar_service import CalendarService, SyncTokenExpired
+from services.google.async_client import run_blocking
 from services.google.calendar_sync import CalendarSettings
+from services.google.sync_coordinator import (
+    EVENTS_COLLECTION,
+    get_coordinator,
+    tick_interval_minutes,
+)
 from utils.poster_generator import create_event_image
 from utils.oauth_utils import (
     build_authorization_url,
     generate_code_challenge,
     generate_code_verifier,
 )
-from utils.timezone import convert_datetime, get_user_timezone
+from utils.timezone import DEFAULT_TZ, convert_datetime, get_timezone, get_user_timezone
 
 log = logging.getLogger(__name__)
 
@@ -59,6 +67,9 @@ class CalendarCog(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
         self.service: CalendarService | None = None
+        self.sync_loop.change_interval(
+            minutes=tick_interval_minutes(Config.GOOGLE_SYNC_INTERVAL_MINUTES)
+        )
         self.sync_loop.start()
         self.daily_loop.start()
         self.weekly_loop.start()
@@ -96,11 +107,27 @@ class CalendarCog(commands.Cog):
         user = get_collection("users").find_one({"discord_id": str(user_id)})
         return get_user_timezone(user)
 
-    async def _send_events_dm(self, user: discord.User, events: list[dict], title: str) -> None:
-        tz = self._get_user_timezone(user.id)
+    @staticmethod
+    def _load_member_profiles(member_ids: list[int]) -> dict[int, tuple[str, str | None]]:
+        """Return ``{member_id: (timezone, lang)}`` with a single ``$in`` query."""
+        profiles: dict[int, tuple[str, str | None]] = {}
+        if not member_ids:
+            return profiles
+        cursor = get_collection("users").find(
+            {"discord_id": {"$in": [str(mid) for mid in member_ids]}},
+            {"discord_id": 1, "timezone": 1, "lang": 1},
+        )
+        for doc in cursor:
+            profiles[int(doc["discord_id"])] = (get_user_timezone(doc).key, doc.get("lang"))
+        return profiles
+
+    @staticmethod
+    def _build_events_embed(
+        events: list[dict], title: str, tz: ZoneInfo, lang: str | None = None
+    ) -> discord.Embed:
         embed = discord.Embed(title=title, colour=discord.Colour.blue())
         if not events:
-            embed.description = t("calendar_no_events")
+            embed.description = t("calendar_no_events", lang=lang)
         for ev in events:
             when = ev.get("event_time")
             if when:
@@ -109,13 +136,19 @@ class CalendarCog(commands.Cog):
             else:
                 dt_str = "TBA"
             embed.add_field(name=ev.get("title", "-"), value=dt_str, inline=False)
-        try:
-            await user.send(embed=embed)
+        return embed
+
+    async def _send_events_dm(
+        self,
+        user: discord.User,
+        events: list[dict],
+        title: str,
+        lane: str = LANE_INTERACTION,
+    ) -> None:
+        tz = self._get_user_timezone(user.id)
+        embed = self._build_events_embed(events, title, tz)
+        if await deliver(user, "calendar", embed=embed, lane=lane) == OUTCOME_SENT:
             log.info("Sent events DM to %s with %d events", user.id, len(events))
-        except discord.Forbidden:
-            log.warning("DM blocked for %s", user.id)
-        except Exception as exc:  # pragma: no cover - network failures
-            log.warning("DM error for %s: %s", user.id, exc)
 
     @calendar.command(name="today", description="Show today's events")
     async def cmd_today(self, interaction: discord.Interaction) -> None:
@@ -188,28 +221,52 @@ class CalendarCog(commands.Cog):
         embed.set_image(url="attachment://event.png")
         await interaction.response.send_message(embed=embed, file=file)
 
-    async def _send_reminders(self, events: list[dict], title: str) -> None:
+    async def _send_reminders(self, events: list[dict], title_key: str) -> None:
+        """DM ``events`` to all members, rendering one embed per (timezone, language)."""
         guild = self.bot.get_guild(Config.DISCORD_GUILD_ID)
         if not guild:
             log.warning("Guild not found for calendar reminders")
             return
-        for member in guild.members:
-            if member.bot:
+        members = [m for m in guild.members if not m.bot]
+        member_ids = [m.id for m in members]
+        suppressed = ledger.suppressed_ids(member_ids)
+        profiles = self._load_member_profiles(member_ids)
+
+        groups: dict[tuple[str, str | None], list[discord.Member]] = {}
+        for member in members:
+            if member.id in suppressed:
+                ledger.record(member.id, "calendar", OUTCOME_SUPPRESSED)
                 continue
-            await self._send_events_dm(member, events, title)
+            key = profiles.get(member.id, (DEFAULT_TZ.key, None))
+            groups.setdefault(key, []).append(member)
+
+        sent = 0
+        for (tz_key, lang), recipients in groups.items():
+            embed = self._build_events_embed(
+                events, t(title_key, lang=lang), get_timezone(tz_key), lang
+            )
+            for member in recipients:
+                if await deliver(member, "calendar", embed=embed, lane=LANE_BULK) == OUTCOME_SENT:
+                    sent += 1
+        ledger.flush()
+        log.info(
+            "Sent calendar DMs to %d members (%d embed variants, %d events)",
+            sent,
+            len(groups),
+            len(events),
+        )
 
     @tasks.loop(minutes=Config.GOOGLE_SYNC_INTERVAL_MINUTES)
     async def sync_loop(self) -> None:
-        """Regularly synchronize events from Google to MongoDB."""
+        """Tick the shared sync coordinator; only the lease holder syncs."""
         await self.bot.wait_until_ready()
         try:
-            self.setup_service()
-            if not self.service or self.service.service is None:
-                log.warning("Calendar service not configured – skipping sync")
-                return
-            await self.service.sync()
+            coordinator = get_coordinator(get_collection(EVENTS_COLLECTION).database)
+            # Dedicated Google pool – a hung API call never starves the default executor.
+            await run_blocking(coordinator.tick)
         except Exception:  # noqa: BLE001
-            log.exception("Calendar sync failed")
+            # An escaping error would stop the task loop for good.
+            log.exception("Calendar sync tick failed")
 
     @tasks.loop(hours=1)
     async def daily_loop(self) -> None:
@@ -218,7 +275,7 @@ class CalendarCog(commands.Cog):
         now = datetime.now(timezone.utc)
         if should_send_daily(now):
             events = await self.service.get_events_today() if self.service else []
-            await self._send_reminders(events, t("calendar_today_title"))
+            await self._send_reminders(events, "calendar_today_title")
 
     @tasks.loop(hours=1)
     async def weekly_loop(self) -> None:
@@ -227,7 +284,7 @@ class CalendarCog(commands.Cog):
         now = datetime.now(timezone.utc)
         if should_send_weekly(now):
             events = await self.service.get_events_week() if self.service else []
-            await self._send_reminders(events, t("calendar_week_title"))
+            await self._send_reminders(events, "calendar_week_title")
 
 
 async def setup(bot: commands.Bot) -> None:
@@ -8,6 +8,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from bot.dm_ledger import OUTCOME_SENT, OUTCOME_SUPPRESSED, deliver, ledger
 from config import Config, is_production
 from fur_lang.i18n import t
 
@@ -90,19 +91,19 @@ class DMBroadcastCog(commands.Cog):
 
             success_count = 0
             fail_count = 0
-            for member in guild.members:
-                if member.bot:
+            members = [m for m in guild.members if not m.bot]
+            suppressed = ledger.suppressed_ids(m.id for m in members)
+            for member in members:
+                if member.id in suppressed:
+                    fail_count += 1
+                    ledger.record(member.id, "broadcast", OUTCOME_SUPPRESSED)
                     continue
-                try:
-                    await member.send(text)
+                if await deliver(member, "broadcast", text) == OUTCOME_SENT:
                     success_count += 1
-                except discord.Forbidden:
-                    fail_count += 1
-                    log.warning("🚫 DM blockiert für %s", member.id)
-                except Exception as exc:
+                else:
                     fail_count += 1
-                    log.error("❌ Fehler bei DM an %s: %s", member.id, exc)
                 await asyncio.sleep(MESSAGE_DELAY)
+            ledger.flush()
 
             embed = discord.Embed(title="📢 DM Broadcast Result", color=discord.Color.blue())
             embed.add_field(
@@ -5,6 +5,7 @@ from typing import Dict
 import discord
 from discord.ext import commands, tasks
 
+from bot.outbound_queue import LANE_CHANNEL, outbound
 from config import Config
 from fur_lang.i18n import t
 from mongo_service import get_collection
@@ -51,7 +52,7 @@ class HourlyReminderCog(commands.Cog):
 
         msg = t("reminder_hourly", lang="en", time=now.strftime("%H:%M"))
         try:
-            await channel.send(msg)
+            await outbound.run(LANE_CHANNEL, channel.send, msg)
             self._last_sent[channel.id] = now
         except discord.DiscordException as exc:  # noqa: BLE001
             log.error("Failed to send reminder: %s", exc)
@@ -1,6 +1,7 @@
 import json
 import logging
 import asyncio
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -8,6 +9,14 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from bot.dm_ledger import (
+    OUTCOME_ERROR,
+    OUTCOME_NOT_FOUND,
+    OUTCOME_SENT,
+    OUTCOME_SUPPRESSED,
+    deliver,
+    ledger,
+)
 from bot.dm_utils import get_dm_users
 from mongo_service import get_collection
 
@@ -15,19 +24,36 @@ log = logging.getLogger(__name__)
 
 INTRO_JSON = Path("docs/AI_Intro-Image.json")
 INTRO_IMAGE = Path("static/img/SORRY.png")
+# Per-user markers – one document per recipient that has been handled.
+ROLLOUT_COLLECTION = "intro_rollout"
 
 
 class IntroCog(commands.Cog):
+    """One-time AI intro DM, rolled out as a resumable background job."""
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        asyncio.create_task(self._maybe_send_intro())
+        self.concurrency = int(os.getenv("INTRO_DM_CONCURRENCY", "4"))
+        self.start_delay = float(os.getenv("INTRO_START_DELAY", "60"))
+        self.progress: dict[str, int] = {"total": 0, "done": 0, "sent": 0, "failed": 0}
+        self._task: asyncio.Task | None = None
 
     async def _hook(self) -> None:
         await self.bot.wait_until_ready()
+        # Let the gateway settle before competing with startup traffic.
+        await asyncio.sleep(self.start_delay)
         await self._maybe_send_intro()
 
+    def _start_rollout(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._hook())
+
     async def cog_load(self):
-        asyncio.create_task(self._hook())
+        self._start_rollout()
+
+    def cog_unload(self) -> None:  # pragma: no cover - lifecycle
+        if self._task:
+            self._task.cancel()
 
     @staticmethod
     def _load_embed() -> discord.Embed | None:
@@ -42,39 +68,110 @@ class IntroCog(commands.Cog):
             log.error("failed to load intro json: %s", exc)
             return None
 
-    async def _send_intro(self) -> None:
+    @staticmethod
+    def _pending_user_ids() -> list[int]:
+        """Return DM users without an intro marker (i.e. not handled yet)."""
+        user_ids = get_dm_users()
+        if not user_ids:
+            return []
+        done = {
+            doc["_id"]
+            for doc in get_collection(ROLLOUT_COLLECTION).find(
+                {"_id": {"$in": user_ids}}, {"_id": 1}
+            )
+        }
+        return [uid for uid in user_ids if uid not in done]
+
+    async def _send_one(self, uid: int, embed: discord.Embed, suppressed: set[int]) -> str:
+        if uid in suppressed:
+            ledger.record(uid, "intro", OUTCOME_SUPPRESSED)
+            return OUTCOME_SUPPRESSED
+        try:
+            user = self.bot.get_user(uid) or await self.bot.fetch_user(uid)
+        except discord.NotFound:
+            ledger.record(uid, "intro", OUTCOME_NOT_FOUND)
+            return OUTCOME_NOT_FOUND
+        except Exception as exc:  # noqa: BLE001
+            log.error("intro DM to %s failed: %s", uid, exc)
+            return OUTCOME_ERROR
+        return await deliver(user, "intro", embed=embed, user_id=uid)
+
+    async def _send_intro(self) -> bool:
+        """Send the intro to every pending user; ``False`` if some must be retried."""
         embed = self._load_embed()
         if not embed:
-            return
-        for uid in get_dm_users():
-            try:
-                user = await self.bot.fetch_user(uid)
-                await user.send(embed=embed)
-            except Exception as exc:  # noqa: BLE001
-                log.error("intro DM to %s failed: %s", uid, exc)
+            return False
+        pending = self._pending_user_ids()
+        self.progress = {"total": len(pending), "done": 0, "sent": 0, "failed": 0}
+        if not pending:
+            return True
+        retry: list[int] = []
+        suppressed = ledger.suppressed_ids(pending)
+        markers = get_collection(ROLLOUT_COLLECTION)
+        queue: asyncio.Queue[int] = asyncio.Queue()
+        for uid in pending:
+            queue.put_nowait(uid)
+
+        async def worker() -> None:
+            while not queue.empty():
+                uid = queue.get_nowait()
+                outcome = await self._send_one(uid, embed, suppressed)
+                self.progress["done"] += 1
+                self.progress["sent" if outcome == OUTCOME_SENT else "failed"] += 1
+                if outcome == OUTCOME_ERROR:
+                    # Transient failure – no marker, retried on the next rollout.
+                    retry.append(uid)
+                    continue
+                markers.update_one(
+                    {"_id": uid},
+                    {"$set": {"outcome": outcome, "sent_at": datetime.utcnow()}},
+                    upsert=True,
+                )
+
+        await asyncio.gather(*(worker() for _ in range(max(1, self.concurrency))))
+        ledger.flush()
+        log.info(
+            "intro rollout finished: %d sent, %d failed of %d",
+            self.progress["sent"],
+            self.progress["failed"],
+            self.progress["total"],
+        )
+        return not retry
 
     async def _maybe_send_intro(self) -> None:
         await self.bot.wait_until_ready()
         flags = get_collection("flags")
         if flags.find_one({"_id": "ai_intro_sent", "value": True}):
             return
-        await self._send_intro()
+        complete = await self._send_intro()
+        # "partial" keeps the rollout pending so errored users are retried on the next start.
         flags.update_one(
             {"_id": "ai_intro_sent"},
-            {"$set": {"value": True, "sent_at": datetime.utcnow()}},
+            {"$set": {"value": True if complete else "partial", "sent_at": datetime.utcnow()}},
             upsert=True,
         )
 
     @app_commands.command(name="ai_sorry", description="Send intro message again")
     async def ai_sorry(self, interaction: discord.Interaction) -> None:
-        await interaction.response.defer(ephemeral=True)
-        await self._send_intro()
+        if self._task is not None and not self._task.done():
+            await interaction.response.send_message("Intro rollout already running", ephemeral=True)
+            return
+        get_collection(ROLLOUT_COLLECTION).delete_many({})
         get_collection("flags").update_one(
-            {"_id": "ai_intro_sent"},
-            {"$set": {"value": True, "sent_at": datetime.utcnow()}},
-            upsert=True,
+            {"_id": "ai_intro_sent"}, {"$set": {"value": False}}, upsert=True
+        )
+        self._task = asyncio.create_task(self._maybe_send_intro())
+        await interaction.response.send_message("Intro rollout started", ephemeral=True)
+
+    @app_commands.command(name="ai_intro_status", description="Show intro rollout progress")
+    async def ai_intro_status(self, interaction: discord.Interaction) -> None:
+        running = self._task is not None and not self._task.done()
+        p = self.progress
+        await interaction.response.send_message(
+            f"Intro rollout {'running' if running else 'idle'}: "
+            f"{p['done']}/{p['total']} handled – {p['sent']} ✅ / {p['failed']} ❌",
+            ephemeral=True,
         )
-        await interaction.followup.send("Intro message sent", ephemeral=True)
 
 
 async def setup(bot: commands.Bot) -> None:
@@ -11,10 +11,18 @@ import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 
+from bot.dm_ledger import (
+    OUTCOME_FORBIDDEN,
+    OUTCOME_NOT_FOUND,
+    OUTCOME_SENT,
+    OUTCOME_SUPPRESSED,
+    deliver,
+    ledger,
+)
 from config import Config
 from fur_lang.i18n import t
 from mongo_service import get_collection
-from utils.event_helpers import format_events, get_events_for
+from utils.event_helpers import format_events, get_events_between, get_events_for
 
 log = logging.getLogger(__name__)
 
@@ -82,11 +90,7 @@ class NewsletterAutopilot(commands.Cog):
         """Return the daily overview text."""
         now = datetime.utcnow()
         tomorrow = now + timedelta(days=1)
-        events = (
-            get_collection("events")
-            .find({"event_time": {"$gte": now, "$lte": tomorrow}}, {"title": 1, "event_time": 1})
-            .sort("event_time", 1)
-        )
+        events = get_events_between(now, tomorrow, {"title": 1, "event_time": 1})
         lines = ["📰 Daily Events"]
         for ev in events:
             dt = ev["event_time"]
@@ -100,51 +104,38 @@ class NewsletterAutopilot(commands.Cog):
             lines.append(t("newsletter_no_events_24h"))
         return "\n".join(lines)
 
-    async def send_newsletters(self) -> None:
+    async def _dispatch(self, content: str, dm_type: str) -> None:
         guild = self.bot.get_guild(Config.DISCORD_GUILD_ID)
         if not guild:
             log.warning("Guild not found for newsletter dispatch")
             return
-        content = await self.build_content()
-        for member in guild.members:
-            if member.bot:
-                continue
+        members = [m for m in guild.members if not m.bot]
+        suppressed = ledger.suppressed_ids(m.id for m in members)
+        for member in members:
             if get_collection("newsletter_optout").find_one({"discord_id": str(member.id)}):
                 self.blocked += 1
                 continue
-            try:
-                await member.send(content)
+            if member.id in suppressed:
+                self.blocked += 1
+                ledger.record(member.id, dm_type, OUTCOME_SUPPRESSED)
+                continue
+            outcome = await deliver(member, dm_type, content)
+            if outcome == OUTCOME_SENT:
                 self.sent += 1
-            except discord.Forbidden:
+            elif outcome in (OUTCOME_FORBIDDEN, OUTCOME_NOT_FOUND):
                 self.blocked += 1
-                log.warning("DM blocked for %s", member.id)
-            except Exception as exc:  # noqa: BLE001
+            else:
                 self.errors += 1
-                log.error("Error sending newsletter to %s: %s", member.id, exc)
             await asyncio.sleep(self.delay)
+        ledger.flush()
+
+    async def send_newsletters(self) -> None:
+        content = await self.build_content()
+        await self._dispatch(content, "newsletter")
 
     async def send_daily_overview(self) -> None:
-        guild = self.bot.get_guild(Config.DISCORD_GUILD_ID)
-        if not guild:
-            log.warning("Guild not found for newsletter dispatch")
-            return
         content = await self.build_daily_content()
-        for member in guild.members:
-            if member.bot:
-                continue
-            if get_collection("newsletter_optout").find_one({"discord_id": str(member.id)}):
-                self.blocked += 1
-                continue
-            try:
-                await member.send(content)
-                self.sent += 1
-            except discord.Forbidden:
-                self.blocked += 1
-                log.warning("DM blocked for %s", member.id)
-            except Exception as exc:  # noqa: BLE001
-                self.errors += 1
-                log.error("Error sending newsletter to %s: %s", member.id, exc)
-            await asyncio.sleep(self.delay)
+        await self._dispatch(content, "daily_overview")
 
     @app_commands.command(name="newsletter_now", description="Send newsletter immediately")
     async def newsletter_now(self, interaction: discord.Interaction) -> None:
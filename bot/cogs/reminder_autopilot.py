@@ -3,7 +3,10 @@
 import asyncio
 import logging
 import os
+import time
+from collections import defaultdict
 from datetime import datetime, timedelta
+from typing import Iterable
 
 import discord
 from discord import app_commands
@@ -11,17 +14,13 @@ from discord.ext import commands, tasks
 
 from config import Config, is_production
 from fur_lang.i18n import t
-from services.google.calendar_sync import (
-    CalendarSettings,
-    SyncTokenExpired,
-    get_service,
-    list_upcoming_events,
-)
 from mongo_service import get_collection
 from utils import poster_generator
-from utils.event_helpers import parse_event_time
+from utils.event_helpers import get_events_between, parse_event_time
+from utils.recurrence import OCCURRENCES_COLLECTION
+from bot.dm_ledger import OUTCOME_NOT_FOUND, OUTCOME_SENT, OUTCOME_SUPPRESSED, deliver, ledger
 from bot.dm_utils import get_dm_image
-from main_app import app
+from bot.outbound_queue import LANE_REMINDER
 
 
 def is_opted_out(user_id: int) -> bool:
@@ -35,8 +34,31 @@ def is_opted_out(user_id: int) -> bool:
     return bool(settings)
 
 
+def opted_out_ids(user_ids: Iterable[int]) -> set[int]:
+    """Return the subset of ``user_ids`` that opted out (two ``$in`` queries)."""
+    uids = [str(u) for u in user_ids]
+    if not uids:
+        return set()
+    found = {
+        d["discord_id"]
+        for d in get_collection("reminder_optout").find(
+            {"discord_id": {"$in": uids}}, {"discord_id": 1}
+        )
+    }
+    found.update(
+        d["discord_id"]
+        for d in get_collection("user_settings").find(
+            {"discord_id": {"$in": uids}, "reminder_optout": True}, {"discord_id": 1}
+        )
+    )
+    return {int(u) for u in found}
+
+
 log = logging.getLogger(__name__)
 REMINDER_INTERVAL_SECONDS = 60
+# Languages rarely change; the same participants are looked up every tick.
+LANGUAGE_CACHE_SECONDS = float(os.getenv("REMINDER_LANG_CACHE_SECONDS", "600"))
+_languages: dict[int, tuple[float, str]] = {}
 
 
 def should_send_daily(dt: datetime) -> bool:
@@ -61,7 +83,6 @@ class ReminderAutopilot(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.delay = float(os.getenv("REMINDER_DM_DELAY", "1"))
-        self.calendar_settings = CalendarSettings()
         self.reminder_loop.start()
         self.daily_poster_loop.start()
         self.weekly_poster_loop.start()
@@ -72,8 +93,31 @@ class ReminderAutopilot(commands.Cog):
         self.weekly_poster_loop.cancel()
 
     async def get_user_language(self, user_id: int) -> str:
-        user = get_collection("users").find_one({"discord_id": str(user_id)})
-        return user.get("lang", "de") if user else "de"
+        return (await self.get_user_languages([user_id]))[int(user_id)]
+
+    async def get_user_languages(self, user_ids: Iterable[int]) -> dict[int, str]:
+        """Return ``{user_id: lang}``; cache misses are loaded with one ``$in`` query."""
+        now = time.monotonic()
+        result: dict[int, str] = {}
+        missing: list[int] = []
+        for uid in {int(u) for u in user_ids}:
+            cached = _languages.get(uid)
+            if cached and cached[0] > now:
+                result[uid] = cached[1]
+            else:
+                missing.append(uid)
+        if missing:
+            found = {
+                int(d["discord_id"]): d.get("lang") or "de"
+                for d in get_collection("users").find(
+                    {"discord_id": {"$in": [str(u) for u in missing]}},
+                    {"discord_id": 1, "lang": 1},
+                )
+            }
+            for uid in missing:
+                result[uid] = found.get(uid, "de")
+                _languages[uid] = (now + LANGUAGE_CACHE_SECONDS, result[uid])
+        return result
 
     @tasks.loop(seconds=REMINDER_INTERVAL_SECONDS)
     async def reminder_loop(self):
@@ -94,40 +138,60 @@ class ReminderAutopilot(commands.Cog):
         window_end = now + timedelta(minutes=11)
 
         try:
-            with app.app_context():
-                try:
-                    service = get_service(self.calendar_settings)
-                    events = list_upcoming_events(
-                        service,
-                        time_min=window_start,
-                        time_max=window_end,
-                        max_results=50,
-                        settings=self.calendar_settings,
-                    )
-                except SyncTokenExpired:
-                    log.warning("Google sync token expired; skipping reminder cycle")
-                    return
-            mapped_events = []
-            for ev in events:
-                doc = get_collection("events").find_one({"google_id": ev.get("id")})
-                if doc:
-                    doc.update(ev)
-                    mapped_events.append(doc)
-            events = mapped_events
+            # Google events are synced into ``events`` by the sync coordinator;
+            # later instances of recurring series live in ``event_occurrences``.
+            window = {"$gte": window_start, "$lt": window_end}
+            events = list(
+                get_collection("events").find(
+                    {"event_time": window}, {"_id": 1, "title": 1, "event_time": 1}
+                )
+            )
+            events.extend(
+                get_collection(OCCURRENCES_COLLECTION).find(
+                    {"occurrence_time": window},
+                    {"_id": 1, "title": 1, "event_time": 1, "series_id": 1},
+                )
+            )
+            if not events:
+                ledger.flush()
+                return
+            # One $in query per collection instead of one round-trip per participant.
+            # Sign-ups belong to the series, sent markers to the single occurrence.
+            event_ids = [event["_id"] for event in events]
+            series_ids = list({event.get("series_id", event["_id"]) for event in events})
+            participants: dict = defaultdict(dict)
+            for p in get_collection("event_participants").find(
+                {"event_id": {"$in": series_ids}}, {"event_id": 1, "user_id": 1}
+            ):
+                participants[p["event_id"]][int(p["user_id"])] = None
+            already_sent = {
+                (d["event_id"], int(d["user_id"]))
+                for d in get_collection("reminders_sent").find(
+                    {"event_id": {"$in": event_ids}}, {"event_id": 1, "user_id": 1}
+                )
+            }
+            pending = {
+                event["_id"]: [
+                    uid
+                    for uid in participants.get(event.get("series_id", event["_id"]), [])
+                    if (event["_id"], uid) not in already_sent
+                ]
+                for event in events
+            }
+            all_ids = {uid for ids in pending.values() for uid in ids}
+            opted_out = opted_out_ids(all_ids)
+            suppressed = ledger.suppressed_ids(all_ids - opted_out)
+            languages = await self.get_user_languages(all_ids - opted_out - suppressed)
             for event in events:
-                participants = get_collection("event_participants").find({"event_id": event["_id"]})
-                for p in participants:
-                    user_id = int(p["user_id"])
-
-                    if get_collection("reminders_sent").find_one(
-                        {"event_id": event["_id"], "user_id": user_id}
-                    ):
+                for user_id in pending[event["_id"]]:
+                    if user_id in opted_out:
                         continue
 
-                    if is_opted_out(user_id):
+                    if user_id in suppressed:
+                        ledger.record(user_id, "reminder", OUTCOME_SUPPRESSED)
                         continue
 
-                    lang = await self.get_user_language(user_id)
+                    lang = languages.get(user_id, "de")
                     try:
                         user = await self.bot.fetch_user(user_id)
                         if not user:
@@ -140,26 +204,32 @@ class ReminderAutopilot(commands.Cog):
                             if getattr(Config, "REMINDER_ROLE_ID", 0)
                             else ""
                         )
-                        await user.send(f"{mention}{message}" if mention else message)
+                        outcome = await deliver(
+                            user,
+                            "reminder",
+                            f"{mention}{message}" if mention else message,
+                            user_id=user_id,
+                            lane=LANE_REMINDER,
+                        )
+                        if outcome != OUTCOME_SENT:
+                            continue
                         get_collection("reminders_sent").insert_one(
                             {"event_id": event["_id"], "user_id": user_id, "sent_at": now}
                         )
                         log.info(f"📤 10-Minuten-DM an {user_id} ({lang}) gesendet.")
-                    except discord.Forbidden:
-                        log.warning(f"🚫 DMs deaktiviert bei {user_id}")
+                    except discord.NotFound:
+                        ledger.record(user_id, "reminder", OUTCOME_NOT_FOUND)
+                        log.warning(f"❌ User-ID {user_id} nicht gefunden.")
                     except Exception as e:
                         log.warning(f"❌ Fehler bei DM an {user_id}: {e}")
+            ledger.flush()
         except Exception as e:
             log.error(f"❌ Reminder-Autopilot-Fehler: {e}", exc_info=True)
 
     async def _build_daily_lines(self) -> list[str]:
         now = datetime.utcnow()
         tomorrow = now + timedelta(days=1)
-        events = (
-            get_collection("events")
-            .find({"event_time": {"$gte": now, "$lte": tomorrow}}, {"title": 1, "event_time": 1})
-            .sort("event_time", 1)
-        )
+        events = get_events_between(now, tomorrow, {"title": 1, "event_time": 1})
         lines: list[str] = []
         for ev in events:
             dt = parse_event_time(ev.get("event_time"))
@@ -173,11 +243,7 @@ class ReminderAutopilot(commands.Cog):
         now = datetime.utcnow()
         week = now + timedelta(days=7)
         lines: list[str] = []
-        events = (
-            get_collection("events")
-            .find({"event_time": {"$gte": now, "$lte": week}}, {"title": 1, "event_time": 1})
-            .sort("event_time", 1)
-        )
+        events = get_events_between(now, week, {"title": 1, "event_time": 1})
         for ev in events:
             dt = parse_event_time(ev.get("event_time"))
             if dt:
@@ -191,26 +257,25 @@ class ReminderAutopilot(commands.Cog):
         if not guild:
             log.warning("Guild not found for poster dispatch")
             return
-        for member in guild.members:
-            if member.bot:
-                continue
+        embed = discord.Embed()
+        img = get_dm_image(dm_type)
+        if img:
+            embed.set_thumbnail(url=img)
+        poster_url = poster_path
+        if not poster_url.startswith("http"):
+            poster_url = Config.BASE_URL.rstrip("/") + "/" + poster_path.lstrip("/")
+        embed.set_image(url=poster_url)
+        members = [m for m in guild.members if not m.bot]
+        suppressed = ledger.suppressed_ids(m.id for m in members)
+        for member in members:
             if is_opted_out(member.id):
                 continue
-            try:
-                embed = discord.Embed()
-                img = get_dm_image(dm_type)
-                if img:
-                    embed.set_thumbnail(url=img)
-                poster_url = poster_path
-                if not poster_url.startswith("http"):
-                    poster_url = Config.BASE_URL.rstrip("/") + "/" + poster_path.lstrip("/")
-                embed.set_image(url=poster_url)
-                await member.send(embed=embed)
-                await asyncio.sleep(self.delay)
-            except discord.Forbidden:
-                log.warning("DM blocked for %s", member.id)
-            except Exception as exc:  # noqa: BLE001
-                log.warning("Poster DM error for %s: %s", member.id, exc)
+            if member.id in suppressed:
+                ledger.record(member.id, f"poster_{dm_type}", OUTCOME_SUPPRESSED)
+                continue
+            await deliver(member, f"poster_{dm_type}", embed=embed)
+            await asyncio.sleep(self.delay)
+        ledger.flush()
 
     async def send_daily_poster(self) -> None:
         lines = await self._build_daily_lines()
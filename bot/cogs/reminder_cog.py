@@ -7,6 +7,8 @@ import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 
+from bot.dm_ledger import OUTCOME_SENT, deliver
+from bot.outbound_queue import LANE_REMINDER
 from config import Config
 from fur_lang.i18n import t
 from mongo_service import get_collection
@@ -82,13 +84,19 @@ class ReminderCog(commands.Cog):
                             if getattr(Config, "REMINDER_ROLE_ID", 0)
                             else ""
                         )
-                        await user.send(f"{mention}{msg}" if mention else msg)
+                        outcome = await deliver(
+                            user,
+                            "reminder",
+                            f"{mention}{msg}" if mention else msg,
+                            user_id=user_id,
+                            lane=LANE_REMINDER,
+                        )
+                        if outcome != OUTCOME_SENT:
+                            continue
                         get_collection("reminders_sent").insert_one(
                             {"event_id": event["_id"], "user_id": user_id, "sent_at": now}
                         )
                         log.info(f"📤 60-Minuten-Reminder an {user_id} gesendet.")
-                    except discord.Forbidden:
-                        log.warning(f"🚫 DMs deaktiviert bei User {user_id}")
                     except Exception as e:
                         log.error(f"❌ Fehler beim Senden an {user_id}: {e}")
         except Exception as e:
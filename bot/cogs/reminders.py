@@ -8,6 +8,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 
+from bot.outbound_queue import LANE_CHANNEL, outbound
 from config import Config, is_production
 from fur_lang.i18n import t
 
@@ -53,7 +54,7 @@ class Reminders(commands.Cog):
 
         try:
             message = t("reminder_hourly", time=now, lang="de")  # 🔁 ggf. Lokalisierung dynamisch
-            await channel.send(message)
+            await outbound.run(LANE_CHANNEL, channel.send, message)
             log.info(f"📤 Reminder gesendet an Channel {self.channel_id} (UTC {now})")
         except Exception as e:
             log.error(f"❌ Fehler beim Reminder-Versand: {e}", exc_info=True)
@@ -90,7 +91,7 @@ class Reminders(commands.Cog):
 
         try:
             message = t("reminder_hourly", time=now, lang="de")
-            await channel.send(message)
+            await outbound.run(LANE_CHANNEL, channel.send, message)
             await interaction.response.send_message(t("reminder_sent"), ephemeral=True)
             log.info(f"📤 Manueller Reminder von {interaction.user.display_name}")
         except Exception as e:
@@ -0,0 +1,252 @@
+"""dm_ledger.py – Delivery ledger and suppression list for bot DMs.
+
+Every DM fan-out records one ledger row per recipient (outcome + latency).
+Rows are buffered and written with ``insert_many`` instead of one write per
+send. Recipients whose DMs are closed (``discord.Forbidden``) or who no longer
+exist (``discord.NotFound``) land on a suppression list and are skipped until
+their ``recheck_at`` passes; each further failure doubles the recheck interval.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+import discord
+from prometheus_client import Counter, Gauge, Histogram
+from pymongo import DeleteOne, UpdateOne
+
+from bot.outbound_queue import LANE_BULK, outbound
+from mongo_service import get_collection
+
+log = logging.getLogger(__name__)
+
+LEDGER_COLLECTION = "dm_delivery_log"
+SUPPRESSION_COLLECTION = "dm_suppression"
+
+OUTCOME_SENT = "sent"
+OUTCOME_FORBIDDEN = "forbidden"
+OUTCOME_NOT_FOUND = "not_found"
+OUTCOME_ERROR = "error"
+OUTCOME_SUPPRESSED = "suppressed"
+
+_SUPPRESSING_OUTCOMES = {OUTCOME_FORBIDDEN, OUTCOME_NOT_FOUND}
+
+# Metrics
+DM_DELIVERY_TOTAL = Counter(
+    "dm_delivery_total", "DM delivery attempts by type and outcome", ["dm_type", "outcome"]
+)
+DM_DELIVERY_SECONDS = Histogram("dm_delivery_seconds", "Time spent sending a DM", ["dm_type"])
+DM_SUPPRESSED_RECIPIENTS = Gauge(
+    "dm_suppressed_recipients", "Recipients currently on the DM suppression list"
+)
+
+
+class DeliveryLedger:
+    """Buffered per-recipient delivery log with a suppression list."""
+
+    def __init__(
+        self,
+        batch_size: int | None = None,
+        recheck_days: float | None = None,
+        max_recheck_days: float | None = None,
+    ) -> None:
+        self.batch_size = batch_size or int(os.getenv("DM_LEDGER_BATCH_SIZE", "200"))
+        self.recheck = timedelta(
+            days=recheck_days or float(os.getenv("DM_SUPPRESSION_RECHECK_DAYS", "7"))
+        )
+        self.max_recheck = timedelta(
+            days=max_recheck_days or float(os.getenv("DM_SUPPRESSION_MAX_DAYS", "56"))
+        )
+        self._pending: list[dict[str, Any]] = []
+        self._suppression_ops: dict[int, UpdateOne | DeleteOne] = {}
+        # Local view of the suppression list: user_id -> (strikes, recheck_at)
+        self._known: dict[int, tuple[int, datetime]] = {}
+
+    # ------------------------------------------------------------------
+    # Suppression lookups
+    # ------------------------------------------------------------------
+
+    def suppressed_ids(self, user_ids: Iterable[int], now: datetime | None = None) -> set[int]:
+        """Return the subset of ``user_ids`` that must not be contacted right now.
+
+        Uses one ``$in`` query for the whole recipient list. Users whose
+        ``recheck_at`` has passed are *not* returned – they get one new attempt.
+        """
+        ids = {int(uid) for uid in user_ids}
+        if not ids:
+            return set()
+        now = now or datetime.utcnow()
+        cursor = get_collection(SUPPRESSION_COLLECTION).find(
+            {"_id": {"$in": list(ids)}}, {"strikes": 1, "recheck_at": 1}
+        )
+        for doc in cursor:
+            self._known[doc["_id"]] = (int(doc.get("strikes", 1)), doc["recheck_at"])
+        return {uid for uid in ids if uid in self._known and self._known[uid][1] > now}
+
+    def is_suppressed(self, user_id: int, now: datetime | None = None) -> bool:
+        """Return True if ``user_id`` is currently suppressed."""
+        return int(user_id) in self.suppressed_ids([user_id], now=now)
+
+    def release(self, user_id: int) -> None:
+        """Remove ``user_id`` from the suppression list (e.g. after re-enabling DMs)."""
+        uid = int(user_id)
+        self._known.pop(uid, None)
+        self._suppression_ops.pop(uid, None)
+        get_collection(SUPPRESSION_COLLECTION).delete_one({"_id": uid})
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        user_id: int | None,
+        dm_type: str,
+        outcome: str,
+        latency: float = 0.0,
+        error: str | None = None,
+    ) -> None:
+        """Buffer one delivery result and update the suppression list."""
+        DM_DELIVERY_TOTAL.labels(dm_type, outcome).inc()
+        if outcome == OUTCOME_SUPPRESSED:
+            return
+        DM_DELIVERY_SECONDS.labels(dm_type).observe(latency)
+
+        now = datetime.utcnow()
+        row: dict[str, Any] = {
+            "user_id": user_id,
+            "dm_type": dm_type,
+            "outcome": outcome,
+            "latency_ms": round(latency * 1000, 1),
+            "created_at": now,
+        }
+        if error:
+            row["error"] = error
+        self._pending.append(row)
+
+        if user_id is not None:
+            uid = int(user_id)
+            if outcome in _SUPPRESSING_OUTCOMES:
+                self._suppress(uid, outcome, now)
+            elif outcome == OUTCOME_SENT and uid in self._known:
+                # Recheck succeeded – the user opened their DMs again.
+                del self._known[uid]
+                self._suppression_ops[uid] = DeleteOne({"_id": uid})
+
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def _suppress(self, uid: int, reason: str, now: datetime) -> None:
+        strikes = self._known.get(uid, (0, now))[0] + 1
+        delay = min(self.recheck * (2 ** (strikes - 1)), self.max_recheck)
+        recheck_at = now + delay
+        self._known[uid] = (strikes, recheck_at)
+        self._suppression_ops[uid] = UpdateOne(
+            {"_id": uid},
+            {
+                "$set": {
+                    "reason": reason,
+                    "strikes": strikes,
+                    "last_failure": now,
+                    "recheck_at": recheck_at,
+                },
+                "$setOnInsert": {"suppressed_at": now},
+            },
+            upsert=True,
+        )
+
+    def flush(self) -> None:
+        """Write buffered ledger rows and suppression changes in bulk."""
+        pending, self._pending = self._pending, []
+        ops = list(self._suppression_ops.values())
+        self._suppression_ops = {}
+        try:
+            if pending:
+                get_collection(LEDGER_COLLECTION).insert_many(pending, ordered=False)
+            if ops:
+                suppression = get_collection(SUPPRESSION_COLLECTION)
+                suppression.bulk_write(ops, ordered=False)
+                DM_SUPPRESSED_RECIPIENTS.set(
+                    suppression.count_documents({"recheck_at": {"$gt": datetime.utcnow()}})
+                )
+        except Exception as exc:  # noqa: BLE001
+            log.error("DM ledger flush failed (%d rows): %s", len(pending), exc)
+
+    def reset(self) -> None:
+        """Drop buffered rows and the local suppression view (tests, benchmarks)."""
+        self._pending = []
+        self._suppression_ops = {}
+        self._known = {}
+
+    def stats(self, since: datetime) -> dict[str, int]:
+        """Return outcome counts recorded since ``since``."""
+        cursor = get_collection(LEDGER_COLLECTION).aggregate(
+            [
+                {"$match": {"created_at": {"$gte": since}}},
+                {"$group": {"_id": "$outcome", "count": {"$sum": 1}}},
+            ]
+        )
+        return {doc["_id"]: doc["count"] for doc in cursor}
+
+
+ledger = DeliveryLedger()
+
+
+async def _timed_send(target: Any, *args: Any, **kwargs: Any) -> float:
+    start = time.perf_counter()
+    await target.send(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+async def deliver(
+    target: Any,
+    dm_type: str,
+    *args: Any,
+    user_id: int | None = None,
+    lane: str = LANE_BULK,
+    **kwargs: Any,
+) -> str:
+    """Send a DM via ``target.send`` and record the outcome in the ledger.
+
+    The send is scheduled on ``lane`` of the shared outbound scheduler.
+    Returns one of the ``OUTCOME_*`` constants. Exceptions are logged, not raised.
+    """
+    if user_id is None:
+        user_id = getattr(target, "id", None)
+    start = time.perf_counter()
+    latency = None
+    error = None
+    try:
+        latency = await outbound.run(lane, _timed_send, target, *args, **kwargs)
+    except discord.Forbidden:
+        outcome = OUTCOME_FORBIDDEN
+        log.warning("DM blocked for %s", user_id)
+    except discord.NotFound:
+        outcome = OUTCOME_NOT_FOUND
+        log.warning("DM recipient %s not found", user_id)
+    except Exception as exc:  # noqa: BLE001
+        outcome = OUTCOME_ERROR
+        error = str(exc)
+        log.warning("DM error for %s: %s", user_id, exc)
+    else:
+        outcome = OUTCOME_SENT
+    if latency is None:
+        latency = time.perf_counter() - start
+    ledger.record(user_id, dm_type, outcome, latency, error=error)
+    return outcome
+
+
+__all__ = [
+    "DeliveryLedger",
+    "OUTCOME_ERROR",
+    "OUTCOME_FORBIDDEN",
+    "OUTCOME_NOT_FOUND",
+    "OUTCOME_SENT",
+    "OUTCOME_SUPPRESSED",
+    "deliver",
+    "ledger",
+]
@@ -0,0 +1,170 @@
+"""outbound_queue.py – Prioritised scheduler for outbound Discord messages.
+
+All bot sends share one scheduler with four lanes (highest priority first):
+
+``interaction``  replies/DMs triggered by a slash command
+``reminder``     time-critical event reminders
+``channel``      channel posts
+``bulk``         newsletter, poster, broadcast and calendar fan-outs
+
+Slots are granted by weighted fair queuing (stride scheduling): every lane
+advances its virtual time by ``1 / weight`` per granted send and the lane with
+the lowest virtual time goes next. Per-lane concurrency caps keep bulk traffic
+from ever occupying all global slots, so reminders are dispatched on time even
+while thousands of bulk DMs are queued.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from prometheus_client import Gauge, Histogram
+
+log = logging.getLogger(__name__)
+
+LANE_INTERACTION = "interaction"
+LANE_REMINDER = "reminder"
+LANE_CHANNEL = "channel"
+LANE_BULK = "bulk"
+
+# Metrics
+OUTBOUND_QUEUE_DEPTH = Gauge("outbound_queue_depth", "Sends waiting for a slot", ["lane"])
+OUTBOUND_IN_FLIGHT = Gauge("outbound_in_flight", "Sends currently running", ["lane"])
+OUTBOUND_WAIT_SECONDS = Histogram(
+    "outbound_wait_seconds", "Time a send waited in the outbound queue", ["lane"]
+)
+
+
+@dataclass
+class LaneConfig:
+    """Scheduling parameters for one lane."""
+
+    weight: float
+    max_concurrency: int
+
+
+@dataclass
+class _Lane:
+    config: LaneConfig
+    rank: int
+    waiting: deque = field(default_factory=deque)
+    in_flight: int = 0
+    vtime: float = 0.0
+
+
+def default_lanes() -> dict[str, LaneConfig]:
+    """Return the default lane configuration in priority order."""
+    return {
+        LANE_INTERACTION: LaneConfig(weight=8, max_concurrency=4),
+        LANE_REMINDER: LaneConfig(weight=4, max_concurrency=4),
+        LANE_CHANNEL: LaneConfig(weight=2, max_concurrency=2),
+        LANE_BULK: LaneConfig(
+            weight=1, max_concurrency=int(os.getenv("OUTBOUND_BULK_CONCURRENCY", "2"))
+        ),
+    }
+
+
+class OutboundScheduler:
+    """Grant send slots to lanes by weighted fair queuing."""
+
+    def __init__(
+        self,
+        lanes: dict[str, LaneConfig] | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        self.max_concurrency = max_concurrency or int(os.getenv("OUTBOUND_MAX_CONCURRENCY", "6"))
+        self._lanes = {
+            name: _Lane(cfg, rank)
+            for rank, (name, cfg) in enumerate((lanes or default_lanes()).items())
+        }
+        self._in_flight = 0
+
+    async def run(
+        self, lane: str, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Wait for a slot in ``lane`` and then await ``func(*args, **kwargs)``."""
+        state = self._lanes[lane]
+        ticket = asyncio.get_running_loop().create_future()
+        enqueued = time.perf_counter()
+        if not state.waiting and not state.in_flight:
+            # An idle lane must not bank credit while it had nothing to send.
+            state.vtime = max(state.vtime, self._min_vtime())
+        state.waiting.append(ticket)
+        OUTBOUND_QUEUE_DEPTH.labels(lane).inc()
+        self._dispatch()
+        try:
+            await ticket
+        except asyncio.CancelledError:
+            if ticket.done() and not ticket.cancelled():
+                self._release(lane)
+            elif ticket in state.waiting:
+                state.waiting.remove(ticket)
+                OUTBOUND_QUEUE_DEPTH.labels(lane).dec()
+            raise
+        OUTBOUND_WAIT_SECONDS.labels(lane).observe(time.perf_counter() - enqueued)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            self._release(lane)
+
+    def reset(self) -> None:
+        """Forget virtual times and slot counts; only call while nothing is queued."""
+        self._lanes = {name: _Lane(s.config, s.rank) for name, s in self._lanes.items()}
+        self._in_flight = 0
+
+    def depth(self, lane: str) -> int:
+        """Return the number of sends waiting in ``lane``."""
+        return len(self._lanes[lane].waiting)
+
+    def _min_vtime(self) -> float:
+        active = [s.vtime for s in self._lanes.values() if s.waiting or s.in_flight]
+        return min(active, default=0.0)
+
+    def _dispatch(self) -> None:
+        while self._in_flight < self.max_concurrency:
+            # Ties go to the higher-priority lane (lower rank).
+            eligible = [
+                (state.vtime, state.rank, name)
+                for name, state in self._lanes.items()
+                if state.waiting and state.in_flight < state.config.max_concurrency
+            ]
+            if not eligible:
+                return
+            *_, name = min(eligible)
+            state = self._lanes[name]
+            ticket = state.waiting.popleft()
+            OUTBOUND_QUEUE_DEPTH.labels(name).dec()
+            if ticket.cancelled():
+                continue
+            state.vtime += 1 / state.config.weight
+            state.in_flight += 1
+            self._in_flight += 1
+            OUTBOUND_IN_FLIGHT.labels(name).inc()
+            ticket.set_result(None)
+
+    def _release(self, lane: str) -> None:
+        self._lanes[lane].in_flight -= 1
+        self._in_flight -= 1
+        OUTBOUND_IN_FLIGHT.labels(lane).dec()
+        self._dispatch()
+
+
+outbound = OutboundScheduler()
+
+
+__all__ = [
+    "LANE_BULK",
+    "LANE_CHANNEL",
+    "LANE_INTERACTION",
+    "LANE_REMINDER",
+    "LaneConfig",
+    "OutboundScheduler",
+    "default_lanes",
+    "outbound",
+]
@@ -0,0 +1,157 @@
+"""sim_transport.py – Simulated Discord transport for offline DM benchmarks.
+
+Provides drop-in stand-ins for the bot, guild and user objects the DM senders
+use (``get_guild``, ``get_user``/``fetch_user``, ``member.send``). Each send
+goes through :class:`SimulatedTransport`, which models
+
+* per-request latency (``latency`` ± ``jitter`` seconds),
+* a global bucket of ``bucket_limit`` requests per ``bucket_window`` seconds,
+* randomly injected 429 responses with ``retry_after``,
+* recipients with closed DMs (``forbidden_rate``) raising ``discord.Forbidden``.
+
+429s are retried after ``retry_after`` like discord.py's HTTP client does, so
+the recorded latency of a send includes rate-limit waits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+import discord
+
+
+@dataclass
+class TransportStats:
+    """Counters and per-send latencies collected by the transport."""
+
+    requests: int = 0
+    delivered: int = 0
+    forbidden: int = 0
+    rate_limited: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    def percentile(self, pct: float) -> float:
+        """Return the ``pct`` percentile of successful send latencies (seconds)."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+        return ordered[index]
+
+
+class SimulatedTransport:
+    """Fake Discord HTTP layer with latency, rate limits and closed DMs."""
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        jitter: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 1.0,
+        bucket_limit: int = 50,
+        bucket_window: float = 1.0,
+        forbidden_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.bucket_limit = bucket_limit
+        self.bucket_window = bucket_window
+        self.forbidden_rate = forbidden_rate
+        self.rng = random.Random(seed)
+        self.stats = TransportStats()
+        self._window_start = 0.0
+        self._window_count = 0
+
+    def _take_token(self) -> float:
+        """Return 0 if a request may proceed, else the seconds until the bucket resets."""
+        now = time.monotonic()
+        if now - self._window_start >= self.bucket_window:
+            self._window_start = now
+            self._window_count = 0
+        if self._window_count >= self.bucket_limit:
+            return self.bucket_window - (now - self._window_start)
+        self._window_count += 1
+        return 0.0
+
+    async def _roundtrip(self) -> None:
+        while True:
+            self.stats.requests += 1
+            wait = self._take_token()
+            if not wait and self.rng.random() < self.rate_limit_rate:
+                wait = self.retry_after
+            if wait:
+                self.stats.rate_limited += 1
+                await asyncio.sleep(wait)
+                continue
+            await asyncio.sleep(max(0.0, self.latency + self.rng.uniform(-1, 1) * self.jitter))
+            return
+
+    async def lookup(self) -> None:
+        """Perform one simulated ``GET /users/{id}``."""
+        await self._roundtrip()
+
+    async def request(self, user: "SimUser") -> None:
+        """Perform one simulated ``POST /channels/{dm}/messages``."""
+        start = time.perf_counter()
+        await self._roundtrip()
+        if user.dm_closed:
+            self.stats.forbidden += 1
+            # discord.py only reads ``status`` and ``reason`` from the response.
+            response: Any = SimpleNamespace(status=403, reason="Forbidden")
+            raise discord.Forbidden(response, "Cannot send messages to this user")
+        self.stats.delivered += 1
+        self.stats.latencies.append(time.perf_counter() - start)
+
+
+class SimUser:
+    """User/member stand-in whose ``send`` goes through the transport."""
+
+    bot = False
+
+    def __init__(self, user_id: int, transport: SimulatedTransport, dm_closed: bool = False):
+        self.id = user_id
+        self.transport = transport
+        self.dm_closed = dm_closed
+        self.roles: list[Any] = []
+
+    async def send(self, *args: Any, **kwargs: Any) -> None:
+        await self.transport.request(self)
+
+
+class SimBot:
+    """Minimal bot exposing the lookups used by the DM senders."""
+
+    def __init__(self, transport: SimulatedTransport, recipients: int, guild_id: int = 1):
+        self.transport = transport
+        self.users = {
+            uid: SimUser(uid, transport, transport.rng.random() < transport.forbidden_rate)
+            for uid in range(1, recipients + 1)
+        }
+        self.guild = SimpleNamespace(id=guild_id, members=list(self.users.values()))
+
+    def get_guild(self, guild_id: int) -> SimpleNamespace:
+        return self.guild
+
+    def get_user(self, user_id: int) -> SimUser | None:
+        return self.users.get(int(user_id))
+
+    async def fetch_user(self, user_id: int) -> SimUser:
+        await self.transport.lookup()
+        return self.users[int(user_id)]
+
+    async def wait_until_ready(self) -> None:
+        return None
+
+    def is_ready(self) -> bool:
+        return True
+
+
+__all__ = ["SimBot", "SimUser", "SimulatedTransport", "TransportStats"]
@@ -1,13 +1,55 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
+import os
+
 import discord
 from discord import app_commands
 
-from fur_lang.i18n import t
+from fur_lang.catalog import source_stamp, write_atomic
+from fur_lang.i18n import (
+    TRANSLATION_FOLDER,
+    off_translations_reloaded,
+    on_translations_reloaded,
+    t,
+)
+
+log = logging.getLogger(__name__)
+
+# Vorberechnete Befehls-Übersetzungen; kein *.json, damit es nicht als Sprache gilt
+COMMAND_TABLE_PATH = os.getenv(
+    "COMMAND_TRANSLATIONS_CACHE", os.path.join(TRANSLATION_FOLDER, "command_table.cache")
+)
 
 
 class MyTranslator(app_commands.Translator):
-    """Simple translator using fur_lang.i18n.t."""
+    """Translator backed by a prebuilt ``(key, Discord locale) -> text`` table.
+
+    The table is filled from :func:`fur_lang.i18n.t` once (see
+    :meth:`precompute`), persisted to ``COMMAND_TABLE_PATH`` and reused across
+    restarts while the translation files are unchanged – ``translate`` is a
+    plain dict lookup.
+    """
+
+    def __init__(self, table_path: str | None = None) -> None:
+        self.table_path = table_path or COMMAND_TABLE_PATH
+        self.table: dict[tuple[str, str], str] = {}
+        self._dirty = False
+
+    async def load(self) -> None:
+        self.table = await asyncio.to_thread(self._read)
+        on_translations_reloaded(self._forget)
+
+    def _forget(self, langs: set[str]) -> None:
+        # Locale-Werte von Discord ≠ Dateinamen – nach einem Hot Reload alles neu
+        self.table = {}
+
+    async def unload(self) -> None:
+        off_translations_reloaded(self._forget)
+        if self._dirty:
+            await asyncio.to_thread(self.save)
 
     async def translate(
         self,
@@ -16,4 +58,40 @@ class MyTranslator(app_commands.Translator):
         context: app_commands.TranslationContext,
     ) -> str:
         key: str = string.extras.get("key", string.message)
-        return t(key, default=string.message, lang=locale.value)
+        entry = (key, locale.value)
+        text = self.table.get(entry)
+        if text is None:
+            text = self.table[entry] = t(key, default=string.message, lang=locale.value)
+            self._dirty = True
+        return text
+
+    async def precompute(self, tree: app_commands.CommandTree) -> int:
+        """Translate every global command of ``tree`` for all locales and persist."""
+        for command in tree.get_commands():
+            await command.get_translated_payload(tree, self)
+        if self._dirty:
+            await asyncio.to_thread(self.save)
+        return len(self.table)
+
+    def _read(self) -> dict[tuple[str, str], str]:
+        try:
+            with open(self.table_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("stamp") != source_stamp(TRANSLATION_FOLDER):
+            log.info("Übersetzungen geändert – Befehlstabelle wird neu aufgebaut")
+            return {}
+        return {(key, locale): text for key, locale, text in data.get("entries", [])}
+
+    def save(self) -> None:
+        """Write the table atomically, tagged with the translation files' stamp."""
+        payload = {
+            "stamp": source_stamp(TRANSLATION_FOLDER),
+            "entries": [[key, locale, text] for (key, locale), text in self.table.items()],
+        }
+        try:
+            write_atomic(self.table_path, json.dumps(payload, ensure_ascii=False))
+            self._dirty = False
+        except OSError as exc:
+            log.warning("Befehlstabelle konnte nicht gespeichert werden: %s", exc)
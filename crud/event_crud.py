@@ -9,6 +9,8 @@ from bson import ObjectId
 
 from fur_mongo import db
 from schemas.event_schema import EventModel
+from utils.mongo_bulk import bulk_upsert_async, upsert_ops
+from utils.recurrence import get_materializer
 
 log = logging.getLogger(__name__)
 
@@ -79,7 +81,7 @@ async def delete_event_by_id(
     *,
     col=None,
 ) -> int:
-    """Delete an event by its ObjectId.
+    """Delete an event by its ObjectId together with its materialised occurrences.
 
     Args:
         event_id: The MongoDB ObjectId or its string representation.
@@ -98,6 +100,9 @@ async def delete_event_by_id(
     if not isinstance(event_id, ObjectId):
         event_id = ObjectId(event_id)
     res = await asyncio.to_thread(col.delete_one, {"_id": event_id})
+    if res.deleted_count:
+        # Instances of a deleted series would otherwise still be reminded.
+        await asyncio.to_thread(get_materializer(col.database).remove, event_id)
     return res.deleted_count
 
 
@@ -129,6 +134,7 @@ async def get_events_in_range(
     end: datetime,
     *,
     col=None,
+    occurrences_col=None,
 ) -> List[EventModel]:
     """Return events between ``start`` and ``end`` sorted by time.
 
@@ -137,6 +143,8 @@ async def get_events_in_range(
         end: End of the time range (exclusive).
         col: Optional MongoDB collection. Defaults to the module level
             ``collection``.
+        occurrences_col: Optional ``event_occurrences`` collection whose
+            materialised recurring instances are merged into the result.
 
     Returns:
         List[EventModel]: Events occurring in the given time span.
@@ -148,6 +156,15 @@ async def get_events_in_range(
     docs = await asyncio.to_thread(
         lambda: list(col.find({"event_time": {"$gte": start, "$lt": end}}).sort("event_time", 1))
     )
+    if occurrences_col is not None:
+        docs += await asyncio.to_thread(
+            lambda: list(
+                occurrences_col.find({"occurrence_time": {"$gte": start, "$lt": end}}).sort(
+                    "occurrence_time", 1
+                )
+            )
+        )
+        docs.sort(key=lambda d: d["event_time"])
     return [EventModel(**d) for d in docs]
 
 
@@ -177,3 +194,73 @@ async def upsert_event(
             {"$set": data},
             upsert=True,
         )
+
+
+async def get_content_hashes(
+    google_ids: List[str],
+    *,
+    calendar_id: Optional[str] = None,
+    col=None,
+) -> dict[str, dict]:
+    """Return stored ``content_hash``/``_id``/``event_time`` keyed by ``google_id``.
+
+    Args:
+        google_ids: Google event ids to look up with one ``$in`` query.
+        calendar_id: Only consider events of this calendar. Untagged events
+            from before multi-calendar sync match as well.
+        col: Optional MongoDB collection. Defaults to the module level
+            ``collection``.
+
+    Returns:
+        dict[str, dict]: Projected documents of the events that already exist.
+
+    Raises:
+        pymongo.errors.PyMongoError: If the query fails.
+    """
+    col = col if col is not None else collection
+    if not google_ids:
+        return {}
+    query: dict = {"google_id": {"$in": list(google_ids)}}
+    if calendar_id is not None:
+        query["calendar_id"] = {"$in": [calendar_id, None]}
+    projection = {"google_id": 1, "calendar_id": 1, "content_hash": 1, "event_time": 1}
+    cursor = col.find(query, projection)
+    if hasattr(cursor, "to_list"):
+        docs = await cursor.to_list(length=None)
+    else:  # pragma: no cover - sync collections
+        docs = await asyncio.to_thread(list, cursor)
+    known: dict[str, dict] = {}
+    for d in docs:
+        if d["google_id"] not in known or d.get("calendar_id") == calendar_id:
+            known[d["google_id"]] = d
+    return known
+
+
+async def upsert_events(
+    docs: List[dict],
+    *,
+    col=None,
+    chunk_size: Optional[int] = None,
+) -> int:
+    """Upsert many event documents by ``(calendar_id, google_id)`` with chunked ``bulk_write``.
+
+    Args:
+        docs: Event documents. Entries without ``google_id`` are skipped;
+            entries carrying an ``_id`` update exactly that document.
+        col: Optional MongoDB collection. Defaults to the module level
+            ``collection``.
+        chunk_size: Operations per ``bulk_write`` call. Defaults to
+            ``MONGO_BULK_CHUNK_SIZE``.
+
+    Returns:
+        int: Number of inserted or modified documents.
+
+    Raises:
+        pymongo.errors.BulkWriteError: If a chunk fails to write.
+    """
+    col = col if col is not None else collection
+    ops = upsert_ops(docs, ("google_id", "calendar_id"))
+    if not ops:
+        return 0
+    stats = await bulk_upsert_async(col, ops, chunk_size)
+    return stats.changed
@@ -0,0 +1,577 @@
+"""
+catalog.py – kompaktes Binärformat für die Übersetzungskataloge
+
+``translations/*.json`` bleibt die Quelle der Wahrheit. ``build_catalog``
+kompiliert alle Dateien in eine Datei, die jeder Prozess read-only per ``mmap``
+öffnet – Web-Worker und Bot teilen sich die Seiten über den OS-Cache statt
+jeweils eigene Dicts zu parsen.
+
+Layout (little-endian, alle Tabellen 8-Byte-aligned)::
+
+    header   magic "FURCAT01", n_langs u32, n_keys u32,
+             langs_off u64, keys_off u64, blob_off u64
+    langs    n_langs × (code_start u32, code_end u32, table_off u64,
+                        mtime_ns u64, size u64)
+    keys     n_keys × (start u32, end u32)      – internierte Key-Tabelle
+    tables   je Sprache n_keys × (start u32, end u32), MISSING = fehlt
+    blob     UTF-8-Strings, identische Werte nur einmal
+
+Nicht-String-Werte (Pluralformen) werden als JSON mit führendem ``\\0``
+abgelegt. Eine Sprache gilt nur als aktuell, solange ``mtime_ns`` und Größe
+ihrer JSON-Datei übereinstimmen; sonst lädt ``fur_lang.i18n`` die JSON-Datei.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import stat
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from typing import Any
+
+from prometheus_client import Counter, Gauge, Histogram
+
+try:  # inotify/FSEvents, falls installiert – sonst Polling
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+log = logging.getLogger(__name__)
+
+I18N_LOAD_SECONDS = Histogram(
+    "i18n_catalog_load_seconds", "Time to load one translation catalog", ["lang", "source"]
+)
+I18N_RESIDENT_BYTES = Gauge(
+    "i18n_catalog_resident_bytes", "Estimated private memory of resident catalogs", ["lang"]
+)
+I18N_EVICTIONS_TOTAL = Counter(
+    "i18n_catalog_evictions_total", "Catalogs evicted under the memory budget", ["lang"]
+)
+
+MAGIC = b"FURCAT01"
+MISSING = 0xFFFFFFFF
+_HEADER = struct.Struct("<8sIIQQQ")
+_LANG = struct.Struct("<IIQQQ")
+_SPAN = struct.Struct("<II")
+_JSON_MARK = "\0"
+
+
+def _align(buf: bytearray) -> None:
+    buf.extend(b"\0" * (-len(buf) % 8))
+
+
+def write_atomic(path: str, data: str | bytes) -> None:
+    """Replace ``path`` with ``data`` via a private temp file and ``os.replace``.
+
+    Readers (other workers, the watcher) never see a half-written file and
+    concurrent writers never share a temp file. The file keeps its mode.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o644
+    directory = os.path.dirname(path) or "."
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        os.fchmod(fd, mode)
+        if isinstance(data, str):
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+        else:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def build_catalog(directory: str, out_path: str) -> str:
+    """Compile every ``*.json`` in ``directory`` into ``out_path`` (atomic)."""
+    catalogs: dict[str, dict] = {}
+    stats: dict[str, os.stat_result] = {}
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".json"):
+            continue
+        path = os.path.join(directory, filename)
+        stats[filename[:-5]] = os.stat(path)
+        with open(path, encoding="utf-8") as f:
+            catalogs[filename[:-5]] = json.load(f)
+
+    keys = sorted({key for catalog in catalogs.values() for key in catalog})
+    key_index = {key: i for i, key in enumerate(keys)}
+
+    blob = bytearray()
+    interned: dict[str, tuple[int, int]] = {}
+
+    def intern(text: str) -> tuple[int, int]:
+        span = interned.get(text)
+        if span is None:
+            data = text.encode("utf-8")
+            span = interned[text] = (len(blob), len(blob) + len(data))
+            blob.extend(data)
+        return span
+
+    key_spans = [intern(key) for key in keys]
+    code_spans = {lang: intern(lang) for lang in catalogs}
+    tables: dict[str, list[tuple[int, int]]] = {}
+    for lang, catalog in catalogs.items():
+        table = [(MISSING, MISSING)] * len(keys)
+        for key, value in catalog.items():
+            if not isinstance(value, str):
+                value = _JSON_MARK + json.dumps(value, ensure_ascii=False)
+            table[key_index[key]] = intern(value)
+        tables[lang] = table
+
+    out = bytearray(_HEADER.size)
+    _align(out)
+    langs_off = len(out)
+    out.extend(b"\0" * (_LANG.size * len(catalogs)))
+    _align(out)
+    keys_off = len(out)
+    for span in key_spans:
+        out.extend(_SPAN.pack(*span))
+    table_offs = {}
+    for lang, table in tables.items():
+        _align(out)
+        table_offs[lang] = len(out)
+        for span in table:
+            out.extend(_SPAN.pack(*span))
+    _align(out)
+    blob_off = len(out)
+    out.extend(blob)
+
+    for i, lang in enumerate(catalogs):
+        st = stats[lang]
+        _LANG.pack_into(
+            out,
+            langs_off + i * _LANG.size,
+            *code_spans[lang],
+            table_offs[lang],
+            st.st_mtime_ns,
+            st.st_size,
+        )
+    _HEADER.pack_into(out, 0, MAGIC, len(catalogs), len(keys), langs_off, keys_off, blob_off)
+
+    write_atomic(out_path, bytes(out))
+    log.info("📦 %d Sprachen / %d Keys nach %s kompiliert", len(catalogs), len(keys), out_path)
+    return out_path
+
+
+class CompiledCatalog:
+    """Read-only, memory-mapped view of a file written by :func:`build_catalog`."""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n_langs, n_keys, langs_off, keys_off, blob_off = _HEADER.unpack_from(self._mm)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a compiled translation catalog")
+        self._view = memoryview(self._mm)
+        self._blob_off = blob_off
+        key_spans = self._view[keys_off : keys_off + 8 * n_keys].cast("I")
+        # Eine Key -> Index-Tabelle pro Prozess statt eines Dicts je Sprache
+        self.keys = {self._text(key_spans[2 * i], key_spans[2 * i + 1]): i for i in range(n_keys)}
+        self._langs: dict[str, tuple[Any, int, int]] = {}
+        for i in range(n_langs):
+            start, end, table_off, mtime_ns, size = _LANG.unpack_from(
+                self._mm, langs_off + i * _LANG.size
+            )
+            table = self._view[table_off : table_off + 8 * n_keys].cast("I")
+            self._langs[self._text(start, end)] = (table, mtime_ns, size)
+
+    def _text(self, start: int, end: int) -> str:
+        return str(self._view[self._blob_off + start : self._blob_off + end], "utf-8")
+
+    @property
+    def languages(self) -> list[str]:
+        return list(self._langs)
+
+    def is_fresh(self, lang: str, source: str) -> bool:
+        """True if ``source`` (the JSON file) is unchanged since the build."""
+        entry = self._langs.get(lang)
+        try:
+            st = os.stat(source)
+        except OSError:
+            return False
+        return entry is not None and (st.st_mtime_ns, st.st_size) == entry[1:]
+
+    def _span(self, lang: str, key: str) -> tuple[int, int] | None:
+        index = self.keys.get(key)
+        entry = self._langs.get(lang)
+        if index is None or entry is None:
+            return None
+        table = entry[0]
+        start = table[2 * index]
+        return None if start == MISSING else (start, table[2 * index + 1])
+
+    def has(self, lang: str, key: str) -> bool:
+        return self._span(lang, key) is not None
+
+    def lookup(self, lang: str, key: str) -> Any:
+        span = self._span(lang, key)
+        if span is None:
+            return None
+        value = self._text(*span)
+        if value.startswith(_JSON_MARK):
+            return json.loads(value[1:])
+        return value
+
+    def language(self, lang: str) -> "CatalogLanguage | None":
+        return CatalogLanguage(self, lang) if lang in self._langs else None
+
+
+class CatalogLanguage(Mapping):
+    """Dict-like view of one language; values are decoded on access."""
+
+    __slots__ = ("catalog", "lang")
+
+    def __init__(self, catalog: CompiledCatalog, lang: str) -> None:
+        self.catalog = catalog
+        self.lang = lang
+
+    def __getitem__(self, key: str) -> Any:
+        if not self.catalog.has(self.lang, key):
+            raise KeyError(key)
+        return self.catalog.lookup(self.lang, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self.catalog.lookup(self.lang, key)
+        return default if value is None else value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.catalog.has(self.lang, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self.catalog.keys if key in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+def _estimate_bytes(data: Any) -> int:
+    """Rough private-memory footprint of a parsed JSON catalog."""
+    if isinstance(data, CatalogLanguage):
+        return 0  # shared mmap pages
+    size = sys.getsizeof(data)
+    for key, value in data.items():
+        size += sys.getsizeof(key)
+        size += _estimate_bytes(value) if isinstance(value, dict) else sys.getsizeof(value)
+    return size
+
+
+class LanguageCache(MutableMapping):
+    """Language code -> catalog, loaded on first use and evicted LRU.
+
+    Available languages come from the directory listing – no file is parsed
+    until a language is looked up. Languages served from the compiled catalog
+    cost no private memory; parsed JSON counts against ``budget_bytes``
+    (``0`` = unlimited) and the least recently used non-pinned language is
+    evicted when the budget is exceeded.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        loader: Callable[[str], dict | None],
+        *,
+        catalog_path: str | None = None,
+        pinned: tuple[str, ...] = (),
+        budget_bytes: int = 0,
+    ) -> None:
+        self.directory = directory
+        self.loader = loader
+        self.catalog_path = catalog_path
+        self.pinned = set(pinned)
+        self.budget_bytes = budget_bytes
+        self.stats: dict[str, dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._resident: OrderedDict[str, Mapping] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._codes: set[str] | None = None
+        self._compiled: CompiledCatalog | None = None
+        self._compiled_checked = False
+
+    # -- Mapping API ------------------------------------------------------
+
+    def get(self, lang: str, default: Any = None) -> Any:
+        data = self._resident.get(lang)
+        if data is not None:
+            try:
+                self._resident.move_to_end(lang)
+            except KeyError:  # evicted concurrently
+                pass
+            return data
+        try:
+            return self[lang]
+        except KeyError:
+            return default
+
+    def __getitem__(self, lang: str) -> Mapping:
+        with self._lock:
+            data = self._resident.get(lang)
+            if data is not None:
+                self._resident.move_to_end(lang)
+                return data
+            if lang not in self.codes():
+                raise KeyError(lang)
+            data = self._load(lang)
+            if data is None:
+                raise KeyError(lang)
+            return data
+
+    def __setitem__(self, lang: str, data: Mapping) -> None:
+        with self._lock:
+            self._store(lang, data)
+            self.codes().add(lang)
+
+    def __delitem__(self, lang: str) -> None:
+        with self._lock:
+            self._drop(lang)
+            self.codes().discard(lang)
+
+    def __contains__(self, lang: object) -> bool:
+        return lang in self._resident or lang in self.codes()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self.codes() | set(self._resident)))
+
+    def __len__(self) -> int:
+        return len(self.codes() | set(self._resident))
+
+    # -- Loading / residency ---------------------------------------------
+
+    def codes(self) -> set[str]:
+        """Language codes with a JSON file, from the directory listing only."""
+        codes = self._codes
+        if codes is None:
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                names = []
+            codes = self._codes = {n[:-5] for n in names if n.endswith(".json")}
+        return codes
+
+    def resident(self) -> list[str]:
+        return list(self._resident)
+
+    def invalidate(self, lang: str | None = None) -> None:
+        """Forget ``lang`` (or everything); the next lookup reads it again."""
+        with self._lock:
+            for code in [lang] if lang is not None else list(self._resident):
+                self._drop(code)
+            self._codes = None
+            self._compiled = None
+            self._compiled_checked = False
+
+    def refresh(self, langs: set[str]) -> None:
+        """Re-read resident ``langs`` from JSON and swap each in atomically.
+
+        The new catalog is parsed outside the lock; readers see either the
+        old or the new mapping. Unparsable files keep the old catalog.
+        Non-resident languages are simply read fresh on their next lookup.
+        """
+        with self._lock:
+            self._codes = None
+            self._compiled_checked = False
+            resident = [lang for lang in langs if lang in self._resident]
+        for lang in resident:
+            if not os.path.exists(os.path.join(self.directory, f"{lang}.json")):
+                with self._lock:
+                    self._drop(lang)
+                continue
+            started = time.perf_counter()
+            data = self.loader(lang)
+            if data is None:
+                log.warning("⚠️ %s.json nicht lesbar – behalte bisherigen Katalog", lang)
+                continue
+            I18N_LOAD_SECONDS.labels(lang=lang, source="reload").observe(
+                time.perf_counter() - started
+            )
+            with self._lock:
+                self._store(lang, data)
+        log.info("🔄 Übersetzungen neu geladen: %s", ", ".join(sorted(langs)))
+
+    def _catalog(self) -> CompiledCatalog | None:
+        if not self._compiled_checked and self.catalog_path:
+            self._compiled = open_catalog(self.catalog_path)
+        self._compiled_checked = True
+        return self._compiled
+
+    def _load(self, lang: str) -> Mapping | None:
+        started = time.perf_counter()
+        compiled = self._catalog()
+        source = os.path.join(self.directory, f"{lang}.json")
+        data: Mapping | None = None
+        kind = "mmap"
+        if compiled is not None and compiled.is_fresh(lang, source):
+            data = compiled.language(lang)
+        if data is None:
+            kind = "json"
+            data = self.loader(lang)
+        if data is None:
+            return None
+        elapsed = time.perf_counter() - started
+        I18N_LOAD_SECONDS.labels(lang=lang, source=kind).observe(elapsed)
+        stat = self.stats.setdefault(lang, {"loads": 0})
+        stat.update(loads=stat["loads"] + 1, load_ms=round(elapsed * 1000, 2), source=kind)
+        self._store(lang, data)
+        return data
+
+    def _store(self, lang: str, data: Mapping) -> None:
+        self._resident[lang] = data
+        self._resident.move_to_end(lang)
+        self._sizes[lang] = _estimate_bytes(data)
+        self.stats.setdefault(lang, {"loads": 0})["bytes"] = self._sizes[lang]
+        I18N_RESIDENT_BYTES.labels(lang=lang).set(self._sizes[lang])
+        self._evict()
+
+    def _drop(self, lang: str) -> None:
+        self._resident.pop(lang, None)
+        self._sizes.pop(lang, None)
+        I18N_RESIDENT_BYTES.labels(lang=lang).set(0)
+
+    def _evict(self) -> None:
+        if not self.budget_bytes:
+            return
+        total = sum(self._sizes.values())
+        for lang in list(self._resident):
+            if total <= self.budget_bytes:
+                break
+            if lang in self.pinned or lang == next(reversed(self._resident)):
+                continue
+            total -= self._sizes.get(lang, 0)
+            self._drop(lang)
+            I18N_EVICTIONS_TOTAL.labels(lang=lang).inc()
+            log.debug("Evicted translations for %s", lang)
+
+    def residency(self) -> dict[str, dict[str, Any]]:
+        """Per-language load stats plus current residency (for dashboards)."""
+        return {
+            lang: {**stat, "resident": lang in self._resident}
+            for lang, stat in sorted(self.stats.items())
+        }
+
+
+def file_stamps(directory: str) -> dict[str, tuple[int, int]]:
+    """Language code -> ``(mtime_ns, size)`` of every ``*.json`` in ``directory``."""
+    stamps: dict[str, tuple[int, int]] = {}
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return stamps
+    for filename in names:
+        if filename.endswith(".json"):
+            try:
+                st = os.stat(os.path.join(directory, filename))
+            except OSError:  # replaced between listdir and stat
+                continue
+            stamps[filename[:-5]] = (st.st_mtime_ns, st.st_size)
+    return stamps
+
+
+def source_stamp(directory: str) -> str:
+    """Fingerprint of all ``*.json`` files (name, mtime, size) in ``directory``."""
+    parts = [f"{lang}:{m}:{n}" for lang, (m, n) in sorted(file_stamps(directory).items())]
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class CatalogWatcher(FileSystemEventHandler):
+    """Detect changed ``*.json`` files and report the affected languages.
+
+    The files' ``mtime``/size are the invalidation signal shared by all
+    processes (web workers, bot): whoever writes a catalog, every watcher
+    sees it. Uses ``watchdog`` when installed, otherwise polls every
+    ``interval`` seconds.
+    """
+
+    def __init__(
+        self, directory: str, on_change: Callable[[set[str]], None], interval: float = 2.0
+    ) -> None:
+        self.directory = directory
+        self.on_change = on_change
+        self.interval = interval
+        self._stamps = file_stamps(directory)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._observer: Any = None
+
+    def check(self) -> set[str]:
+        """Compare stamps with the last check; call ``on_change`` for changed languages."""
+        with self._lock:
+            stamps = file_stamps(self.directory)
+            changed = {
+                lang
+                for lang in stamps.keys() | self._stamps.keys()
+                if stamps.get(lang) != self._stamps.get(lang)
+            }
+            self._stamps = stamps
+        if changed:
+            try:
+                self.on_change(changed)
+            except Exception:  # noqa: BLE001
+                log.exception("Hot reload of %s failed", sorted(changed))
+        return changed
+
+    def on_any_event(self, event: Any) -> None:  # watchdog callback
+        self.check()
+
+    def start(self) -> None:
+        if self._thread or self._observer:
+            return
+        self._stop.clear()
+        if Observer is not None:
+            self._observer = Observer()
+            self._observer.schedule(self, self.directory, recursive=False)
+            self._observer.daemon = True
+            self._observer.start()
+            return
+        self._thread = threading.Thread(target=self._run, name="i18n-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+
+def open_catalog(path: str) -> CompiledCatalog | None:
+    """Open ``path`` or return ``None`` if it is missing or unreadable."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return CompiledCatalog(path)
+    except (OSError, ValueError, struct.error) as exc:
+        log.warning("⚠️ Übersetzungskatalog %s unbrauchbar: %s", path, exc)
+        return None
+
+
+__all__ = [
+    "CatalogLanguage",
+    "CatalogWatcher",
+    "CompiledCatalog",
+    "LanguageCache",
+    "build_catalog",
+    "file_stamps",
+    "open_catalog",
+    "source_stamp",
+    "write_atomic",
+]
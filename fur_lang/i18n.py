@@ -1,23 +1,46 @@
 """
 i18n.py – Internationalisierung (i18n) für das FUR-System
 
-Lädt Übersetzungen aus /translations/*.json,
+Lädt Übersetzungen aus /translations/*.json (pro Sprache beim ersten Zugriff),
 stellt zentrale Hilfsfunktionen für Templates, Cogs und Routen bereit.
 """
 
+import atexit
+import functools
 import json
 import logging
 import os
+import string
+import threading
+from dataclasses import dataclass
 from typing import Any
 
 from babel import Locale
 from flask import current_app, request, session
 
+from fur_lang.catalog import CatalogWatcher, LanguageCache, write_atomic
+
 log = logging.getLogger(__name__)
 
 TRANSLATION_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), "translations")
 FLAG_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static", "flags")
 LANG_FALLBACK = "en"
+# Kompilierter Katalog (``python -m i18n_tools.build_catalog``), optional
+CATALOG_PATH = os.getenv("I18N_CATALOG", os.path.join(TRANSLATION_FOLDER, "catalog.bin"))
+
+
+# Discord-/Browser-Codes, deren Sprache unter anderem Namen vorliegt
+LANG_ALIASES = {"no": "nb"}
+
+
+def _load_language(lang_code: str, directory=TRANSLATION_FOLDER) -> dict | None:
+    filename = f"{lang_code}.json"
+    try:
+        with open(os.path.join(directory, filename), encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        log.warning(f"⚠️ Fehler beim Laden von {filename}: {e}")
+        return None
 
 
 def load_translations(directory=TRANSLATION_FOLDER):
@@ -26,27 +49,283 @@ def load_translations(directory=TRANSLATION_FOLDER):
     for filename in os.listdir(directory):
         if filename.endswith(".json"):
             lang_code = filename.replace(".json", "")
-            try:
-                with open(os.path.join(directory, filename), encoding="utf-8") as f:
-                    translations[lang_code] = json.load(f)
-            except Exception as e:
-                log.warning(f"⚠️ Fehler beim Laden von {filename}: {e}")
+            data = _load_language(lang_code, directory)
+            if data is not None:
+                translations[lang_code] = data
     return translations
 
 
-# 📦 Globale Übersetzungstabelle
-translations = load_translations()
+# 📦 Globale Übersetzungstabelle: Sprache -> dict oder Katalog-Ansicht, lazy geladen
+translations = LanguageCache(
+    TRANSLATION_FOLDER,
+    _load_language,
+    catalog_path=CATALOG_PATH,
+    pinned=(LANG_FALLBACK,),
+    budget_bytes=int(float(os.getenv("I18N_CACHE_MB", "4")) * 1024 * 1024),
+)
 
+# Angefragter Code -> geladener Code, inkl. negativer Treffer (-> Fallback)
+_negotiated: dict[str, str] = {}
 
-def _save_translation(lang: str, key: str, value: str) -> None:
-    """Persist a new translation entry to disk."""
-    translations.setdefault(lang, {})[key] = value
+# ---------------------------------------------------------------------------
+# Vorkompilierte Platzhalter-Templates
+# ---------------------------------------------------------------------------
+
+_formatter = string.Formatter()
+# (lang, key, plural form) -> (raw, segments); segments ``None`` = plain text,
+# ``()`` = too complex for the fast path (attribute access, nested specs …)
+_templates: dict[tuple, tuple[str, Any]] = {}
+# Sprache -> Keys, deren Platzhalter ungültig sind (werden wie fehlend behandelt)
+_invalid: dict[str, set[str]] = {}
+
+
+def _compile(raw: str) -> tuple[str, Any]:
+    """Pre-parse ``raw`` into ``(literal, field, spec, conversion)`` segments."""
+    if "{" not in raw and "}" not in raw:
+        return raw, None
+    segments = []
+    for literal, field, spec, conversion in _formatter.parse(raw):
+        if field is not None and (
+            not field.isidentifier()
+            or "{" in (spec or "")
+            or conversion not in (None, "r", "s", "a")
+        ):
+            return raw, ()
+        segments.append((literal, field, spec or "", conversion))
+    return raw, tuple(segments)
+
+
+def _render(template: tuple[str, Any], kwargs: dict) -> str:
+    raw, segments = template
+    if segments is None:
+        return raw
+    if not segments:
+        return raw.format(**kwargs)
+    parts = []
+    for literal, field, spec, conversion in segments:
+        if literal:
+            parts.append(literal)
+        if field is None:
+            continue
+        value = kwargs[field]
+        if conversion == "r":
+            value = repr(value)
+        elif conversion == "s":
+            value = str(value)
+        elif conversion == "a":
+            value = ascii(value)
+        parts.append(format(value, spec))
+    return "".join(parts)
+
+
+def _placeholders(text: str) -> set[str]:
+    return {field for _, field, _, _ in _formatter.parse(text) if field is not None}
+
+
+def _validate_catalog(lang: str, catalog: dict) -> set[str]:
+    """Return keys of ``catalog`` whose format strings would fail at runtime.
+
+    Unparsable templates are always invalid; other languages must not use
+    placeholders the fallback text (or a ``{…}`` source-string key) lacks.
+    """
+    reference_catalog = translations.get(LANG_FALLBACK, {}) if lang != LANG_FALLBACK else {}
+    invalid = set()
+    for key, entry in catalog.items():
+        texts = entry.values() if isinstance(entry, dict) else (entry,)
+        reference = reference_catalog.get(key) or None
+        if reference is None and lang != LANG_FALLBACK and "{" in key:
+            reference = key
+        if isinstance(reference, dict):
+            reference = " ".join(str(v) for v in reference.values())
+        try:
+            allowed = _placeholders(reference) if isinstance(reference, str) else None
+            for text in texts:
+                if not isinstance(text, str) or ("{" not in text and "}" not in text):
+                    continue
+                if allowed is not None and not _placeholders(text) <= allowed:
+                    invalid.add(key)
+                    break
+                _placeholders(text)
+        except ValueError:
+            invalid.add(key)
+    return invalid
+
+
+def validate_placeholders(langs=None) -> dict[str, set[str]]:
+    """Validate ``langs`` (default: all loaded) – runs lazily on first lookup per language.
+
+    Invalid entries fall back to ``LANG_FALLBACK``.
+    """
+    affected = {}
+    for lang in langs if langs is not None else list(translations):
+        bad = _invalid[lang] = _validate_catalog(lang, translations.get(lang, {}))
+        if bad:
+            affected[lang] = len(bad)
+            log.debug("Invalid placeholders in %s: %s", lang, sorted(bad))
+    if affected:
+        log.warning(
+            "⚠️ %d Übersetzungen mit ungültigen Platzhaltern (%s) – nutze Fallback",
+            sum(affected.values()),
+            ", ".join(sorted(affected)),
+        )
+    return _invalid
+
+
+def reload_translations(lang: str | None = None) -> None:
+    """Drop cached catalogs (all or only ``lang``); the next lookup re-reads them.
+
+    This is the only way catalogs are re-read – a lookup for an unknown
+    language never touches the disk.
+    """
+    translations.invalidate(lang)
+    _negotiated.clear()
+    _templates.clear()
+    _invalid.clear()
+
+
+def refresh_translations(langs: set[str]) -> None:
+    """Hot reload: swap in fresh catalogs for changed ``langs``.
+
+    Called by the file watcher (see :func:`start_watcher`) and after edits in
+    the admin translation editor. Derived caches of the affected languages
+    are dropped; registered listeners (e.g. the bot's command table) follow.
+    """
+    translations.refresh(langs)
+    _negotiated.clear()
+    if LANG_FALLBACK in langs:
+        _invalid.clear()  # Referenz für alle Platzhalter-Prüfungen
+    for lang in langs:
+        _invalid.pop(lang, None)
+    for listener in list(_reload_listeners):
+        listener(langs)
+
+
+def swap_translations(lang: str, catalog: dict) -> None:
+    """Replace the catalog of ``lang`` in this process (e.g. after an editor save)."""
+    translations[lang] = catalog
+    _negotiated.clear()
+    _invalid.pop(lang, None)
+
+
+_reload_listeners: list = []
+_watcher: CatalogWatcher | None = None
+
+
+def on_translations_reloaded(listener) -> None:
+    """Register ``listener(langs)`` to run after a hot reload (idempotent)."""
+    if listener not in _reload_listeners:
+        _reload_listeners.append(listener)
+
+
+def off_translations_reloaded(listener) -> None:
+    """Remove a listener registered with :func:`on_translations_reloaded`."""
+    if listener in _reload_listeners:
+        _reload_listeners.remove(listener)
+
+
+def start_watcher() -> CatalogWatcher | None:
+    """Start the per-process translation file watcher (``I18N_WATCH_SECONDS``, 0 = off)."""
+    global _watcher
+    interval = float(os.getenv("I18N_WATCH_SECONDS", "2"))
+    if _watcher is None and interval > 0:
+        _watcher = CatalogWatcher(TRANSLATION_FOLDER, refresh_translations, interval)
+        _watcher.start()
+    return _watcher
+
+
+def negotiate_lang(lang: str | None) -> str:
+    """Map ``lang`` (``en-US``, ``pt_BR``, ``no`` …) to an available language.
+
+    Tries the exact code, its base language and :data:`LANG_ALIASES` before
+    falling back to ``LANG_FALLBACK``. Results – misses included – are cached.
+    """
+    if not lang:
+        return LANG_FALLBACK
+    if lang in translations:
+        return lang
+    cached = _negotiated.get(lang)
+    if cached is not None:
+        return cached
+    available = {code.lower(): code for code in translations}
+    normalized = lang.replace("_", "-").lower()
+    base = normalized.split("-", 1)[0]
+    result = LANG_FALLBACK
+    for candidate in (normalized, base, LANG_ALIASES.get(base)):
+        if candidate in available:
+            result = available[candidate]
+            break
+    _negotiated[lang] = result
+    return result
+
+
+# Fehlende Keys: im Speicher sammeln, gebündelt im Hintergrund nach en.json schreiben
+MISSING_FLUSH_SECONDS = float(os.getenv("I18N_MISSING_FLUSH_SECONDS", "5"))
+_missing_seen: set[str] = set()
+_missing_pending: dict[str, str] = {}
+_missing_lock = threading.Lock()
+_flush_lock = threading.Lock()
+_flush_timer: threading.Timer | None = None
+
+
+def _record_missing_enabled() -> bool:
+    default = "0" if os.getenv("FLASK_ENV") == "production" else "1"
+    return os.getenv("I18N_RECORD_MISSING", default) != "0"
+
+
+def record_missing(key: str, value: str) -> None:
+    """Queue ``key`` for ``LANG_FALLBACK``.json (write-behind, deduplicated).
+
+    Never blocks on disk I/O: a debounced background timer calls
+    :func:`flush_missing` after ``I18N_MISSING_FLUSH_SECONDS``.
+    """
+    global _flush_timer
+    with _missing_lock:
+        if key in _missing_seen:
+            return
+        _missing_seen.add(key)
+        log.warning("Missing translation for '%s'", key)
+        if not _record_missing_enabled() or key in translations.get(LANG_FALLBACK, {}):
+            return
+        _missing_pending[key] = value
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(MISSING_FLUSH_SECONDS, flush_missing)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+def flush_missing() -> int:
+    """Write all queued missing keys atomically; return the number added."""
+    global _flush_timer
+    with _missing_lock:
+        pending = dict(_missing_pending)
+        _missing_pending.clear()
+        _flush_timer = None
+    if not pending:
+        return 0
+    with _flush_lock:
+        return _write_missing(pending)
+
+
+def _write_missing(pending: dict[str, str]) -> int:
+    lang = LANG_FALLBACK
     path = os.path.join(TRANSLATION_FOLDER, f"{lang}.json")
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(translations[lang], f, indent=2, ensure_ascii=False)
+        # Re-read the file so edits made since startup are not overwritten.
+        current = _load_language(lang, TRANSLATION_FOLDER) if os.path.exists(path) else {}
+        current = current if current is not None else dict(translations.get(lang, {}))
+        added = {k: v for k, v in pending.items() if k not in current}
+        if not added:
+            return 0
+        current.update(added)
+        write_atomic(path, json.dumps(current, indent=2, ensure_ascii=False))
+        swap_translations(lang, current)
+        return len(added)
     except Exception as exc:  # noqa: BLE001
-        log.error("Failed saving translation %s:%s – %s", lang, key, exc)
+        log.error("Failed saving %d missing translations to %s – %s", len(pending), path, exc)
+        return 0
+
+
+atexit.register(flush_missing)
 
 
 def warn_flags_without_translation(
@@ -65,28 +344,60 @@ def warn_flags_without_translation(
 warn_flags_without_translation()
 
 
-def get_language_native_name(lang: str) -> str:
-    """Return the native name of a language code."""
+@dataclass(frozen=True)
+class LanguageInfo:
+    """Display metadata of one language for menus and ``<html dir>``."""
+
+    code: str
+    native_name: str
+    rtl: bool
+    flag: str | None  # relative to ``static/``
+
+
+@functools.lru_cache(maxsize=None)
+def language_info(lang: str) -> LanguageInfo:
+    """Return (memoized) Babel metadata for ``lang``; parsed once per process."""
     try:
-        locale = Locale.parse(lang)
-        return locale.get_display_name(lang)
+        locale = Locale.parse(lang.replace("-", "_"))
+        name = locale.get_display_name(locale) or lang
+        rtl = locale.text_direction == "rtl"
     except Exception:  # pragma: no cover - fallback
-        return lang
+        name, rtl = lang, False
+    flag: str | None = f"flags/{lang}.png"
+    if not os.path.exists(os.path.join(FLAG_FOLDER, f"{lang}.png")):
+        flag = None
+    return LanguageInfo(lang, name, rtl, flag)
+
+
+def language_table() -> dict[str, LanguageInfo]:
+    """Return metadata for all supported languages, sorted by code.
+
+    The table is built once per set of languages; treat it as read-only.
+    """
+    return _language_table(tuple(get_supported_languages()))
+
+
+@functools.lru_cache(maxsize=4)
+def _language_table(codes: tuple[str, ...]) -> dict[str, LanguageInfo]:
+    return {lang: language_info(lang) for lang in codes}
+
+
+def get_language_native_name(lang: str) -> str:
+    """Return the native name of a language code."""
+    return language_info(lang).native_name
 
 
 def is_rtl(lang: str) -> bool:
     """Return True if language is right-to-left."""
-    try:
-        return Locale.parse(lang).text_direction == "rtl"
-    except Exception:  # pragma: no cover - fallback
-        return False
+    return language_info(lang).rtl
 
 
 def get_supported_languages() -> list[str]:
-    """Return all available language codes sorted alphabetically."""
-    if not translations:
-        translations.update(load_translations())
-    return sorted(translations.keys())
+    """Return all available language codes sorted alphabetically.
+
+    Answered from the directory listing; no catalog is parsed.
+    """
+    return sorted(translations)
 
 
 def current_lang() -> str:
@@ -122,37 +433,55 @@ def t(
     Args:
         key (str): Übersetzungsschlüssel
         default (str): Fallback-Text, falls Key fehlt
-        lang (str): Sprachcode (z. B. "de", "en") – sonst aus Session
+        lang (str): Sprachcode (z. B. "de", "en-US") – sonst aus Session;
+            wird über ``negotiate_lang`` auf eine vorhandene Sprache abgebildet
         kwargs: Platzhalterwerte für .format()
 
     Returns:
         str: Übersetzter und formatierter Text
     """
-    active_lang = lang or current_lang()
-    if active_lang not in translations or not translations.get(active_lang):
-        translations.update(load_translations())
-
-    entry = translations.get(active_lang, {}).get(key)
-    if isinstance(entry, dict) and count is not None:
-        raw = entry.get("one" if count == 1 else "other")
-    else:
-        raw = entry
+    active_lang = negotiate_lang(lang or current_lang())
 
+    source: str | None = active_lang
+    raw, form = _lookup(active_lang, key, count)
     if raw is None and active_lang != LANG_FALLBACK:
-        fallback_entry = translations.get(LANG_FALLBACK, {}).get(key)
-        if isinstance(fallback_entry, dict) and count is not None:
-            raw = fallback_entry.get("one" if count == 1 else "other")
-        else:
-            raw = fallback_entry
+        source = LANG_FALLBACK
+        raw, form = _lookup(LANG_FALLBACK, key, count)
 
     if raw is None:
         dev = os.getenv("FLASK_ENV") != "production"
         raw = default or (f"MISSING: {key}" if dev else (default or ""))
-        log.warning("Missing translation for '%s'", key)
-        if "en" not in translations or key not in translations.get("en", {}):
-            _save_translation("en", key, default or key)
+        record_missing(key, default or key)
+        source = None
 
+    text = str(raw)
+    cache_key = (source, key, form)
+    template = _templates.get(cache_key)
+    if template is None or template[0] != text:
+        try:
+            template = _templates[cache_key] = _compile(text)
+        except ValueError:
+            return text
+    if not kwargs and template[1] is None:
+        return text
     try:
-        return str(raw).format(**kwargs)
+        return _render(template, kwargs)
     except Exception:  # pragma: no cover - formatting errors
-        return str(raw)
+        return text
+
+
+def _lookup(lang: str, key: str, count: int | None) -> tuple[Any, str | None]:
+    """Return ``(entry, plural form)``; entries with invalid placeholders count as missing."""
+    entry = translations.get(lang, {}).get(key)
+    if entry is None:
+        return None, None
+    invalid = _invalid.get(lang)
+    if invalid is None:
+        # Einmal pro Sprache, beim ersten Zugriff statt beim Import
+        invalid = validate_placeholders([lang])[lang]
+    if key in invalid:
+        return None, None
+    if isinstance(entry, dict) and count is not None:
+        form = "one" if count == 1 else "other"
+        return entry.get(form), form
+    return entry, None
@@ -1,9 +1,16 @@
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Set
+from typing import Dict, List, Set
 
-import requests
+from i18n_tools.mt_pipeline import (
+    LibreTranslator,
+    TranslationMemory,
+    TranslationPipeline,
+    Translator,
+    fill_missing,
+)
 
 TRANSLATIONS_DIR = Path("translations")
 BASE_LANG = "en"
@@ -30,17 +37,39 @@ def save_lang(lang: str, entries: Dict[str, str]):
         json.dump(entries, f, ensure_ascii=False, indent=2)
 
 
+def get_translator() -> Translator:
+    return LibreTranslator(API_URL)
+
+
+def get_pipeline(translator: Translator | None = None) -> TranslationPipeline:
+    """Pipeline with the translation memory next to the catalogs (or ``I18N_TM_PATH``)."""
+    memory_path = os.getenv("I18N_TM_PATH") or TRANSLATIONS_DIR / "translation_memory.sqlite"
+    return TranslationPipeline(translator or get_translator(), TranslationMemory(memory_path))
+
+
 def translate(text: str, target: str) -> str:
     if target == BASE_LANG:
         return text
-    payload = {"q": text, "source": BASE_LANG, "target": target, "format": "text"}
+    pipeline = get_pipeline()
     try:
-        resp = requests.post(API_URL, data=payload, timeout=10)
-        resp.raise_for_status()
-        return resp.json()["translatedText"]
-    except Exception as e:
-        log.error("Translation error [%s]: %s", target, e)
-        return text
+        return pipeline.translate({target: [text]}, BASE_LANG)[target].get(text, text)
+    finally:
+        pipeline.memory.close()
+
+
+def fill_all(
+    data: Dict[str, Dict[str, str]],
+    missing: Dict[str, List[str]],
+    translator: Translator | None = None,
+) -> Dict[str, List[str]]:
+    """Translate all ``missing`` keys of all languages in one batched run."""
+    pipeline = get_pipeline(translator)
+    try:
+        filled = fill_missing(data, missing, data.get(BASE_LANG, {}), pipeline, BASE_LANG)
+    finally:
+        pipeline.memory.close()
+    log.info("Translation stats: %s", pipeline.stats)
+    return filled
 
 
 def main() -> None:
@@ -50,15 +79,14 @@ def main() -> None:
     for d in data.values():
         all_keys.update(d.keys())
 
+    missing = {}
     for lang, entries in data.items():
-        missing = [k for k in all_keys if k not in entries]
-        if not missing:
-            continue
-        log.info("%s: adding %s translations", lang, len(missing))
-        for key in missing:
-            source_text = base.get(key, key)
-            entries[key] = translate(source_text, lang)
-        save_lang(lang, entries)
+        keys = [k for k in all_keys if k not in entries]
+        if keys:
+            log.info("%s: adding %s translations", lang, len(keys))
+            missing[lang] = keys
+    for lang in fill_all(data, missing):
+        save_lang(lang, data[lang])
 
 
 if __name__ == "__main__":
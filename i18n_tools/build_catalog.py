@@ -0,0 +1,15 @@
+"""Compile ``translations/*.json`` into the memory-mapped catalog used by ``fur_lang.i18n``."""
+
+import logging
+import sys
+
+from fur_lang.catalog import build_catalog
+from fur_lang.i18n import CATALOG_PATH, TRANSLATION_FOLDER
+
+log = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    out = sys.argv[1] if len(sys.argv) > 1 else CATALOG_PATH
+    build_catalog(TRANSLATION_FOLDER, out)
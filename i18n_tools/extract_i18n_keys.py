@@ -9,12 +9,13 @@ und schreibt das Ergebnis als JSON-Translation-File für Flask-Babel/i18n.  # no
 import json
 import logging
 import os
-import re
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, List, Optional
 
 import openai
 
+from i18n_tools.key_extractor import extract_keys
+
 # === Konfiguration ===
 SOURCE_DIRS = [".", "templates"]
 TARGET_LANG = "de"
@@ -33,23 +34,13 @@ def scan_translation_keys() -> List[str]:
     """
     Scans all source directories for calls to `t` ('Text') and returns a sorted list of keys.
 
+    Uses the incremental extractor: ignored directories (``static``, ``codex-rs``,
+    ``node_modules`` …) are skipped and only files changed since the last run are parsed.
+
     Returns:
         List[str]: Alphabetically sorted list of all found keys.
     """
-    pattern = re.compile(r"t\(\s*['\"](.+?)['\"]\s*\)")
-    found_keys: Set[str] = set()
-
-    for folder in SOURCE_DIRS:
-        for path in Path(folder).rglob("*"):
-            if path.suffix in {".py", ".html", ".jinja", ".jinja2"} and path.is_file():
-                try:
-                    content = path.read_text(encoding="utf-8", errors="ignore")
-                    matches = pattern.findall(content)
-                    if matches:
-                        found_keys.update(matches)
-                except Exception as e:
-                    log.error("⚠️ Fehler beim Lesen von %s: %s", path, e)
-    return sorted(found_keys)
+    return sorted(extract_keys(SOURCE_DIRS))
 
 
 def translate_gpt(text: str) -> str:
@@ -80,13 +71,18 @@ def translate_gpt(text: str) -> str:
         return text
 
 
-def update_translation_file(keys: List[str]) -> None:
+def update_translation_file(
+    keys: List[str], defaults: Optional[Dict[str, Optional[str]]] = None
+) -> None:
     """
     Aktualisiert oder erzeugt die JSON-Datei mit allen Keys.
 
     Args:
         keys (List[str]): Liste aller zu übersetzenden Keys.
+        defaults (Dict[str, str], optional): ``default=``-Texte aus dem Code,
+            werden statt des Keys als Quelltext verwendet.
     """
+    defaults = defaults or {}
     TRANSLATION_FILE.parent.mkdir(parents=True, exist_ok=True)
     existing = {}
 
@@ -97,7 +93,8 @@ def update_translation_file(keys: List[str]) -> None:
     new_count = 0
     for key in keys:
         if key not in existing:
-            existing[key] = translate_gpt(key) if USE_GPT else key
+            source = defaults.get(key) or key
+            existing[key] = translate_gpt(source) if USE_GPT else source
             new_count += 1
 
     with TRANSLATION_FILE.open("w", encoding="utf-8") as f:
@@ -109,6 +106,6 @@ def update_translation_file(keys: List[str]) -> None:
 
 if __name__ == "__main__":
     log.info("🔍 Scanne Quellverzeichnisse nach t('…') Keys ...")
-    keys = scan_translation_keys()
-    log.info("🔑 %s eindeutige Keys gefunden.", len(keys))
-    update_translation_file(keys)
+    found = extract_keys(SOURCE_DIRS)
+    log.info("🔑 %s eindeutige Keys gefunden.", len(found))
+    update_translation_file(sorted(found), found)
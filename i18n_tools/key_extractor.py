@@ -0,0 +1,220 @@
+"""
+key_extractor.py – inkrementelles Extrahieren der ``t(…)``-Keys
+
+Durchsucht Python-Dateien (per ``ast``) und Jinja-Templates (per Jinja-Parser)
+nach Aufrufen von ``t("key", default="…")``. Verzeichnisse aus
+:data:`IGNORE_DIRS` (``static``, ``codex-rs``, ``node_modules`` …) werden gar
+nicht erst betreten. Ergebnisse werden pro Datei nach ``(Pfad, mtime, Größe)``
+in ``I18N_KEYS_CACHE`` zwischengespeichert; ein warmer Lauf liest nur geänderte
+Dateien, und erst ab ``PARALLEL_THRESHOLD`` Dateien wird ein Prozess-Pool
+gestartet.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from fur_lang.catalog import write_atomic
+
+log = logging.getLogger(__name__)
+
+SUFFIXES = {".py", ".html", ".jinja", ".jinja2"}
+IGNORE_DIRS = {
+    ".git",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".venv",
+    "__pycache__",
+    "build",
+    "codex-rs",
+    "dist",
+    "node_modules",
+    "static",
+    "venv",
+}
+CACHE_PATH = os.getenv("I18N_KEYS_CACHE", ".i18n_keys_cache.json")
+CACHE_VERSION = 1
+PARALLEL_THRESHOLD = 32
+
+# Fallback für Dateien, die sich nicht parsen lassen
+_PATTERN = re.compile(r"\bt\(\s*['\"](.+?)['\"]\s*[,)]")
+
+Found = Dict[str, Optional[str]]  # key -> default (oder None)
+
+
+def _add(found: Found, key: object, default: object) -> None:
+    if not isinstance(key, str) or not key:
+        return
+    if isinstance(default, str) and default:
+        found[key] = default
+    else:
+        found.setdefault(key, None)
+
+
+def extract_python(source: str) -> Found:
+    """Keys of all ``t(...)`` / ``i18n.t(...)`` calls with a literal first argument."""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return extract_regex(source)
+    found: Found = {}
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+        if name != "t" or not node.args or not isinstance(node.args[0], ast.Constant):
+            continue
+        default = next(
+            (
+                kw.value.value
+                for kw in node.keywords
+                if kw.arg == "default" and isinstance(kw.value, ast.Constant)
+            ),
+            None,
+        )
+        _add(found, node.args[0].value, default)
+    return found
+
+
+def extract_jinja(source: str) -> Found:
+    """Keys of all ``t(...)`` calls in a Jinja template."""
+    from jinja2 import Environment, TemplateSyntaxError, nodes
+
+    env = Environment(extensions=["jinja2.ext.i18n", "jinja2.ext.do", "jinja2.ext.loopcontrols"])
+    try:
+        tree = env.parse(source)
+    except TemplateSyntaxError:
+        return extract_regex(source)
+    found: Found = {}
+    for call in tree.find_all(nodes.Call):
+        if not (isinstance(call.node, nodes.Name) and call.node.name == "t"):
+            continue
+        if not call.args or not isinstance(call.args[0], nodes.Const):
+            continue
+        default = next(
+            (
+                kw.value.value
+                for kw in call.kwargs
+                if kw.key == "default" and isinstance(kw.value, nodes.Const)
+            ),
+            None,
+        )
+        _add(found, call.args[0].value, default)
+    return found
+
+
+def extract_regex(source: str) -> Found:
+    return {key: None for key in _PATTERN.findall(source)}
+
+
+def extract_file(path: str) -> Tuple[str, Found]:
+    """Parse one file (runs in the worker processes)."""
+    try:
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            source = f.read()
+    except OSError as e:
+        log.error("⚠️ Fehler beim Lesen von %s: %s", path, e)
+        return path, {}
+    if path.endswith(".py"):
+        return path, extract_python(source)
+    return path, extract_jinja(source)
+
+
+def iter_source_files(roots: Iterable[str], ignore: Iterable[str] = IGNORE_DIRS) -> Iterator[str]:
+    """Yield every source file below ``roots`` once, pruning ignored directories."""
+    ignore = set(ignore)
+    seen = set()
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d not in ignore)
+            for filename in sorted(filenames):
+                if os.path.splitext(filename)[1] not in SUFFIXES:
+                    continue
+                path = os.path.normpath(os.path.join(dirpath, filename))
+                real = os.path.realpath(path)
+                if real not in seen:
+                    seen.add(real)
+                    yield path
+
+
+def _load_cache(path: str) -> Dict[str, list]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("files", {})
+
+
+def _save_cache(path: str, files: Dict[str, list]) -> None:
+    payload = {"version": CACHE_VERSION, "files": files}
+    try:
+        write_atomic(path, json.dumps(payload, ensure_ascii=False))
+    except OSError as e:
+        log.warning("⚠️ Key-Cache %s nicht geschrieben: %s", path, e)
+
+
+def extract_keys(
+    roots: Iterable[str],
+    cache_path: str | None = CACHE_PATH,
+    *,
+    ignore: Iterable[str] = IGNORE_DIRS,
+    workers: int | None = None,
+) -> Found:
+    """Return ``key -> default`` for all ``t(...)`` calls below ``roots``.
+
+    Unchanged files (same mtime and size) are answered from ``cache_path``;
+    ``None`` disables the cache.
+    """
+    cached = _load_cache(cache_path) if cache_path else {}
+    files: Dict[str, list] = {}
+    todo: List[Tuple[str, int, int]] = []
+    for path in iter_source_files(roots, ignore):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entry = cached.get(path)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            files[path] = entry
+        else:
+            todo.append((path, st.st_mtime_ns, st.st_size))
+
+    if todo:
+        paths = [path for path, _, _ in todo]
+        if len(todo) >= PARALLEL_THRESHOLD and workers != 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = dict(pool.map(extract_file, paths, chunksize=16))
+        else:
+            results = dict(map(extract_file, paths))
+        for path, mtime, size in todo:
+            files[path] = [mtime, size, sorted(results[path].items())]
+    log.info("🔍 %d Dateien, %d neu geparst", len(files), len(todo))
+
+    if cache_path and (todo or len(files) != len(cached)):
+        _save_cache(cache_path, files)
+
+    found: Found = {}
+    for path in sorted(files):
+        for key, default in files[path][2]:
+            _add(found, key, default)
+    return found
+
+
+__all__ = [
+    "IGNORE_DIRS",
+    "extract_file",
+    "extract_jinja",
+    "extract_keys",
+    "extract_python",
+    "iter_source_files",
+]
@@ -0,0 +1,321 @@
+"""
+mt_pipeline.py – gebündelte, parallele Maschinenübersetzung mit Translation Memory
+
+Statt jeden Key einzeln und Sprache für Sprache zu übersetzen, sammelt
+:class:`TranslationPipeline` alle fehlenden Texte, entfernt Duplikate, schlägt
+sie im :class:`TranslationMemory` nach und schickt nur den Rest – in Batches von
+``I18N_MT_BATCH_SIZE`` Texten, über ``I18N_MT_CONCURRENCY`` parallele Requests
+und gedrosselt auf ``I18N_MT_RATE`` Requests pro Sekunde.
+
+Das Memory (SQLite, ``I18N_TM_PATH``) ist nach ``(sha1(Quelltext), Zielsprache)``
+geschlüsselt; unveränderte Texte werden nie erneut gesendet. Übersetzungen mit
+kaputten Platzhaltern landen nicht im Memory, sondern fallen auf den Quelltext
+zurück.
+
+Backends implementieren ``translate_batch(texts, target, source) -> list[str]``:
+:class:`LibreTranslator` (Argos/LibreTranslate), :class:`OpenAITranslator` und
+:class:`LocalTranslator` als Offline-Ersatz für Tests.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Protocol
+
+log = logging.getLogger(__name__)
+
+TM_PATH = os.getenv("I18N_TM_PATH", os.path.join("translations", "translation_memory.sqlite"))
+
+_PLACEHOLDER = re.compile(r"{[^{}]+}")
+
+
+class Translator(Protocol):
+    name: str
+
+    def translate_batch(self, texts: List[str], target: str, source: str) -> List[str]: ...
+
+
+def _placeholders(text: str) -> List[str]:
+    return _PLACEHOLDER.findall(text)
+
+
+def _fix_placeholders(source: str, translated: str) -> str | None:
+    """Restore renamed placeholders positionally; ``None`` if they cannot be matched."""
+    expected = _placeholders(source)
+    found = _placeholders(translated)
+    if sorted(found) == sorted(expected):
+        return translated
+    if len(found) != len(expected):
+        return None
+    for old, new in zip(found, expected):
+        translated = translated.replace(old, new, 1)
+    return translated
+
+
+class TranslationMemory:
+    """Persistent ``(sha1(source), lang) -> translation`` store."""
+
+    def __init__(self, path: str | os.PathLike | None = None) -> None:
+        self.path = str(path or TM_PATH)
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS memory ("
+            " hash TEXT NOT NULL, lang TEXT NOT NULL, source TEXT, text TEXT NOT NULL,"
+            " engine TEXT, PRIMARY KEY (hash, lang))"
+        )
+
+    @staticmethod
+    def key(text: str) -> str:
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def get_many(self, texts: Iterable[str], lang: str) -> Dict[str, str]:
+        """Return the known translations of ``texts`` into ``lang``."""
+        by_hash = {self.key(text): text for text in texts}
+        found: Dict[str, str] = {}
+        hashes = list(by_hash)
+        with self._lock:
+            for i in range(0, len(hashes), 500):  # SQLite-Variablenlimit
+                chunk = hashes[i : i + 500]
+                rows = self._db.execute(
+                    f"SELECT hash, text FROM memory WHERE lang = ? AND hash IN "
+                    f"({','.join('?' * len(chunk))})",
+                    [lang, *chunk],
+                )
+                found.update((by_hash[h], text) for h, text in rows)
+        return found
+
+    def put_many(self, lang: str, pairs: Dict[str, str], engine: str = "") -> None:
+        rows = [(self.key(src), lang, src, text, engine) for src, text in pairs.items()]
+        with self._lock, self._db:
+            self._db.executemany("INSERT OR REPLACE INTO memory VALUES (?, ?, ?, ?, ?)", rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM memory").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class RateLimiter:
+    """Allow at most ``rate`` request starts per second across threads."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class LocalTranslator:
+    """Offline stand-in: ``[lang] text`` with placeholders untouched; records batches."""
+
+    name = "local"
+
+    def __init__(self) -> None:
+        self.batches: List[tuple[str, List[str]]] = []
+        self._lock = threading.Lock()
+
+    def translate_batch(self, texts: List[str], target: str, source: str) -> List[str]:
+        with self._lock:
+            self.batches.append((target, list(texts)))
+        return [f"[{target}] {text}" for text in texts]
+
+
+class LibreTranslator:
+    """Argos/LibreTranslate endpoint – accepts a list for ``q``."""
+
+    name = "libretranslate"
+
+    def __init__(self, api_url: str, timeout: float = 30) -> None:
+        self.api_url = api_url
+        self.timeout = timeout
+
+    def translate_batch(self, texts: List[str], target: str, source: str) -> List[str]:
+        import requests
+
+        payload = {"q": texts, "source": source, "target": target, "format": "text"}
+        resp = requests.post(self.api_url, json=payload, timeout=self.timeout)
+        resp.raise_for_status()
+        result = resp.json()["translatedText"]
+        return result if isinstance(result, list) else [result]
+
+
+class OpenAITranslator:
+    """One chat completion per batch; texts go in and out as a JSON array."""
+
+    name = "openai"
+
+    def __init__(self, model: str = "gpt-3.5-turbo", client=None) -> None:
+        self.model = model
+        self._client = client
+
+    def translate_batch(self, texts: List[str], target: str, source: str) -> List[str]:
+        if self._client is None:
+            import openai
+
+            self._client = openai.OpenAI()
+        prompt = (
+            f"Übersetze die folgenden UI-Texte von {source} nach {target}. "
+            "Behalte Platzhalter wie {name}, {count} unverändert. Antworte nur mit "
+            'JSON der Form {"translations": [...]} in derselben Reihenfolge.\n\n'
+            + json.dumps(texts, ensure_ascii=False)
+        )
+        response = self._client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            response_format={"type": "json_object"},
+            temperature=0.3,
+        )
+        return json.loads(response.choices[0].message.content)["translations"]
+
+
+class TranslationPipeline:
+    """Translate many texts into many languages – batched, concurrent, memoised."""
+
+    def __init__(
+        self,
+        translator: Translator,
+        memory: TranslationMemory | None = None,
+        *,
+        batch_size: int | None = None,
+        concurrency: int | None = None,
+        rate: float | None = None,
+    ) -> None:
+        self.translator = translator
+        self.memory = memory if memory is not None else TranslationMemory()
+        self.batch_size = batch_size or int(os.getenv("I18N_MT_BATCH_SIZE", "50"))
+        self.concurrency = concurrency or int(os.getenv("I18N_MT_CONCURRENCY", "4"))
+        self.limiter = RateLimiter(
+            rate if rate is not None else float(os.getenv("I18N_MT_RATE", "2"))
+        )
+        self.stats = {"memory_hits": 0, "translated": 0, "failed": 0, "requests": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        # Batches run on worker threads; ``+=`` on a dict entry is not atomic.
+        with self._stats_lock:
+            self.stats[name] += amount
+
+    def translate(
+        self, texts_by_lang: Dict[str, Iterable[str]], source: str
+    ) -> Dict[str, Dict[str, str]]:
+        """Return ``lang -> {source text: translation}`` for all requested texts.
+
+        Texts that could not be translated map to themselves.
+        """
+        result: Dict[str, Dict[str, str]] = {}
+        jobs = []
+        for lang, texts in texts_by_lang.items():
+            unique = list(dict.fromkeys(t for t in texts if t))
+            if lang == source:
+                result[lang] = {text: text for text in unique}
+                continue
+            known = self.memory.get_many(unique, lang)
+            self._count("memory_hits", len(known))
+            result[lang] = dict(known)
+            todo = [text for text in unique if text not in known]
+            for i in range(0, len(todo), self.batch_size):
+                jobs.append((lang, todo[i : i + self.batch_size]))
+
+        if not jobs:
+            return result
+        log.info(
+            "🌍 %d Batches für %d Sprachen (%d aus Translation Memory)",
+            len(jobs),
+            len({lang for lang, _ in jobs}),
+            self.stats["memory_hits"],
+        )
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = {
+                pool.submit(self._run_batch, lang, batch, source): (lang, batch)
+                for lang, batch in jobs
+            }
+            for future in as_completed(futures):
+                lang, batch = futures[future]
+                translated = future.result()
+                result[lang].update({text: text for text in batch})
+                if translated:
+                    result[lang].update(translated)
+                    self.memory.put_many(lang, translated, self.translator.name)
+        return result
+
+    def _run_batch(self, lang: str, batch: List[str], source: str) -> Dict[str, str]:
+        self.limiter.wait()
+        self._count("requests")
+        try:
+            output = self.translator.translate_batch(batch, lang, source)
+        except Exception as exc:  # noqa: BLE001
+            log.error("⚠️ Übersetzung fehlgeschlagen [%s, %d Texte]: %s", lang, len(batch), exc)
+            self._count("failed", len(batch))
+            return {}
+        if len(output) != len(batch):
+            log.error("⚠️ %s: %d Übersetzungen für %d Texte", lang, len(output), len(batch))
+            self._count("failed", len(batch))
+            return {}
+        translated = {}
+        for text, candidate in zip(batch, output):
+            fixed = _fix_placeholders(text, str(candidate)) if candidate else None
+            if fixed is None:
+                self._count("failed")
+                continue
+            translated[text] = fixed
+        self._count("translated", len(translated))
+        return translated
+
+
+def fill_missing(
+    catalogs: Dict[str, Dict[str, str]],
+    missing: Dict[str, List[str]],
+    base: Dict[str, str],
+    pipeline: TranslationPipeline,
+    source: str,
+) -> Dict[str, List[str]]:
+    """Translate ``missing`` keys of each catalog from ``base`` in one pipeline run.
+
+    Mutates ``catalogs`` and returns ``lang -> filled keys``.
+    """
+    texts: Dict[str, Iterable[str]] = {
+        lang: [base.get(key) or key for key in keys] for lang, keys in missing.items()
+    }
+    translated = pipeline.translate(texts, source)
+    filled: Dict[str, List[str]] = {}
+    for lang, keys in missing.items():
+        for key in keys:
+            text = base.get(key) or key
+            catalogs[lang][key] = translated[lang].get(text, text)
+        if keys:
+            filled[lang] = list(keys)
+    return filled
+
+
+__all__ = [
+    "LibreTranslator",
+    "LocalTranslator",
+    "OpenAITranslator",
+    "RateLimiter",
+    "TranslationMemory",
+    "TranslationPipeline",
+    "fill_missing",
+]
@@ -10,13 +10,20 @@ import argparse
 import json
 import logging
 import os
-import re
 from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List
 
 import openai
 
+from i18n_tools.mt_pipeline import (
+    OpenAITranslator,
+    TranslationMemory,
+    TranslationPipeline,
+    Translator,
+    fill_missing,
+)
+
 # === Konfiguration ===
 LANG_DIR = "i18n"
 MASTER_LANG = "de"
@@ -67,40 +74,28 @@ if USE_GPT and not openai.api_key:
     raise EnvironmentError("❌ OPENAI_API_KEY ist nicht gesetzt.")
 
 
-def extract_placeholders(text: str) -> List[str]:
-    """
-    Extrahiert alle Platzhalter (z.B. {name}) aus dem Text.
-
-    Args:
-        text (str): Eingabetext.
-
-    Returns:
-        List[str]: Liste der Platzhalter.
-    """
-    return re.findall(r"{[^{}]+}", text)
+def get_translator() -> Translator:
+    """OpenAI-Backend für die Batch-Pipeline."""
+    return OpenAITranslator(model="gpt-3.5-turbo")
 
 
-def restore_placeholders(translated: str, original_placeholders: List[str]) -> str:
+def get_pipeline(translator: Translator | None = None) -> TranslationPipeline:
     """
-    Stellt ggf. durch Übersetzung veränderte Platzhalter wieder korrekt her.
+    Pipeline mit Translation Memory (``I18N_TM_PATH``, Standard neben ``LANG_DIR``).
 
     Args:
-        translated (str): Übersetzter Text mit evtl. veränderten Platzhaltern.
-        original_placeholders (List[str]): Originalplatzhalter.
+        translator (Translator, optional): Backend, Standard ist OpenAI.
 
     Returns:
-        str: Übersetzung mit korrigierten Platzhaltern.
+        TranslationPipeline: Gebündelte, parallele Übersetzung.
     """
-    found = extract_placeholders(translated)
-    for i, ph in enumerate(found):
-        if i < len(original_placeholders):
-            translated = translated.replace(ph, original_placeholders[i], 1)
-    return translated
+    memory_path = os.getenv("I18N_TM_PATH") or Path(LANG_DIR) / "translation_memory.sqlite"
+    return TranslationPipeline(translator or get_translator(), TranslationMemory(memory_path))
 
 
 def translate(text: str, lang: str) -> str:
     """
-    Übersetzt einen UI-Text automatisiert via OpenAI GPT.
+    Übersetzt einen einzelnen UI-Text (über Pipeline und Translation Memory).
 
     Args:
         text (str): Zu übersetzender Text.
@@ -109,24 +104,11 @@ def translate(text: str, lang: str) -> str:
     Returns:
         str: Übersetzter Text (Platzhalter korrekt übernommen).
     """
-    placeholders = extract_placeholders(text)
+    pipeline = get_pipeline()
     try:
-        response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {
-                    "role": "user",
-                    "content": f"Übersetze folgenden Text ins {lang} für eine Benutzeroberfläche. "
-                    f"Behalte Platzhalter wie {{name}}, {{count}} unverändert:\n\n'{text}'",
-                }
-            ],
-            temperature=0.3,
-        )
-        result = response.choices[0].message.content.strip()
-        return restore_placeholders(result, placeholders)
-    except Exception as e:
-        log.error("⚠️ GPT-Fehler (%s): %s", lang, e)
-        return f"[{lang}] {text}"
+        return pipeline.translate({lang: [text]}, MASTER_LANG)[lang].get(text, text)
+    finally:
+        pipeline.memory.close()
 
 
 def load_json(path: Path) -> Dict:
@@ -161,43 +143,51 @@ def save_json(path: Path, data: Dict) -> None:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
 
-def sync_translations(dry_run: bool = False, report_only: bool = False) -> Dict[str, List[str]]:
+def sync_translations(
+    dry_run: bool = False, report_only: bool = False, translator: Translator | None = None
+) -> Dict[str, List[str]]:
     """
     Synchronisiert alle Übersetzungsdateien gegen die Master-Sprache,
     übersetzt neue Keys falls notwendig, und erzeugt Reportdaten.
 
+    Alle fehlenden Texte aller Sprachen werden in einem Lauf gebündelt und
+    parallel übersetzt; bekannte Texte kommen aus dem Translation Memory.
+
     Args:
         dry_run (bool, optional): Wenn True, werden keine Dateien geschrieben.
         report_only (bool, optional): Wenn True, werden nur fehlende Keys gelistet.
+        translator (Translator, optional): Backend, Standard ist OpenAI.
 
     Returns:
         Dict[str, List[str]]: Reportdaten (Sprache → neue Keys).
     """
     base_path = Path(LANG_DIR)
-    master_path = base_path / f"{MASTER_LANG}.json"
-    master_data = load_json(master_path)
-
-    report = defaultdict(list)
+    master_data = load_json(base_path / f"{MASTER_LANG}.json")
 
+    catalogs: Dict[str, Dict] = {}
+    missing: Dict[str, List[str]] = {}
     for lang in TARGET_LANGS:
         if lang == MASTER_LANG:
             continue
+        target_data = catalogs[lang] = load_json(base_path / f"{lang}.json")
+        keys = [key for key in master_data if not target_data.get(key)]
+        if keys:
+            missing[lang] = keys
 
-        target_path = base_path / f"{lang}.json"
-        target_data = load_json(target_path)
-
-        updated = False
-
-        for key, value in master_data.items():
-            if key not in target_data or not target_data[key]:
-                translated = translate(value, lang)
-                target_data[key] = translated
-                report[lang].append(key)
-                updated = True
-
-        if updated and not dry_run and not report_only:
-            save_json(target_path, target_data)
+    report = defaultdict(list, {lang: list(keys) for lang, keys in missing.items()})
+    if report_only or not missing:
+        return report
 
+    pipeline = get_pipeline(translator)
+    try:
+        filled = fill_missing(catalogs, missing, master_data, pipeline, MASTER_LANG)
+    finally:
+        pipeline.memory.close()
+    log.info("📊 %s", pipeline.stats)
+
+    if not dry_run:
+        for lang in filled:
+            save_json(base_path / f"{lang}.json", catalogs[lang])
     return report
 
 
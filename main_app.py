@@ -28,6 +28,7 @@ from mongo_service import db  # MongoDB-Instanz  # noqa: E402
 from utils.env_helpers import get_env_bool, get_env_int  # noqa: E402
 from utils.github_service import fetch_repo_info  # noqa: E402
 from web import create_app  # noqa: E402
+from web.socketio_events import start_change_relay  # noqa: E402
 
 # Call to create the Flask application instance via factory pattern
 app = create_app()
@@ -129,11 +130,14 @@ if __name__ == "__main__":
         agents = init_agents(db=db, session=session)
 
         scheduler = SchedulerAgent(app, db)
+        scheduler.schedule_recurrence_materializer()
         if Config.GOOGLE_CALENDAR_ID:
             scheduler.schedule_google_sync()
         if Config.DISCORD_WEBHOOK_URL:
             scheduler.schedule_champion_autopilot()
         threading.Thread(target=scheduler.run, daemon=True).start()
+        # Calendar changes reach browsers even when the bot holds the sync lease.
+        start_change_relay(db)
 
         atexit.register(cleanup)
         signal.signal(signal.SIGINT, signal_handler)
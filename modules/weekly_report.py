@@ -4,6 +4,7 @@ from agents.webhook_agent import WebhookAgent
 from config import Config
 from dashboard.weekly_log_generator import generate_markdown_report
 from mongo_service import get_collection
+from utils.event_helpers import get_events_between
 
 
 def post_report() -> bool:
@@ -30,11 +31,7 @@ def post_report() -> bool:
         )
     )
 
-    upcoming = list(
-        get_collection("events")
-        .find({"event_time": {"$gte": now, "$lte": week_end}}, {"title": 1, "event_time": 1})
-        .sort("event_time", 1)
-    )
+    upcoming = get_events_between(now, week_end, {"title": 1, "event_time": 1})
 
     filename = f"{now.date()}-weekly.md"
     markdown_path = generate_markdown_report(participation, upcoming, filename)
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+
+"""Benchmark the bot's DM fan-out paths against a simulated Discord transport.
+
+Runs the real sender code (``deliver``, ``NewsletterAutopilot``, ``CalendarCog``)
+against :mod:`bot.sim_transport` and an in-memory MongoDB, then reports
+messages/sec, p50/p99 send latency and total wall time.
+
+Example::
+
+    python scripts/benchmark_dm.py --recipients 1000 10000 --latency 0.05 --forbidden-rate 0.1
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, cast
+
+import mongomock
+from discord.ext import commands
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bot import dm_ledger  # noqa: E402
+from bot.cogs import calendar_cog, newsletter_autopilot  # noqa: E402
+from bot.outbound_queue import LANE_BULK, LANE_REMINDER  # noqa: E402
+from bot.sim_transport import SimBot, SimulatedTransport  # noqa: E402
+
+SCENARIOS = ("broadcast", "newsletter", "calendar", "mixed")
+
+
+def _use_memory_db(*modules) -> None:
+    db: Any = mongomock.MongoClient().benchmark
+    for module in modules:
+        module.get_collection = lambda name: db[name]
+
+
+async def _broadcast(bot: SimBot) -> None:
+    members = [m for m in bot.guild.members if not m.bot]
+    suppressed = dm_ledger.ledger.suppressed_ids(m.id for m in members)
+    for member in members:
+        if member.id not in suppressed:
+            await dm_ledger.deliver(member, "broadcast", "benchmark")
+    dm_ledger.ledger.flush()
+
+
+async def _newsletter(bot: SimBot, delay: float) -> None:
+    _use_memory_db(newsletter_autopilot)
+    # SimBot only provides what the senders touch – not a full commands.Bot.
+    cog = newsletter_autopilot.NewsletterAutopilot(cast(commands.Bot, bot))
+    cog.cog_unload()
+    cog.delay = delay
+    await cog._dispatch("benchmark", "newsletter")
+
+
+async def _calendar(bot: SimBot) -> None:
+    _use_memory_db(calendar_cog)
+    cog = calendar_cog.CalendarCog.__new__(calendar_cog.CalendarCog)
+    cog.bot = cast(commands.Bot, bot)
+    events = [
+        {"title": f"Event {i}", "event_time": datetime(2025, 1, 1, 12, i, tzinfo=timezone.utc)}
+        for i in range(10)
+    ]
+    await cog._send_reminders(events, "calendar_week_title")
+
+
+async def _mixed(bot: SimBot, reminders: int) -> list[float]:
+    """Bulk broadcast with a reminder burst injected once it is under way."""
+    latencies: list[float] = []
+
+    async def reminder(member) -> None:
+        start = time.perf_counter()
+        await dm_ledger.deliver(member, "reminder", "benchmark", lane=LANE_REMINDER)
+        latencies.append(time.perf_counter() - start)
+
+    async def bulk() -> None:
+        await asyncio.gather(
+            *(
+                dm_ledger.deliver(m, "broadcast", "benchmark", lane=LANE_BULK)
+                for m in bot.guild.members
+            )
+        )
+
+    bulk_task = asyncio.create_task(bulk())
+    await asyncio.sleep(0.1)
+    await asyncio.gather(*(reminder(m) for m in bot.guild.members[:reminders]))
+    await bulk_task
+    dm_ledger.ledger.flush()
+    return sorted(latencies)
+
+
+async def run_scenario(scenario: str, recipients: int, args: argparse.Namespace) -> dict:
+    transport = SimulatedTransport(
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        bucket_limit=args.bucket_limit,
+        forbidden_rate=args.forbidden_rate,
+        seed=args.seed,
+    )
+    bot = SimBot(transport, recipients)
+    _use_memory_db(dm_ledger)
+    # the cogs import the shared ledger/scheduler by name, so reset them in place
+    dm_ledger.ledger.reset()
+    dm_ledger.outbound.reset()
+
+    reminder_latencies: list[float] = []
+    start = time.perf_counter()
+    if scenario == "broadcast":
+        await _broadcast(bot)
+    elif scenario == "newsletter":
+        await _newsletter(bot, args.delay)
+    elif scenario == "calendar":
+        await _calendar(bot)
+    else:
+        reminder_latencies = await _mixed(bot, args.reminders)
+    wall = time.perf_counter() - start
+
+    stats = transport.stats
+    result = {
+        "scenario": scenario,
+        "recipients": recipients,
+        "wall_s": wall,
+        "msgs_per_s": stats.delivered / wall if wall else 0.0,
+        "p50_ms": stats.percentile(50) * 1000,
+        "p99_ms": stats.percentile(99) * 1000,
+        "delivered": stats.delivered,
+        "forbidden": stats.forbidden,
+        "rate_limited": stats.rate_limited,
+    }
+    if reminder_latencies:
+        p99 = reminder_latencies[int(0.99 * (len(reminder_latencies) - 1))]
+        result["reminder_p99_ms"] = p99 * 1000
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=SCENARIOS, nargs="+", default=["broadcast"])
+    parser.add_argument("--recipients", type=int, nargs="+", default=[1000])
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of injected 429s")
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--bucket-limit", type=int, default=50, help="requests per second")
+    parser.add_argument("--forbidden-rate", type=float, default=0.05)
+    parser.add_argument("--delay", type=float, default=0.0, help="newsletter per-DM delay")
+    parser.add_argument("--reminders", type=int, default=20, help="reminders in 'mixed'")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    header = (
+        f"{'scenario':<11} {'recipients':>10} {'wall s':>9} {'msg/s':>8} "
+        f"{'p50 ms':>8} {'p99 ms':>8} {'429s':>6} {'403s':>6}"
+    )
+    print(header)
+    for scenario in args.scenario:
+        for recipients in args.recipients:
+            r = asyncio.run(run_scenario(scenario, recipients, args))
+            line = (
+                f"{r['scenario']:<11} {r['recipients']:>10} {r['wall_s']:>9.2f} "
+                f"{r['msgs_per_s']:>8.1f} {r['p50_ms']:>8.1f} {r['p99_ms']:>8.1f} "
+                f"{r['rate_limited']:>6} {r['forbidden']:>6}"
+            )
+            if "reminder_p99_ms" in r:
+                line += f"  reminder p99 {r['reminder_p99_ms']:.1f} ms"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
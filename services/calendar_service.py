@@ -1,27 +1,36 @@
 import asyncio
 import logging
 import os
+import time
 from datetime import date as date_type, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Iterable, Optional
 
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
 from pymongo.errors import ConfigurationError
 
 from crud import event_crud
+from services.google.async_client import AsyncCalendarClient, run_blocking
 from services.google.calendar_sync import (
     CalendarSettings,
     SyncTokenExpired as GoogleSyncTokenExpired,
+    build_event_doc,
+    content_hash,
+    credential_manager_for,
+    get_service,
     load_credentials,
 )
+from services.google.change_events import CANCELLED, CREATED, UPDATED, EventChange, publish
 from schemas.event_schema import EventModel
 from utils.env_utils import get_google_calendar_settings
-from utils.time_utils import parse_calendar_datetime
+from utils.recurrence import OCCURRENCES_COLLECTION
 
 log = logging.getLogger(__name__)
 
+# Seconds between credential checks that stat the token file (external rotation).
+_CREDENTIAL_RECHECK = 60.0
+
 
 class SyncTokenExpired(Exception):
     """Raised when a stored sync token is no longer valid."""
@@ -34,6 +43,7 @@ class CalendarService:
         self,
         *,
         calendar_id: Optional[str] = None,
+        calendar_ids: Optional[list[str]] = None,
         mongo_uri: Optional[str] = None,
         events_collection: Optional[AsyncIOMotorCollection] = None,
         tokens_collection: Optional[AsyncIOMotorCollection] = None,
@@ -42,14 +52,22 @@ class CalendarService:
     ) -> None:
         settings = get_google_calendar_settings()
         self.calendar_id = calendar_id or settings.calendar_id
+        self.calendar_ids = [c for c in calendar_ids or settings.calendar_ids if c]
+        if self.calendar_id and self.calendar_id not in self.calendar_ids:
+            self.calendar_ids.insert(0, self.calendar_id)
         self.token_path = token_path or settings.token_path
         self.scopes = scopes or settings.scopes
         self.service: Any | None = None
+        self._credentials: Any = None
+        self._generation = -1
+        self._checked_at = 0.0
+        self.google: AsyncCalendarClient | None = None
         uri = mongo_uri or os.getenv("MONGODB_URI", "mongodb://localhost:27017/furdb")
         if events_collection is not None and tokens_collection is not None:
-            self.client = None
+            self.client: AsyncIOMotorClient | None = None
             self.events = events_collection
             self.tokens = tokens_collection
+            self.occurrences = None
         else:
             self.client = AsyncIOMotorClient(uri)
             try:
@@ -59,90 +77,168 @@ class CalendarService:
                 db = self.client[db_name]
             self.events = db["events"]
             self.tokens = db["calendar_tokens"]
+            self.occurrences = db[OCCURRENCES_COLLECTION]
 
     # ------------------------------------------------------------------
     # API helpers
     # ------------------------------------------------------------------
     def _build_service(self) -> None:
-        if self.service:
-            return
-        token_path = Path(self.token_path)
-        setup_hint = "Run services/google/oauth_setup.py to create tokens."
-        if not token_path.exists():
-            log.warning("Google credentials not found at %s. %s", token_path, setup_hint)
-            raise SyncTokenExpired(f"Google credentials not found at {token_path}. {setup_hint}")
+        """Load credentials and (re)build the API client – blocking, see :meth:`_ensure_service`."""
         settings = CalendarSettings(
-            token_path=token_path,
+            token_path=Path(self.token_path),
             calendar_id=self.calendar_id,
             scopes=self.scopes,
         )
         try:
-            creds = load_credentials(settings)
+            service = get_service(settings)
+            creds = load_credentials(settings) if service else None
         except GoogleSyncTokenExpired as exc:
             raise SyncTokenExpired(str(exc)) from None
-        self.service = build(
-            "calendar",
-            "v3",
-            credentials=creds,
-            cache_discovery=False,
-        )
+        self._credentials = credential_manager_for(settings)
+        self._generation = self._credentials.generation
+        self._checked_at = time.monotonic()
+        if service is not self.service or self.google is None:
+            # First use, or the credential manager reloaded a replaced token file.
+            self.service = service
+            self.google = AsyncCalendarClient(service, creds) if service else None
+
+    async def _ensure_service(self) -> None:
+        """Rebuild the client only when the credential generation changed.
+
+        The hot path is an attribute comparison; loading, refreshing and the
+        periodic token-file check run on the Google executor, never on the loop.
+        """
+        manager = self._credentials
+        if (
+            self.service is not None
+            and manager is not None
+            and manager.generation == self._generation
+            and time.monotonic() - self._checked_at < _CREDENTIAL_RECHECK
+        ):
+            return
+        await run_blocking(self._build_service)
 
     async def _api_list(self, params: dict) -> dict:
-        self._build_service()
-        if not self.service:
+        await self._ensure_service()
+        if not self.service or not self.google:
             log.warning("Calendar service not initialized – skipping")
             return {}
-        return await asyncio.to_thread(self.service.events().list(**params).execute)
+        return await self.google.list_events(**params)
 
     # ------------------------------------------------------------------
     # Sync logic
     # ------------------------------------------------------------------
-    async def _get_token(self) -> Optional[str]:
-        doc = await self.tokens.find_one({"_id": "google"})
+    async def _get_token(self, calendar_id: Optional[str] = None) -> Optional[str]:
+        calendar_id = calendar_id or self.calendar_id
+        doc = await self.tokens.find_one({"_id": calendar_id or "google"})
+        if not doc and calendar_id == self.calendar_id:
+            # Single-calendar deployments stored their token under "google".
+            doc = await self.tokens.find_one({"_id": "google"})
         return doc.get("token") if doc else None
 
-    async def _store_token(self, token: str) -> None:
-        await self.tokens.update_one({"_id": "google"}, {"$set": {"token": token}}, upsert=True)
+    async def _store_token(
+        self, token: str, calendar_id: Optional[str] = None, **stats: Any
+    ) -> None:
+        calendar_id = calendar_id or self.calendar_id
+        await self.tokens.update_one(
+            {"_id": calendar_id or "google"},
+            {"$set": {"token": token, **stats}},
+            upsert=True,
+        )
 
-    @staticmethod
-    def _build_doc(event: dict) -> dict:
-        start_dt = parse_calendar_datetime(event.get("start"))
-        end_dt = parse_calendar_datetime(event.get("end"))
-        event_time = start_dt
-        if start_dt is not None:
-            date_value = start_dt.isoformat()
-        else:
-            date_value = event.get("updated") or datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
-        return {
-            "google_id": event.get("id"),
-            "title": event.get("summary", "No Title"),
-            "description": event.get("description"),
-            "location": event.get("location"),
-            "updated": event.get("updated"),
-            "start": start_dt,
-            "end": end_dt,
-            "event_time": event_time,
-            "source": "google",
-            "status": event.get("status"),
-            "date": date_value,
-        }
+    _build_doc = staticmethod(build_event_doc)
 
-    async def _store_events(self, events: Iterable[dict]) -> None:
+    async def _store_events(self, events: Iterable[dict], calendar_id: Optional[str] = None) -> int:
+        calendar_id = calendar_id or self.calendar_id
+        docs = []
         for ev in events:
             doc = self._build_doc(ev)
-            if not doc["google_id"]:
-                continue
-            await event_crud.upsert_event(doc, col=self.events)
+            doc["calendar_id"] = calendar_id
+            doc["content_hash"] = content_hash({**doc, "recurrence": ev.get("recurrence")})
+            docs.append(doc)
+        started = time.perf_counter()
+        known = await event_crud.get_content_hashes(
+            [d["google_id"] for d in docs if d.get("google_id")],
+            calendar_id=calendar_id,
+            col=self.events,
+        )
+        dirty = [
+            d
+            for d in docs
+            if d.get("google_id")
+            and known.get(d["google_id"], {}).get("content_hash") != d["content_hash"]
+        ]
+        for doc in dirty:
+            old_id = known.get(doc["google_id"], {}).get("_id")
+            if old_id is not None:
+                # Update the matched document, even an untagged legacy one.
+                doc["_id"] = old_id
+        changed = await event_crud.upsert_events(dirty, col=self.events) if dirty else 0
+        log.info(
+            "Stored %d events (%d changed, %d skipped) in %.1f ms",
+            len(docs),
+            changed,
+            len(docs) - len(dirty),
+            (time.perf_counter() - started) * 1000,
+        )
+        changes = []
+        for doc in dirty:
+            old = known.get(doc["google_id"])
+            if doc.get("status") == "cancelled":
+                kind = CANCELLED
+            else:
+                kind = UPDATED if old else CREATED
+            changes.append(
+                EventChange(
+                    kind,
+                    doc["google_id"],
+                    calendar_id,
+                    old.get("_id") if old else None,
+                    doc,
+                    old.get("event_time") if old else None,
+                )
+            )
+        if changes and self.google is not None:
+            # Cached list responses predate the change.
+            self.google.invalidate()
+        publish(changes)
+        return changed
 
     async def sync(self) -> int:
-        log.info("Starting calendar sync for %s", self.calendar_id)
-        self._build_service()
+        """Sync all calendars concurrently; return the number of fetched events.
+
+        At most ``GOOGLE_SYNC_CONCURRENCY`` calendars are fetched at once. A
+        failing calendar is logged; the error is raised only if all failed.
+        """
+        log.info("Starting calendar sync for %s", ", ".join(map(str, self.calendar_ids)))
+        await self._ensure_service()
         if not self.service:
             log.warning("Calendar service not initialized – skipping")
             return 0
-        token = await self._get_token()
+        limit = asyncio.Semaphore(max(1, int(os.getenv("GOOGLE_SYNC_CONCURRENCY", "3"))))
+
+        async def run(calendar_id: Optional[str]) -> int:
+            async with limit:
+                return await self._sync_calendar(calendar_id)
+
+        results = await asyncio.gather(
+            *(run(cal_id) for cal_id in self.calendar_ids), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        for cal_id, res in zip(self.calendar_ids, results):
+            if isinstance(res, BaseException):
+                log.error("Calendar sync for %s failed: %s", cal_id, res)
+        if errors and len(errors) == len(results):
+            raise errors[0]
+        total = sum(r for r in results if not isinstance(r, BaseException))
+        log.info("Calendar sync complete: %s events", total)
+        return total
+
+    async def _sync_calendar(self, calendar_id: Optional[str]) -> int:
+        started = time.perf_counter()
+        token = await self._get_token(calendar_id)
         params = {
-            "calendarId": self.calendar_id,
+            "calendarId": calendar_id,
             "singleEvents": True,
             "showDeleted": True,
             "maxResults": 2500,
@@ -155,26 +251,36 @@ class CalendarService:
             data = await self._api_list(params)
         except HttpError as exc:
             if exc.resp.status == 410:  # sync token expired
-                log.warning("Sync token expired; performing full sync")
-                token = None
+                log.warning("Sync token for %s expired; performing full sync", calendar_id)
                 params.pop("syncToken", None)
                 params["timeMin"] = datetime.utcnow().isoformat() + "Z"
                 data = await self._api_list(params)
             else:
                 raise
         events = data.get("items", [])
-        await self._store_events(events)
+        changed = await self._store_events(events, calendar_id)
         new_token = data.get("nextSyncToken")
         if new_token:
-            await self._store_token(new_token)
-        log.info("Calendar sync complete: %s events", len(events))
+            await self._store_token(
+                new_token,
+                calendar_id,
+                synced_at=datetime.now(timezone.utc),
+                fetched=len(events),
+                changed=changed,
+                duration_ms=round((time.perf_counter() - started) * 1000, 1),
+            )
         return len(events)
 
     # ------------------------------------------------------------------
     # Query helpers
     # ------------------------------------------------------------------
     async def _get_range(self, start: datetime, end: datetime) -> list[dict]:
-        events = await event_crud.get_events_in_range(start, end, col=self.events)
+        if self.occurrences is None:
+            events = await event_crud.get_events_in_range(start, end, col=self.events)
+        else:
+            events = await event_crud.get_events_in_range(
+                start, end, col=self.events, occurrences_col=self.occurrences
+            )
         return [e.model_dump(by_alias=True) if isinstance(e, EventModel) else e for e in events]
 
     async def get_events_today(self) -> list[dict]:
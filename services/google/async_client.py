@@ -0,0 +1,148 @@
+"""Async wrapper around the blocking Google Calendar discovery client.
+
+``googleapiclient`` requests block on HTTP. :class:`AsyncCalendarClient` runs
+them on a dedicated, bounded thread pool (never the loop's default executor),
+gives every call a timeout, coalesces identical in-flight requests
+(single-flight) and keeps successful responses for a short TTL.
+
+httplib2 connections are not thread-safe, so each worker thread executes with
+its own authorised ``Http`` whose socket timeout matches the call timeout – a
+hung request frees its worker instead of pinning it forever.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+
+log = logging.getLogger(__name__)
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def api_timeout() -> float:
+    """Return the per-call Google API timeout in seconds."""
+    return float(os.getenv("GOOGLE_API_TIMEOUT", "15"))
+
+
+def authorized_http(credentials: Any, timeout: float | None = None) -> AuthorizedHttp:
+    """Return an ``Http`` for ``credentials`` with an explicit socket timeout."""
+    return AuthorizedHttp(credentials, http=httplib2.Http(timeout=timeout or api_timeout()))
+
+
+def _google_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv("GOOGLE_API_WORKERS", "4")),
+                thread_name_prefix="google-api",
+            )
+        return _executor
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking Google-bound ``func`` on the dedicated pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_google_executor(), func, *args)
+
+
+class AsyncCalendarClient:
+    """Non-blocking access to a Calendar v3 ``service``."""
+
+    def __init__(
+        self,
+        service: Any,
+        credentials: Any = None,
+        *,
+        timeout: float | None = None,
+        cache_ttl: float | None = None,
+        cache_size: int = 256,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> None:
+        self.service = service
+        self.credentials = credentials
+        self.timeout = timeout or api_timeout()
+        self.cache_ttl = (
+            cache_ttl if cache_ttl is not None else float(os.getenv("GOOGLE_API_CACHE_TTL", "30"))
+        )
+        self.cache_size = cache_size
+        self._executor = executor
+        self._local = threading.local()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._cache: dict[str, tuple[float, Any]] = {}
+
+    def _http(self) -> AuthorizedHttp | None:
+        if self.credentials is None:
+            return None
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = authorized_http(self.credentials, self.timeout)
+        return http
+
+    def _execute(self, build: Callable[[Any], Any]) -> Any:
+        request = build(self.service)
+        http = self._http()
+        return request.execute(http=http) if http is not None else request.execute()
+
+    async def execute(self, build: Callable[[Any], Any], key: str | None = None) -> Any:
+        """Run ``build(service).execute()`` off the event loop.
+
+        Calls with the same ``key`` share one in-flight request and its cached
+        result. Raises :class:`asyncio.TimeoutError` after ``timeout`` seconds.
+        """
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            if key in self._inflight:
+                return await asyncio.wait_for(asyncio.shield(self._inflight[key]), self.timeout)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor or _google_executor(), self._execute, build)
+        if key is not None:
+            self._inflight[key] = future
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            log.warning("Google API call timed out after %.1fs (%s)", self.timeout, key)
+            raise
+        finally:
+            if key is not None:
+                self._inflight.pop(key, None)
+        if key is not None and self.cache_ttl > 0:
+            self._remember(key, result)
+        return result
+
+    def _remember(self, key: str, result: Any) -> None:
+        # Keys embed timeMin/syncToken and rarely repeat once expired: prune on
+        # insert and cap the size, dropping the oldest entries first.
+        now = time.monotonic()
+        for stale in [k for k, (expires, _) in self._cache.items() if expires <= now]:
+            del self._cache[stale]
+        self._cache.pop(key, None)
+        while self._cache and len(self._cache) >= self.cache_size:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (now + self.cache_ttl, result)
+
+    async def list_events(self, **params: Any) -> dict:
+        """Async ``events().list(**params).execute()`` with coalescing and caching."""
+        key = "events.list:" + json.dumps(params, sort_keys=True, default=str)
+        return await self.execute(lambda svc: svc.events().list(**params), key)
+
+    def invalidate(self) -> None:
+        """Drop all cached responses."""
+        self._cache.clear()
+
+
+__all__ = ["AsyncCalendarClient", "api_timeout", "authorized_http", "run_blocking"]
@@ -15,12 +15,12 @@ from flask import (
     session,
 )
 from google.auth import exceptions as google_exceptions
-from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
 
 from utils.env_utils import get_google_calendar_settings
+from .credentials import credential_manager, write_token_atomic
 
 google_auth = Blueprint("google_auth", __name__)
 
@@ -107,13 +107,15 @@ def _save_credentials(creds: Credentials) -> None:
     if not path:
         return
     log.info("Saving Google OAuth credentials to %s", path)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as fh:
-        fh.write(creds.to_json())
+    # The shared credential manager notices the replaced file and reloads it.
+    write_token_atomic(path, creds.to_json())
 
 
 def load_credentials() -> Optional[Credentials]:
-    """Load stored credentials and refresh if expired.
+    """Load stored credentials through the shared credential manager.
+
+    The manager refreshes expired tokens (normally ahead of time in the
+    background) and persists them.
 
     Returns:
         Optional[Credentials]: Existing and refreshed credentials or ``None``
@@ -124,20 +126,20 @@ def load_credentials() -> Optional[Credentials]:
     if not os.path.exists(path):
         log.warning("Token file not found: %s", path)
         return None
-    with open(path, "r", encoding="utf-8") as fh:
-        data = json.load(fh)
     scopes = current_app.config.get(
         "GOOGLE_CALENDAR_SCOPES", ["https://www.googleapis.com/auth/calendar.readonly"]
     )
+
+    def _read() -> Credentials:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        return Credentials.from_authorized_user_info(data, scopes)
+
     try:
-        creds = Credentials.from_authorized_user_info(data, scopes)
+        creds = credential_manager(path, _read).get()
     except ValueError:
         log.error("Invalid credentials")
         return None
-    if creds and creds.expired and creds.refresh_token:
-        log.info("Refreshing expired Google credentials")
-        creds.refresh(Request())
-        _save_credentials(creds)
     log.info("Loaded Google OAuth credentials from %s", path)
     return creds
 
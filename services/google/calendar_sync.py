@@ -10,20 +10,28 @@ from raw event dictionaries.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
 from utils.env_utils import get_google_calendar_settings
+from .async_client import authorized_http
+from .credentials import CredentialManager, credential_manager
+from .change_events import CANCELLED, CREATED, UPDATED, EventChange, publish, record
+from utils.mongo_bulk import bulk_upsert
 from utils.time_utils import parse_calendar_datetime
-from pymongo import UpdateOne
+from pymongo import DeleteOne, UpdateOne
 
 # ---------------------------------------------------------------------------
 # Logging setup
@@ -71,6 +79,16 @@ class CalendarSettings:
     token_path: Path = field(default_factory=_default_token_path)
     calendar_id: str | None = get_google_calendar_settings().calendar_id
     scopes: list[str] = field(default_factory=lambda: get_google_calendar_settings().scopes)
+    calendar_ids: list[str] = field(
+        default_factory=lambda: get_google_calendar_settings().calendar_ids
+    )
+
+    def calendars(self) -> list[str]:
+        """Return every calendar to sync, ``calendar_id`` first."""
+        ids = [c for c in self.calendar_ids if c]
+        if self.calendar_id and self.calendar_id not in ids:
+            ids.insert(0, self.calendar_id)
+        return ids
 
 
 class SyncTokenExpired(Exception):
@@ -78,11 +96,12 @@ class SyncTokenExpired(Exception):
 
 
 def load_credentials(settings: CalendarSettings | None = None) -> Credentials:
-    """Load stored OAuth credentials from disk.
+    """Return the shared OAuth credentials for ``settings.token_path``.
 
-    The token file is expected to contain a refresh token. When the access token
-    is expired it will be refreshed automatically and the new credentials are
-    written back to the same file.
+    The token file is expected to contain a refresh token. It is read once by
+    the process-wide :class:`~services.google.credentials.CredentialManager`,
+    which refreshes the access token in the background shortly before it
+    expires and writes it back atomically.
 
     Parameters
     ----------
@@ -97,13 +116,35 @@ def load_credentials(settings: CalendarSettings | None = None) -> Credentials:
         :func:`Credentials.from_authorized_user_file`.
     """
 
-    global _warned_once
     settings = settings or CalendarSettings()
+    try:
+        return credential_manager_for(settings).get()
+    except SyncTokenExpired:
+        raise
+    except Exception:  # noqa: BLE001
+        logger.exception("Failed to load or refresh credentials. %s", _SETUP_HINT)
+        raise SyncTokenExpired(
+            f"Failed to load or refresh credentials from {settings.token_path}. {_SETUP_HINT}"
+        ) from None
+
+
+def credential_manager_for(settings: CalendarSettings) -> CredentialManager:
+    """Return the process-wide credential manager of ``settings.token_path``."""
+    return credential_manager(settings.token_path, lambda: _read_credentials(settings))
+
+
+_SETUP_HINT = (
+    "Run services/google/oauth_setup.py and set "
+    "GOOGLE_TOKEN_STORAGE_PATH or GOOGLE_CREDENTIALS_FILE."
+)
+
+
+def _read_credentials(settings: CalendarSettings) -> Credentials:
+    """Validate and parse the token file without refreshing it."""
+
+    global _warned_once
     token_path = settings.token_path
-    setup_hint = (
-        "Run services/google/oauth_setup.py and set "
-        "GOOGLE_TOKEN_STORAGE_PATH or GOOGLE_CREDENTIALS_FILE."
-    )
+    setup_hint = _SETUP_HINT
     if not token_path.exists():
         if not _warned_once:
             logger.warning(
@@ -149,10 +190,6 @@ def load_credentials(settings: CalendarSettings | None = None) -> Credentials:
     scopes = settings.scopes
     try:
         creds = Credentials.from_authorized_user_info(info, scopes)
-        if creds.expired and creds.refresh_token:
-            logger.info("Refreshing Google credentials")
-            creds.refresh(Request())
-            token_path.write_text(creds.to_json())
         _warned_once = False
         return creds
     except Exception:  # noqa: BLE001
@@ -165,7 +202,8 @@ def load_credentials(settings: CalendarSettings | None = None) -> Credentials:
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
-_service_cache: dict[Path, Any] = {}
+# token_path -> (credential generation, service)
+_service_cache: dict[Path, tuple[int, Any]] = {}
 
 
 def get_service(settings: CalendarSettings | None = None) -> Any | None:
@@ -176,7 +214,8 @@ def get_service(settings: CalendarSettings | None = None) -> Any | None:
     settings:
         Optional :class:`CalendarSettings` providing token location and scopes.
 
-    The client is constructed on first use for the given ``token_path``. Missing
+    The client is constructed on first use for the given ``token_path`` and
+    rebuilt when the credential manager reloaded a replaced token file. Missing
     or invalid credentials raise :class:`SyncTokenExpired` while other build
     errors return ``None``.
     """
@@ -187,15 +226,17 @@ def get_service(settings: CalendarSettings | None = None) -> Any | None:
     if not token_path.exists():
         logger.warning("Google credentials not found at %s. %s", token_path, setup_hint)
         raise SyncTokenExpired(f"Google credentials not found at {token_path}. {setup_hint}")
-    if token_path in _service_cache:
-        return _service_cache[token_path]
     creds = load_credentials(settings)
+    generation = credential_manager_for(settings).generation
+    cached = _service_cache.get(token_path)
+    if cached and cached[0] == generation:
+        return cached[1]
     try:
-        service = build("calendar", "v3", credentials=creds, cache_discovery=False)
+        service = build("calendar", "v3", http=authorized_http(creds), cache_discovery=False)
     except Exception:  # noqa: BLE001
         logger.exception("Failed to build Google Calendar service")
         service = None
-    _service_cache[token_path] = service
+    _service_cache[token_path] = (generation, service)
     return service
 
 
@@ -262,6 +303,44 @@ def list_upcoming_events(
     return events
 
 
+def build_event_doc(event: dict) -> dict:
+    """Return the canonical ``events`` document for a raw Google event."""
+
+    start_dt = parse_calendar_datetime(event.get("start"))
+    end_dt = parse_calendar_datetime(event.get("end"))
+    if start_dt is not None:
+        date_value = start_dt.isoformat()
+    else:
+        date_value = event.get("updated") or datetime.now(timezone.utc).isoformat()
+    return {
+        "google_id": event.get("id"),
+        "etag": event.get("etag"),
+        "title": event.get("summary", "No Title"),
+        "description": event.get("description"),
+        "location": event.get("location"),
+        "updated": event.get("updated"),
+        "start": start_dt,
+        "end": end_dt,
+        "event_time": start_dt,
+        "source": "google",
+        "status": event.get("status"),
+        "date": date_value,
+    }
+
+
+# Fields whose change is visible to users; bookkeeping like ``etag`` or
+# ``updated`` moves on every touch and is deliberately left out.
+CONTENT_FIELDS = ("title", "description", "location", "start", "end", "status", "recurrence")
+
+
+def content_hash(doc: dict) -> str:
+    """Return a stable hash over the user-visible fields of an event document."""
+
+    payload = {name: doc.get(name) for name in CONTENT_FIELDS}
+    raw = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
 def format_event(event: dict) -> str:
     """Return a human-readable summary for an event dictionary."""
 
@@ -272,6 +351,213 @@ def format_event(event: dict) -> str:
     return title
 
 
+SYNC_STATE_COLLECTION = "calendar_sync_state"
+
+
+def _state_id(collection_name: str, calendar_id: str) -> str:
+    # Sync tokens belong to one target collection: a second collection syncing
+    # the same calendar must not resume from a token whose changes it never stored.
+    return f"{collection_name}:{calendar_id}"
+
+
+@dataclass
+class SyncResult:
+    """Outcome of one :func:`sync_to_mongodb` run."""
+
+    changed: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    full_sync: bool = False
+    changes: list[EventChange] = field(default_factory=list, repr=False)
+    calendars: dict[str, "SyncResult"] = field(default_factory=dict, repr=False)
+
+    def merge(self, other: "SyncResult") -> None:
+        self.changed += other.changed
+        self.unchanged += other.unchanged
+        self.deleted += other.deleted
+        self.full_sync = self.full_sync or other.full_sync
+        self.changes.extend(other.changes)
+
+    def __int__(self) -> int:
+        return self.changed + self.deleted
+
+
+class _SyncTokenInvalid(Exception):
+    """Google answered 410 Gone – the stored sync token must be discarded."""
+
+
+def _fetch_changes(
+    service: Any, params: dict[str, Any], http: Any = None
+) -> tuple[list[dict], str | None]:
+    """Return all items for ``params`` (following pages) and the ``nextSyncToken``.
+
+    Pass ``http`` when fetching from a worker thread – the service's own
+    httplib2 connection must not be shared between threads.
+    """
+
+    items: list[dict] = []
+    page_params = dict(params)
+    try:
+        while True:
+            request = service.events().list(**page_params)
+            result = request.execute(http=http) if http is not None else request.execute()
+            items.extend(result.get("items", []))
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                return items, result.get("nextSyncToken")
+            page_params["pageToken"] = page_token
+    except HttpError as exc:
+        if exc.resp.status == 410:
+            raise _SyncTokenInvalid() from None
+        raise
+
+
+def _apply_changes(
+    col,
+    calendar_id: str | None,
+    events: list[dict],
+    result: SyncResult,
+    to_doc: Callable[[dict], dict] | None = None,
+    key: str = "id",
+    window: tuple[datetime, datetime | None] | None = None,
+) -> None:
+    """Upsert new/modified events, delete cancelled ones and skip unchanged ones.
+
+    An event is unchanged when its ``etag`` or its :func:`content_hash` matches
+    the stored document. Every real change is recorded in ``result.changes``.
+    Documents are matched on ``(calendar, key)``, so the same event shared into
+    two calendars is stored once per calendar.
+
+    ``window`` marks ``events`` as a full listing of ``(timeMin, timeMax)``:
+    stored documents of this calendar starting inside it that the listing no
+    longer contains were deleted while no sync token was valid and are removed.
+    """
+
+    tag = "calendar_id" if to_doc else "__calendar_id"
+    ids = [e["id"] for e in events if e.get("id")]
+    known: dict[str, dict] = {}
+    if ids:
+        projection = {key: 1, tag: 1, "etag": 1, "content_hash": 1, "event_time": 1}
+        # Untagged documents predate multi-calendar sync and are adopted here.
+        query = {key: {"$in": ids}, tag: {"$in": [calendar_id, None]}}
+        for doc in col.find(query, projection):
+            if doc[key] not in known or doc.get(tag) == calendar_id:
+                known[doc[key]] = doc
+    ops: list[UpdateOne | DeleteOne] = []
+    for e in events:
+        event_id = e.get("id")
+        if not event_id:
+            continue
+        old = known.get(event_id)
+        if e.get("status") == "cancelled":
+            if old is not None:
+                ops.append(DeleteOne({"_id": old["_id"]}))
+                result.deleted += 1
+                result.changes.append(EventChange(CANCELLED, event_id, calendar_id, old.get("_id")))
+            continue
+        canonical = build_event_doc(e)
+        digest = content_hash({**canonical, "recurrence": e.get("recurrence")})
+        if old is not None and (
+            (e.get("etag") and old.get("etag") == e.get("etag"))
+            or old.get("content_hash") == digest
+        ):
+            result.unchanged += 1
+            continue
+        doc = to_doc(e) if to_doc else e
+        doc[tag] = calendar_id
+        doc["content_hash"] = digest
+        target = {"_id": old["_id"]} if old is not None else {tag: calendar_id, key: event_id}
+        ops.append(UpdateOne(target, {"$set": doc}, upsert=True))
+        result.changed += 1
+        result.changes.append(
+            EventChange(
+                UPDATED if old is not None else CREATED,
+                event_id,
+                calendar_id,
+                old.get("_id") if old is not None else None,
+                canonical,
+                old.get("event_time") if old is not None else None,
+            )
+        )
+    if window is not None:
+        ops.extend(_purge_missing(col, calendar_id, set(ids), window, result, tag, key))
+    if ops:
+        bulk_upsert(col, ops)
+
+
+def _doc_start(doc: dict) -> datetime | None:
+    value = doc.get("event_time") or doc.get("start")
+    if isinstance(value, dict):
+        return parse_calendar_datetime(value)
+    if isinstance(value, datetime):
+        # MongoDB returns naive UTC datetimes.
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    return None
+
+
+def _purge_missing(
+    col,
+    calendar_id: str | None,
+    seen: set[str],
+    window: tuple[datetime, datetime | None],
+    result: SyncResult,
+    tag: str,
+    key: str,
+) -> list[DeleteOne]:
+    """Return deletes for stored events of ``window`` a full listing did not return."""
+
+    start, end = window
+    projection = {key: 1, "event_time": 1, "start": 1}
+    ops: list[DeleteOne] = []
+    for doc in col.find({tag: calendar_id, key: {"$nin": list(seen)}}, projection):
+        begins = _doc_start(doc)
+        if begins is None or begins < start or (end is not None and begins >= end):
+            continue
+        ops.append(DeleteOne({"_id": doc["_id"]}))
+        result.deleted += 1
+        result.changes.append(EventChange(CANCELLED, doc[key], calendar_id, doc["_id"]))
+    return ops
+
+
+def _sync_concurrency() -> int:
+    return max(1, int(os.getenv("GOOGLE_SYNC_CONCURRENCY", "3")))
+
+
+def _fetch_calendar(
+    service: Any,
+    state,
+    cal_id: str,
+    state_id: str,
+    params: dict[str, Any],
+    time_min: Optional[datetime],
+    time_max: Optional[datetime],
+    http: Any = None,
+) -> tuple[list[dict], str | None, bool]:
+    """Fetch the changes of one calendar; return ``(events, next_token, full_sync)``."""
+
+    token = (state.find_one({"_id": state_id}) or {}).get("sync_token")
+    params = {**params, "calendarId": cal_id}
+    try:
+        try:
+            if not token:
+                raise _SyncTokenInvalid()
+            events, next_token = _fetch_changes(service, {**params, "syncToken": token}, http)
+            return events, next_token, False
+        except _SyncTokenInvalid:
+            if token:
+                logger.warning("Sync token for %s expired; performing full sync", cal_id)
+                state.update_one({"_id": state_id}, {"$unset": {"sync_token": ""}})
+            params["timeMin"] = (
+                (time_min or datetime.now(timezone.utc)).astimezone(timezone.utc).isoformat()
+            )
+            if time_max:
+                params["timeMax"] = time_max.astimezone(timezone.utc).isoformat()
+            events, next_token = _fetch_changes(service, params, http)
+            return events, next_token, True
+    except _SyncTokenInvalid:
+        raise RuntimeError(f"full sync for {cal_id} was rejected with 410") from None
+
+
 def sync_to_mongodb(
     mongo_db,
     collection_name: str = "calendar_events",
@@ -279,40 +565,177 @@ def sync_to_mongodb(
     time_min: Optional[datetime] = None,
     time_max: Optional[datetime] = None,
     settings: CalendarSettings | None = None,
-) -> int:
-    """Fetch events via the Google Calendar API and upsert them into MongoDB."""
+    to_doc: Callable[[dict], dict] | None = None,
+    key: str = "id",
+) -> SyncResult:
+    """Synchronise Google Calendar events into MongoDB incrementally.
+
+    Every calendar of ``settings.calendars()`` is fetched concurrently (at most
+    ``GOOGLE_SYNC_CONCURRENCY`` at a time). The ``nextSyncToken`` and the stats
+    of the last run are stored per ``(collection_name, calendar)`` in
+    ``calendar_sync_state``; later runs only fetch what changed since then.
+    Events whose ``etag`` or content hash did not change are not written,
+    cancelled events are deleted; every real change is published as an
+    :class:`~services.google.change_events.EventChange` and recorded in the
+    shared change log for other processes. ``time_min``/``time_max`` only apply
+    to a full sync, which happens on the first run and – at most once per
+    call – when Google rejects the stored token with 410 Gone. A full sync
+    also deletes stored events of its window that Google no longer lists, since
+    deletions made while no token was valid never arrive as cancelled. A
+    failing calendar is logged and does not stop the others.
+
+    By default raw Google events are stored keyed by ``id``. Pass
+    ``to_doc=build_event_doc, key="google_id"`` to store canonical documents.
+    Either way each document is tagged with its calendar.
+    """
 
     settings = settings or CalendarSettings()
-    if time_min is None:
-        time_min = datetime.now(timezone.utc)
-
+    result = SyncResult()
+    calendars = settings.calendars()
+    if not calendars:
+        logger.warning("GOOGLE_CALENDAR_ID not configured")
+        return result
     try:
-        events = list_upcoming_events(
-            calendar_id=settings.calendar_id,
-            time_min=time_min,
-            time_max=time_max,
-            max_results=max_results,
-            settings=settings,
-        )
+        service = get_service(settings)
     except SyncTokenExpired as err:
         logger.warning("Google token problem: %s", err)
-        return 0
-
-    if not events:
-        return 0
+        return result
+    if not service:
+        return result
 
-    cal_id = settings.calendar_id
-    ops = []
-    for e in events:
-        e["__calendar_id"] = cal_id
-        ops.append(UpdateOne({"id": e.get("id")}, {"$set": e}, upsert=True))
+    state = mongo_db[SYNC_STATE_COLLECTION]
+    col = mongo_db[collection_name]
+    params: dict[str, Any] = {
+        "singleEvents": True,
+        "showDeleted": True,
+        "maxResults": max_results,
+    }
+    # Fixed once so the purge after a full sync uses the window Google listed.
+    time_min = time_min or datetime.now(timezone.utc)
+    if len(calendars) == 1:
+        fetched = {
+            calendars[0]: _try_fetch(
+                service,
+                state,
+                calendars[0],
+                _state_id(collection_name, calendars[0]),
+                params,
+                time_min,
+                time_max,
+            )
+        }
+    else:
+        # Every worker gets its own Http; httplib2 connections are not thread-safe.
+        creds = load_credentials(settings)
+        workers = min(_sync_concurrency(), len(calendars))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="calendar-sync") as pool:
+            futures = {
+                cal_id: pool.submit(
+                    _try_fetch,
+                    service,
+                    state,
+                    cal_id,
+                    _state_id(collection_name, cal_id),
+                    params,
+                    time_min,
+                    time_max,
+                    authorized_http(creds),
+                )
+                for cal_id in calendars
+            }
+            fetched = {cal_id: future.result() for cal_id, future in futures.items()}
+
+    tag = "calendar_id" if to_doc else "__calendar_id"
+    for cal_id, (outcome, fetch_ms) in fetched.items():
+        now = datetime.now(timezone.utc)
+        state_key = {"_id": _state_id(collection_name, cal_id)}
+        owner = {"collection": collection_name, "calendar_id": cal_id}
+        if isinstance(outcome, Exception):
+            state.update_one(
+                state_key,
+                {"$set": {**owner, "last_error": str(outcome), "attempted_at": now}},
+                upsert=True,
+            )
+            continue
+        events, next_token, full_sync = outcome
+        cal_result = SyncResult(full_sync=full_sync)
+        _apply_changes(
+            col,
+            cal_id,
+            events,
+            cal_result,
+            to_doc=to_doc,
+            key=key,
+            window=(time_min, time_max) if full_sync else None,
+        )
+        result.calendars[cal_id] = cal_result
+        result.merge(cal_result)
+        update: dict[str, Any] = {
+            **owner,
+            "synced_at": now,
+            "attempted_at": now,
+            "last_error": None,
+            "event_count": col.count_documents({tag: cal_id}),
+            "last_result": {
+                "changed": cal_result.changed,
+                "unchanged": cal_result.unchanged,
+                "deleted": cal_result.deleted,
+                "full_sync": full_sync,
+                "fetch_ms": round(fetch_ms, 1),
+            },
+        }
+        if next_token:
+            update["sync_token"] = next_token
+        state.update_one(state_key, {"$set": update}, upsert=True)
+        logger.info(
+            "Calendar %s synced (%s): %d changed, %d unchanged, %d deleted",
+            cal_id,
+            "full" if full_sync else "incremental",
+            cal_result.changed,
+            cal_result.unchanged,
+            cal_result.deleted,
+        )
+    publish(result.changes)
+    record(mongo_db, result.changes)
+    return result
 
-    if not ops:
-        return 0
 
-    res = mongo_db[collection_name].bulk_write(ops, ordered=False)
-    changed = (res.upserted_count or 0) + (res.modified_count or 0)
-    return int(changed)
+def _try_fetch(*args: Any) -> tuple[tuple[list[dict], str | None, bool] | Exception, float]:
+    """Return the outcome of :func:`_fetch_calendar` and its duration in ms."""
+    started = time.perf_counter()
+    try:
+        outcome: Any = _fetch_calendar(*args)
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Failed to fetch events from Google Calendar %s", args[2])
+        outcome = exc
+    return outcome, (time.perf_counter() - started) * 1000
+
+
+def sync_status(mongo_db, now: datetime | None = None) -> list[dict]:
+    """Return per-calendar sync lag and event counts for dashboards."""
+
+    now = now or datetime.now(timezone.utc)
+    rows = []
+    # Documents without ``calendar_id`` predate per-collection state and are stale.
+    for doc in (
+        mongo_db[SYNC_STATE_COLLECTION].find({"calendar_id": {"$exists": True}}).sort("_id", 1)
+    ):
+        synced_at = doc.get("synced_at")
+        if synced_at is not None and synced_at.tzinfo is None:
+            # MongoDB returns naive UTC datetimes.
+            synced_at = synced_at.replace(tzinfo=timezone.utc)
+        rows.append(
+            {
+                "calendar_id": doc["calendar_id"],
+                "collection": doc.get("collection"),
+                "synced_at": synced_at,
+                "lag_seconds": (now - synced_at).total_seconds() if synced_at else None,
+                "event_count": doc.get("event_count", 0),
+                "last_result": doc.get("last_result") or {},
+                "last_error": doc.get("last_error"),
+            }
+        )
+    return rows
 
 
 __all__ = [
@@ -320,7 +743,12 @@ __all__ = [
     "get_service",
     "list_upcoming_events",
     "format_event",
+    "build_event_doc",
+    "content_hash",
+    "sync_status",
     "sync_to_mongodb",
+    "SyncResult",
     "load_credentials",
+    "credential_manager_for",
     "SyncTokenExpired",
 ]
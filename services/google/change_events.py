@@ -0,0 +1,127 @@
+"""Typed change events for synced calendar events.
+
+The sync paths publish one :class:`EventChange` per created, updated or
+cancelled event – never for events whose content hash did not change.
+In-process consumers (reminder schedule, caches) ``subscribe`` a callback;
+listener errors are logged and never break the sync.
+
+Only the process holding the sync lease publishes, so changes are also
+``record``-ed in the shared ``calendar_changes`` collection. Other processes
+(e.g. the web server feeding Socket.IO) tail it with a :class:`ChangeFeed`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterable
+
+from bson import ObjectId
+from pymongo import ASCENDING
+
+log = logging.getLogger(__name__)
+
+CREATED = "created"
+UPDATED = "updated"
+CANCELLED = "cancelled"
+
+CHANGES_COLLECTION = "calendar_changes"
+
+
+@dataclass(frozen=True)
+class EventChange:
+    """One stored event that actually changed during a sync."""
+
+    kind: str
+    google_id: str
+    calendar_id: str | None = None
+    event_id: Any = None
+    doc: dict | None = None
+    previous_time: datetime | None = None
+
+    def payload(self) -> dict:
+        """Return a JSON-friendly summary for clients."""
+        doc = self.doc or {}
+        when = doc.get("event_time")
+        return {
+            "change": self.kind,
+            "google_id": self.google_id,
+            "calendar_id": self.calendar_id,
+            "title": doc.get("title") or doc.get("summary"),
+            "event_time": when.isoformat() if isinstance(when, datetime) else when,
+        }
+
+
+Listener = Callable[[EventChange], None]
+_listeners: list[Listener] = []
+
+
+def subscribe(listener: Listener) -> None:
+    """Register ``listener`` for all future changes (idempotent)."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def unsubscribe(listener: Listener) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def publish(changes: Iterable[EventChange]) -> None:
+    """Deliver ``changes`` to every listener."""
+    for change in changes:
+        for listener in list(_listeners):
+            try:
+                listener(change)
+            except Exception:  # noqa: BLE001
+                log.exception("Calendar change listener %r failed", listener)
+
+
+def record(mongo_db: Any, changes: Iterable[EventChange]) -> None:
+    """Append the payloads of ``changes`` to the shared change log."""
+    now = datetime.now(timezone.utc)
+    docs = [{**change.payload(), "recorded_at": now} for change in changes]
+    if not docs:
+        return
+    col = mongo_db[CHANGES_COLLECTION]
+    try:
+        retention = int(os.getenv("CALENDAR_CHANGES_RETENTION_SECONDS", "86400"))
+        col.create_index([("recorded_at", ASCENDING)], expireAfterSeconds=retention)
+        col.insert_many(docs)
+    except Exception:  # noqa: BLE001
+        log.exception("Recording %d calendar changes failed", len(docs))
+
+
+class ChangeFeed:
+    """Read changes recorded by any process since the feed was created."""
+
+    def __init__(self, mongo_db: Any) -> None:
+        self.col = mongo_db[CHANGES_COLLECTION]
+        # The sync leader is the only writer, so its ObjectIds only increase.
+        newest = self.col.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+        self._last_id = (
+            newest["_id"] if newest else ObjectId.from_datetime(datetime.now(timezone.utc))
+        )
+
+    def poll(self, limit: int = 500) -> list[dict]:
+        """Return payloads recorded since the last poll, oldest first."""
+        docs = list(self.col.find({"_id": {"$gt": self._last_id}}).sort("_id", 1).limit(limit))
+        if docs:
+            self._last_id = docs[-1]["_id"]
+        return [{k: v for k, v in doc.items() if k not in ("_id", "recorded_at")} for doc in docs]
+
+
+__all__ = [
+    "CANCELLED",
+    "CHANGES_COLLECTION",
+    "CREATED",
+    "ChangeFeed",
+    "EventChange",
+    "UPDATED",
+    "publish",
+    "record",
+    "subscribe",
+    "unsubscribe",
+]
@@ -0,0 +1,214 @@
+"""Shared Google OAuth credentials with proactive background refresh.
+
+One :class:`CredentialManager` per token file loads the credentials once and
+refreshes them ``GOOGLE_TOKEN_REFRESH_MARGIN`` seconds before they expire on a
+daemon thread, so the first API call after an idle period does not pay a
+synchronous refresh round-trip. Refreshed tokens are written atomically.
+
+When the token file is replaced from outside (new OAuth consent) the
+credentials are reloaded and :attr:`CredentialManager.generation` increases;
+holders of built discovery services compare it and rebuild. In-place refreshes
+keep the generation – ``AuthorizedHttp`` reads the new token from the same
+credentials object.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import stat
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+from google.auth.transport.requests import Request
+
+log = logging.getLogger(__name__)
+
+# Sleep bounds for the refresher: never spin, never sleep past a token's lifetime.
+_MIN_WAIT = 5.0
+_MAX_WAIT = 3600.0
+_RETRY_WAIT = 30.0
+
+
+def write_token_atomic(path: str | os.PathLike, text: str) -> None:
+    """Write ``text`` to ``path`` via a temp file and ``os.replace``.
+
+    The temp file is created ``0600`` (or with the mode of the existing token
+    file), so replacing the token never widens its permissions.
+    """
+    path = Path(path)
+    if path.parent and not path.parent.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except OSError:
+        mode = 0o600
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        fd = os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY, mode)
+        os.fchmod(fd, mode)  # unaffected by the umask
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+class CredentialManager:
+    """Load, cache and proactively refresh the credentials of one token file."""
+
+    def __init__(
+        self,
+        token_path: str | os.PathLike,
+        loader: Callable[[], Any],
+        *,
+        margin: float | None = None,
+        background: bool | None = None,
+    ) -> None:
+        self.token_path = Path(token_path)
+        self.loader = loader
+        self.margin = timedelta(
+            seconds=(
+                margin
+                if margin is not None
+                else float(os.getenv("GOOGLE_TOKEN_REFRESH_MARGIN", "300"))
+            )
+        )
+        self.background = (
+            background
+            if background is not None
+            else os.getenv("GOOGLE_TOKEN_BACKGROUND_REFRESH", "1") != "0"
+        )
+        self.generation = 0
+        self._creds: Any = None
+        self._stamp: tuple[int, int] | None = None
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self) -> Any:
+        """Return current credentials, (re)loading and refreshing only if needed."""
+        with self._lock:
+            stamp = self._file_stamp()
+            if self._creds is None or (stamp is not None and stamp != self._stamp):
+                self._creds = self.loader()
+                self._stamp = self._file_stamp()
+                self.generation += 1
+            if self._due(timedelta(0)):
+                # Background refresh did not run (yet) – refresh inline once.
+                self._refresh_locked()
+            creds = self._creds
+        self._ensure_thread()
+        return creds
+
+    def refresh(self) -> None:
+        """Refresh and persist the credentials now."""
+        with self._lock:
+            if self._creds is None:
+                self._creds = self.loader()
+                self.generation += 1
+            self._refresh_locked()
+
+    def invalidate(self) -> None:
+        """Forget the cached credentials; the next :meth:`get` reloads the file."""
+        with self._lock:
+            self._creds = None
+            self._stamp = None
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _file_stamp(self) -> tuple[int, int] | None:
+        try:
+            st = self.token_path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _due(self, margin: timedelta) -> bool:
+        creds = self._creds
+        if creds is None or not getattr(creds, "refresh_token", None):
+            return False
+        expiry = getattr(creds, "expiry", None)
+        if expiry is None:
+            return bool(getattr(creds, "expired", False))
+        # google-auth keeps ``expiry`` as naive UTC.
+        return datetime.utcnow() + margin >= expiry
+
+    def _refresh_locked(self) -> None:
+        log.info("Refreshing Google credentials for %s", self.token_path)
+        self._creds.refresh(Request())
+        try:
+            write_token_atomic(self.token_path, self._creds.to_json())
+            self._stamp = self._file_stamp()
+        except OSError:
+            log.exception("Persisting refreshed Google token to %s failed", self.token_path)
+
+    def _seconds_until_due(self) -> float:
+        expiry = getattr(self._creds, "expiry", None)
+        if expiry is None:
+            return _MAX_WAIT
+        wait = (expiry - self.margin - datetime.utcnow()).total_seconds()
+        return min(max(wait, _MIN_WAIT), _MAX_WAIT)
+
+    def _ensure_thread(self) -> None:
+        if not self.background or (self._thread and self._thread.is_alive()):
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="google-token-refresh", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        wait = self._seconds_until_due()
+        while not self._stop.wait(wait):
+            try:
+                with self._lock:
+                    if self._due(self.margin):
+                        self._refresh_locked()
+                    wait = self._seconds_until_due()
+            except Exception:  # noqa: BLE001
+                log.exception("Background refresh of Google credentials failed")
+                wait = _RETRY_WAIT
+
+
+_managers: dict[Path, CredentialManager] = {}
+_managers_lock = threading.Lock()
+
+
+def credential_manager(
+    token_path: str | os.PathLike, loader: Callable[[], Any]
+) -> CredentialManager:
+    """Return the per-process manager for ``token_path``.
+
+    ``loader`` reads the token file without refreshing; the latest one passed
+    is used for future reloads.
+    """
+    key = Path(token_path)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = _managers[key] = CredentialManager(key, loader)
+        else:
+            manager.loader = loader
+        return manager
+
+
+__all__ = ["CredentialManager", "credential_manager", "write_token_atomic"]
@@ -0,0 +1,233 @@
+"""Google Calendar push notifications (``events.watch``).
+
+The sync leader registers a ``web_hook`` channel per calendar and renews it
+shortly before it expires. Google then POSTs to ``GOOGLE_PUSH_ADDRESS`` whenever
+the calendar changes; the endpoint (``web/calendar_push_routes.py``) validates
+the channel headers and sets a *pending* flag that the leader picks up on its
+next cheap tick. Push is disabled when ``GOOGLE_PUSH_ADDRESS`` is unset, and
+the coordinator falls back to interval polling whenever no channel is active.
+
+:class:`LocalPushNotifier` stands in for Google in tests and local runs.
+"""
+
+from __future__ import annotations
+
+import hmac
+import logging
+import os
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Mapping
+
+log = logging.getLogger(__name__)
+
+PUSH_COLLECTION = "calendar_push_channels"
+
+# Google sends ``sync`` once after registering a channel, then ``exists`` /
+# ``not_exists`` for actual changes.
+_CHANGE_STATES = {"exists", "not_exists"}
+
+
+class PushChannelManager:
+    """Register, renew and validate ``events.watch`` channels."""
+
+    def __init__(
+        self,
+        mongo_db: Any,
+        service_factory: Callable[[], Any],
+        address: str | None = None,
+        token: str | None = None,
+        ttl: timedelta | None = None,
+        renew_before: timedelta | None = None,
+    ) -> None:
+        self.col = mongo_db[PUSH_COLLECTION]
+        self.service_factory = service_factory
+        self.address = address if address is not None else os.getenv("GOOGLE_PUSH_ADDRESS", "")
+        self.token = token or os.getenv("GOOGLE_PUSH_TOKEN", "")
+        self.ttl = ttl or timedelta(seconds=int(os.getenv("GOOGLE_PUSH_TTL_SECONDS", "604800")))
+        self.renew_before = renew_before or timedelta(hours=1)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.address)
+
+    # ------------------------------------------------------------------
+    # Channel lifecycle (leader only)
+    # ------------------------------------------------------------------
+
+    def active(self, calendar_id: str, now: datetime | None = None) -> bool:
+        """Return True if a channel for ``calendar_id`` is registered and unexpired."""
+        now = now or datetime.now(timezone.utc)
+        doc = self.col.find_one({"_id": calendar_id}, {"expiration": 1})
+        return bool(doc and _aware(doc.get("expiration")) > now)
+
+    def ensure_channel(self, calendar_id: str, now: datetime | None = None) -> bool:
+        """Register or renew the channel for ``calendar_id``; return True if active."""
+        if not self.enabled:
+            return False
+        now = now or datetime.now(timezone.utc)
+        doc = self.col.find_one({"_id": calendar_id}) or {}
+        expiration = _aware(doc.get("expiration"))
+        if doc.get("channel_id") and expiration - now > self.renew_before:
+            return True
+        service = self.service_factory()
+        if not service:
+            return False
+        channel_id = str(uuid.uuid4())
+        token = self.token or secrets.token_urlsafe(24)
+        try:
+            res = (
+                service.events()
+                .watch(
+                    calendarId=calendar_id,
+                    body={
+                        "id": channel_id,
+                        "type": "web_hook",
+                        "address": self.address,
+                        "token": token,
+                        "params": {"ttl": str(int(self.ttl.total_seconds()))},
+                    },
+                )
+                .execute()
+            )
+        except Exception:  # noqa: BLE001
+            log.exception("Registering push channel for %s failed", calendar_id)
+            return False
+        if doc.get("channel_id"):
+            self._stop(service, doc)
+        new_expiration = (
+            datetime.fromtimestamp(int(res["expiration"]) / 1000, timezone.utc)
+            if res.get("expiration")
+            else now + self.ttl
+        )
+        self.col.update_one(
+            {"_id": calendar_id},
+            {
+                "$set": {
+                    "channel_id": channel_id,
+                    "resource_id": res.get("resourceId"),
+                    "token": token,
+                    "expiration": new_expiration,
+                    "registered_at": now,
+                }
+            },
+            upsert=True,
+        )
+        log.info("Push channel for %s active until %s", calendar_id, new_expiration)
+        return True
+
+    @staticmethod
+    def _stop(service: Any, doc: Mapping[str, Any]) -> None:
+        try:
+            service.channels().stop(
+                body={"id": doc["channel_id"], "resourceId": doc.get("resource_id")}
+            ).execute()
+        except Exception:  # noqa: BLE001
+            log.warning("Stopping old push channel %s failed", doc.get("channel_id"))
+
+    # ------------------------------------------------------------------
+    # Notifications (any web worker)
+    # ------------------------------------------------------------------
+
+    def handle_notification(self, headers: Mapping[str, str]) -> str | None:
+        """Validate a push callback; return the calendar id to resync, else ``None``.
+
+        Raises :class:`PermissionError` for unknown channels or wrong tokens.
+        """
+        channel_id = headers.get("X-Goog-Channel-ID", "")
+        doc = self.col.find_one({"channel_id": channel_id}) if channel_id else None
+        token = headers.get("X-Goog-Channel-Token", "")
+        if not doc or not hmac.compare_digest(token.encode(), str(doc.get("token", "")).encode()):
+            raise PermissionError("unknown push channel")
+        state = headers.get("X-Goog-Resource-State", "")
+        if state not in _CHANGE_STATES:
+            return None
+        self.col.update_one(
+            {"_id": doc["_id"]},
+            {"$set": {"pending": True, "last_push_at": datetime.now(timezone.utc)}},
+        )
+        return doc["_id"]
+
+    def pending_since(self, calendar_id: str) -> datetime | None:
+        """Return the time of the pending notification for ``calendar_id``, if any.
+
+        The flag stays set until :meth:`clear_pending` after a successful sync.
+        """
+        doc = self.col.find_one({"_id": calendar_id, "pending": True}, {"last_push_at": 1})
+        if doc is None:
+            return None
+        return doc.get("last_push_at") or datetime.min
+
+    def clear_pending(self, calendar_id: str, seen: datetime) -> None:
+        """Clear the flag unless a newer notification arrived after ``seen``."""
+        query: dict[str, Any] = {"_id": calendar_id, "pending": True}
+        if seen != datetime.min:
+            query["last_push_at"] = seen
+        self.col.update_one(query, {"$set": {"pending": False}})
+
+
+def _aware(value: datetime | None) -> datetime:
+    if value is None:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    # MongoDB returns naive UTC datetimes.
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class LocalPushNotifier:
+    """Stand-in for Google's channel API that delivers callbacks locally.
+
+    Use it as the ``service`` for :class:`PushChannelManager`; ``notify`` then
+    POSTs a change notification to ``path`` through a Flask test client.
+    """
+
+    def __init__(self) -> None:
+        self.registered: dict[str, dict] = {}
+        self.stopped: list[str] = []
+
+    def events(self) -> "LocalPushNotifier":
+        return self
+
+    def channels(self) -> "LocalPushNotifier":
+        return self
+
+    def watch(self, calendarId: str, body: dict) -> Any:  # noqa: N803 - Google API name
+        expiration = datetime.now(timezone.utc) + timedelta(seconds=int(body["params"]["ttl"]))
+        self.registered[body["id"]] = {**body, "calendarId": calendarId}
+        return _Executable(
+            {
+                "resourceId": f"res-{calendarId}",
+                "expiration": str(int(expiration.timestamp() * 1000)),
+            }
+        )
+
+    def stop(self, body: dict) -> Any:
+        self.stopped.append(body["id"])
+        self.registered.pop(body["id"], None)
+        return _Executable({})
+
+    def notify(self, client: Any, path: str, state: str = "exists") -> Any:
+        """Send a notification for every registered channel; return the last response."""
+        response = None
+        for channel_id, body in list(self.registered.items()):
+            response = client.post(
+                path,
+                headers={
+                    "X-Goog-Channel-ID": channel_id,
+                    "X-Goog-Channel-Token": body["token"],
+                    "X-Goog-Resource-State": state,
+                    "X-Goog-Resource-ID": f"res-{body['calendarId']}",
+                },
+            )
+        return response
+
+
+class _Executable:
+    def __init__(self, result: dict) -> None:
+        self.result = result
+
+    def execute(self) -> dict:
+        return self.result
+
+
+__all__ = ["LocalPushNotifier", "PushChannelManager", "PUSH_COLLECTION"]
@@ -0,0 +1,234 @@
+"""Single owner for the Google Calendar → MongoDB sync.
+
+Both the web process (APScheduler job in :mod:`services.google.sync_task`) and
+the bot (``CalendarCog.sync_loop``) tick the same :class:`CalendarSyncCoordinator`.
+A lease document in ``sync_leases`` makes sure only one process in the whole
+deployment talks to Google at a time; all other ticks are no-ops. The leader
+writes canonical documents into ``events``, which every reader consumes.
+
+With push notifications enabled (see :mod:`services.google.push_channel`) a
+tick only calls Google when a notification is pending, when no channel is
+active, or when ``GOOGLE_PUSH_FALLBACK_MINUTES`` passed since the last sync.
+Schedulers then tick every ``GOOGLE_PUSH_CHECK_SECONDS`` (see
+:func:`tick_interval_minutes`), so the leader picks up a flag set by any
+worker within seconds.
+
+Every real change is published via :mod:`services.google.change_events`; the
+coordinator itself keeps the reminder schedule in step by dropping
+``reminders_sent`` markers of moved or cancelled events.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from .calendar_sync import (
+    CalendarSettings,
+    SyncResult,
+    build_event_doc,
+    get_service,
+    sync_to_mongodb,
+)
+from .change_events import CANCELLED, UPDATED, EventChange, subscribe, unsubscribe
+from .push_channel import PushChannelManager
+
+log = logging.getLogger(__name__)
+
+EVENTS_COLLECTION = "events"
+LEASE_COLLECTION = "sync_leases"
+LEASE_NAME = "google_calendar"
+REMINDERS_SENT_COLLECTION = "reminders_sent"
+
+
+def _owner_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class SyncLease:
+    """Mongo-backed leader lease with expiry.
+
+    ``acquire`` atomically takes the lease when it is free or expired and
+    renews it when this owner already holds it.
+    """
+
+    def __init__(self, col: Any, name: str, owner: str, ttl: timedelta) -> None:
+        self.col = col
+        self.name = name
+        self.owner = owner
+        self.ttl = ttl
+
+    def acquire(self, now: datetime | None = None) -> bool:
+        now = now or datetime.now(timezone.utc)
+        try:
+            doc = self.col.find_one_and_update(
+                {
+                    "_id": self.name,
+                    "$or": [{"owner": self.owner}, {"expires_at": {"$lt": now}}],
+                },
+                {"$set": {"owner": self.owner, "expires_at": now + self.ttl, "renewed_at": now}},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            # Lease exists and is held by someone else – the upsert collided.
+            return False
+        return bool(doc) and doc.get("owner") == self.owner
+
+    def release(self) -> None:
+        self.col.delete_one({"_id": self.name, "owner": self.owner})
+
+
+class CalendarSyncCoordinator:
+    """Run the incremental Google sync only while holding the lease."""
+
+    def __init__(
+        self,
+        mongo_db: Any,
+        settings: CalendarSettings | None = None,
+        lease_ttl: float | None = None,
+        owner: str | None = None,
+    ) -> None:
+        self.mongo_db = mongo_db
+        self.settings = settings
+        ttl = lease_ttl or float(os.getenv("CALENDAR_SYNC_LEASE_SECONDS", "300"))
+        self.lease = SyncLease(
+            mongo_db[LEASE_COLLECTION], LEASE_NAME, owner or _owner_id(), timedelta(seconds=ttl)
+        )
+        # Bot loop and web scheduler may tick concurrently inside one process.
+        self._running = threading.Lock()
+        self.last_result: SyncResult | None = None
+        self._last_sync: float | None = None
+        self.fallback = 60 * float(os.getenv("GOOGLE_PUSH_FALLBACK_MINUTES", "30"))
+        self.push = PushChannelManager(mongo_db, lambda: get_service(self._settings()))
+        self._wakeup = threading.Event()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Stop re-arming reminders, e.g. when the process shuts down."""
+        unsubscribe(self._reschedule_reminders)
+
+    def _reschedule_reminders(self, change: EventChange) -> None:
+        """Re-arm reminders for moved events, forget them for cancelled ones."""
+        if change.event_id is None:
+            return
+        if change.kind == UPDATED:
+            new_time = (change.doc or {}).get("event_time")
+            if _naive_utc(new_time) == _naive_utc(change.previous_time):
+                return
+        elif change.kind != CANCELLED:
+            return
+        self.mongo_db[REMINDERS_SENT_COLLECTION].delete_many({"event_id": change.event_id})
+
+    def _settings(self) -> CalendarSettings:
+        return self.settings or CalendarSettings()
+
+    def tick(self) -> SyncResult | None:
+        """Scheduled entry point: sync when due, keep the push channel alive."""
+        if not self.push.enabled:
+            return self.sync_once()
+        if not self.lease.acquire():
+            return None
+        calendars = self._settings().calendars()
+        if not calendars:
+            return None
+        pushing = all([self.push.ensure_channel(cal_id) for cal_id in calendars])
+        pending = {
+            cal_id: seen
+            for cal_id in calendars
+            if (seen := self.push.pending_since(cal_id)) is not None
+        }
+        stale = self._last_sync is None or time.monotonic() - self._last_sync >= self.fallback
+        if pushing and not pending and not stale:
+            return None
+        result = self.sync_once()
+        # Busy or failed syncs return None – keep the flags for the next tick.
+        if result is not None:
+            for cal_id, seen in pending.items():
+                self.push.clear_pending(cal_id, seen)
+        return result
+
+    def request_sync(self) -> None:
+        """Tick soon on the background worker; requests arriving meanwhile coalesce."""
+        self._wakeup.set()
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._work, name="calendar-sync-requests", daemon=True
+                )
+                self._worker.start()
+
+    def _work(self) -> None:
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            try:
+                self.tick()
+            except Exception:  # noqa: BLE001
+                log.exception("Requested calendar sync failed")
+
+    def sync_once(self) -> SyncResult | None:
+        """Sync if this process is the leader; return ``None`` otherwise."""
+        if not self._running.acquire(blocking=False):
+            return None
+        try:
+            if not self.lease.acquire():
+                log.debug("Calendar sync lease held by another process – skipping")
+                return None
+            result = sync_to_mongodb(
+                self.mongo_db,
+                collection_name=EVENTS_COLLECTION,
+                settings=self._settings(),
+                to_doc=build_event_doc,
+                key="google_id",
+            )
+            self.last_result = result
+            self._last_sync = time.monotonic()
+            return result
+        except Exception:  # noqa: BLE001
+            log.exception("Calendar sync failed")
+            return None
+        finally:
+            self._running.release()
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    # MongoDB hands back naive UTC datetimes, Google parsing yields aware ones.
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def tick_interval_minutes(default: float) -> float:
+    """Scheduler interval: a short pending-flag check in push mode, ``default`` otherwise."""
+    if os.getenv("GOOGLE_PUSH_ADDRESS"):
+        return int(os.getenv("GOOGLE_PUSH_CHECK_SECONDS", "15")) / 60
+    return default
+
+
+_coordinators: dict[Any, CalendarSyncCoordinator] = {}
+
+
+def get_coordinator(mongo_db: Any) -> CalendarSyncCoordinator:
+    """Return the per-process coordinator for ``mongo_db``.
+
+    Only this shared instance listens for changes, so the reminder listener is
+    registered once per database instead of once per constructed coordinator.
+    """
+    key = getattr(mongo_db, "name", id(mongo_db))
+    if key not in _coordinators:
+        coordinator = _coordinators[key] = CalendarSyncCoordinator(mongo_db)
+        subscribe(coordinator._reschedule_reminders)
+    return _coordinators[key]
+
+
+__all__ = ["CalendarSyncCoordinator", "SyncLease", "get_coordinator"]
@@ -1,33 +1,35 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
 
 from apscheduler.schedulers.background import BackgroundScheduler
 
-from .calendar_sync import sync_to_mongodb
+from .sync_coordinator import get_coordinator, tick_interval_minutes
 
 log = logging.getLogger(__name__)
 _scheduler: BackgroundScheduler | None = None
 
 
 def start_google_sync(app, mongo_db):
-    """Start an interval job syncing Google Calendar to MongoDB."""
+    """Start an interval job ticking the calendar sync coordinator.
+
+    Every web worker may call this; the coordinator's lease ensures only one
+    process in the deployment actually syncs.
+    """
     global _scheduler
     if _scheduler is None:
         _scheduler = BackgroundScheduler()
 
-    interval = int(app.config.get("GOOGLE_SYNC_INTERVAL_MINUTES", 2))
+    # Push mode: ticks are a cheap Mongo check; Google is only called when
+    # a notification is pending or the fallback interval elapsed.
+    interval = tick_interval_minutes(int(app.config.get("GOOGLE_SYNC_INTERVAL_MINUTES", 2)))
+    coordinator = get_coordinator(mongo_db)
 
     def _job():
         with app.app_context():
-            count = sync_to_mongodb(
-                mongo_db=mongo_db,
-                collection_name="calendar_events",
-                max_results=250,
-                time_min=datetime.now(timezone.utc),
-            )
-            log.info("Google Calendar sync finished (upserts/updates: %s)", count)
+            result = coordinator.tick()
+            if result is not None:
+                log.info("Google Calendar sync finished (changes: %s)", int(result))
 
     _scheduler.add_job(
         _job,
@@ -0,0 +1,80 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from services.google.async_client import AsyncCalendarClient
+
+
+class FakeService:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self.release = threading.Event()
+
+    def events(self):
+        return self
+
+    def list(self, **params):
+        service = self
+
+        class Request:
+            def execute(self):
+                service.calls += 1
+                service.release.wait(service.delay)
+                return {"items": [params]}
+
+        return Request()
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_coalesced_and_cached():
+    service = FakeService(delay=0.05)
+    client = AsyncCalendarClient(service, timeout=1, cache_ttl=60)
+
+    first, second = await asyncio.gather(
+        client.list_events(calendarId="c"), client.list_events(calendarId="c")
+    )
+    third = await client.list_events(calendarId="c")
+
+    assert first == second == third
+    assert service.calls == 1
+
+    await client.list_events(calendarId="other")
+    assert service.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_request_times_out_without_blocking_loop():
+    service = FakeService(delay=5)
+    client = AsyncCalendarClient(service, timeout=0.05, cache_ttl=0)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    task = asyncio.create_task(ticker())
+    with pytest.raises(asyncio.TimeoutError):
+        await client.list_events(calendarId="c")
+    task.cancel()
+    service.release.set()
+
+    assert ticks >= 3
+
+
+@pytest.mark.asyncio
+async def test_cache_prunes_expired_entries_and_is_capped():
+    client = AsyncCalendarClient(FakeService(), timeout=1, cache_ttl=60, cache_size=2)
+
+    for token in ("a", "b", "c"):
+        await client.list_events(calendarId="c", syncToken=token)
+    tokens = [json.loads(key.split(":", 1)[1])["syncToken"] for key in client._cache]
+    assert tokens == ["b", "c"]
+
+    client._cache = {key: (0.0, value) for key, (_, value) in client._cache.items()}
+    await client.list_events(calendarId="c", syncToken="d")
+    assert len(client._cache) == 1
@@ -3,6 +3,7 @@ import logging
 import os
 
 import services.google.auth as mod
+import services.google.credentials as credentials_mod
 
 
 def test_google_login_flow(client, monkeypatch):
@@ -62,7 +63,7 @@ def test_load_credentials_refresh(monkeypatch, tmp_path, app, caplog):
     monkeypatch.setattr(
         mod.Credentials, "from_authorized_user_info", lambda info, scopes: FakeCred()
     )
-    monkeypatch.setattr(mod, "Request", lambda: object())
+    monkeypatch.setattr(credentials_mod, "Request", lambda: object())
     with caplog.at_level(logging.INFO):
         cred = mod.load_credentials()
     assert isinstance(cred, FakeCred)
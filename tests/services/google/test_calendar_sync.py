@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
@@ -66,3 +67,249 @@ def test_load_credentials_client_config(monkeypatch, tmp_path, caplog, app):
             with pytest.raises(mod.SyncTokenExpired):
                 mod.load_credentials()
         assert "client config" in caplog.text
+
+
+class _FakeHttpError(mod.HttpError):
+    def __init__(self, status):
+        self.resp = type("Resp", (), {"status": status})()
+
+
+def _sync_service(pages):
+    """Return a fake service whose ``list().execute()`` yields ``pages`` in order."""
+    service = MagicMock()
+    calls = []
+
+    def list_(**params):
+        calls.append(params)
+        page = pages.pop(0)
+        request = MagicMock()
+        if isinstance(page, Exception):
+            request.execute.side_effect = page
+        else:
+            request.execute.return_value = page
+        return request
+
+    service.events.return_value.list.side_effect = list_
+    return service, calls
+
+
+def _settings(tmp_path):
+    return mod.CalendarSettings(token_path=tmp_path / "t.json", calendar_id="cal", scopes=[])
+
+
+def test_sync_to_mongodb_uses_stored_sync_token(monkeypatch, tmp_path):
+    import mongomock
+
+    db = mongomock.MongoClient().db
+    service, calls = _sync_service(
+        [
+            {"items": [{"id": "a", "etag": "1"}, {"id": "b", "etag": "1"}], "nextSyncToken": "t1"},
+            {
+                "items": [
+                    {"id": "a", "etag": "2", "summary": "Renamed"},
+                    {"id": "b", "status": "cancelled"},
+                ],
+                "nextSyncToken": "t2",
+            },
+            {"items": [], "nextSyncToken": "t3"},
+        ]
+    )
+    monkeypatch.setattr(mod, "get_service", lambda settings=None: service)
+
+    first = mod.sync_to_mongodb(db, settings=_settings(tmp_path))
+    assert (first.changed, first.full_sync) == (2, True)
+    assert "syncToken" not in calls[0]
+
+    second = mod.sync_to_mongodb(db, settings=_settings(tmp_path))
+    assert calls[1]["syncToken"] == "t1"
+    assert (second.changed, second.deleted) == (1, 1)
+    assert db.calendar_events.count_documents({}) == 1
+
+    third = mod.sync_to_mongodb(db, settings=_settings(tmp_path))
+    assert int(third) == 0
+    assert db.calendar_sync_state.find_one({"_id": "calendar_events:cal"})["sync_token"] == "t3"
+
+
+def test_sync_to_mongodb_full_resync_on_410(monkeypatch, tmp_path):
+    import mongomock
+
+    db = mongomock.MongoClient().db
+    db.calendar_sync_state.insert_one({"_id": "calendar_events:cal", "sync_token": "old"})
+    db.calendar_events.insert_one({"id": "a", "etag": "1"})
+    service, calls = _sync_service(
+        [_FakeHttpError(410), {"items": [{"id": "a", "etag": "1"}], "nextSyncToken": "new"}]
+    )
+    monkeypatch.setattr(mod, "get_service", lambda settings=None: service)
+
+    result = mod.sync_to_mongodb(db, settings=_settings(tmp_path))
+
+    assert result.full_sync and result.unchanged == 1 and result.changed == 0
+    assert "timeMin" in calls[1] and "syncToken" not in calls[1]
+    assert db.calendar_sync_state.find_one({"_id": "calendar_events:cal"})["sync_token"] == "new"
+
+
+def test_sync_token_is_kept_per_target_collection(monkeypatch, tmp_path):
+    import mongomock
+
+    db = mongomock.MongoClient().db
+    db.calendar_sync_state.insert_one({"_id": "calendar_events:cal", "sync_token": "old"})
+    service, calls = _sync_service([{"items": [{"id": "a"}], "nextSyncToken": "t-events"}])
+    monkeypatch.setattr(mod, "get_service", lambda settings=None: service)
+
+    mod.sync_to_mongodb(db, collection_name="events", settings=_settings(tmp_path))
+
+    # "events" never stored what the calendar_events token covers.
+    assert "syncToken" not in calls[0] and "timeMin" in calls[0]
+    assert db.calendar_sync_state.find_one({"_id": "calendar_events:cal"})["sync_token"] == "old"
+    state = db.calendar_sync_state.find_one({"_id": "events:cal"})
+    assert (state["sync_token"], state["collection"], state["calendar_id"]) == (
+        "t-events",
+        "events",
+        "cal",
+    )
+
+
+def test_full_resync_purges_events_missing_from_the_listing(monkeypatch, tmp_path):
+    import mongomock
+
+    db = mongomock.MongoClient().db
+    db.calendar_sync_state.insert_one({"_id": "calendar_events:cal", "sync_token": "old"})
+    start = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    for google_id, when in (("kept", start), ("gone", start), ("past", datetime(2020, 1, 1))):
+        db.calendar_events.insert_one(
+            {"google_id": google_id, "calendar_id": "cal", "event_time": when, "etag": "1"}
+        )
+    db.calendar_events.insert_one(
+        {"google_id": "other", "calendar_id": "cal2", "event_time": start}
+    )
+    listing = {"items": [{"id": "kept", "etag": "1"}], "nextSyncToken": "new"}
+    service, _ = _sync_service([_FakeHttpError(410), listing])
+    monkeypatch.setattr(mod, "get_service", lambda settings=None: service)
+    seen = []
+    monkeypatch.setattr(mod, "publish", seen.extend)
+
+    result = mod.sync_to_mongodb(
+        db,
+        settings=_settings(tmp_path),
+        time_min=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        to_doc=mod.build_event_doc,
+        key="google_id",
+    )
+
+    assert result.full_sync and result.deleted == 1
+    remaining = sorted(d["google_id"] for d in db.calendar_events.find())
+    assert remaining == ["kept", "other", "past"]
+    assert [(c.kind, c.google_id) for c in seen] == [(mod.CANCELLED, "gone")]
+
+
+def test_sync_publishes_only_real_changes(monkeypatch, tmp_path):
+    import mongomock
+
+    from services.google import change_events
+
+    db = mongomock.MongoClient().db
+    start = {"dateTime": "2025-01-01T10:00:00Z"}
+    service, _ = _sync_service(
+        [
+            {"items": [{"id": "a", "etag": "1", "summary": "Meet", "start": start}]},
+            # New etag, same content: hash matches, nothing is written.
+            {"items": [{"id": "a", "etag": "2", "summary": "Meet", "start": start}]},
+            {"items": [{"id": "a", "etag": "3", "summary": "Moved", "start": start}]},
+            {"items": [{"id": "a", "status": "cancelled"}]},
+        ]
+    )
+    monkeypatch.setattr(mod, "get_service", lambda settings=None: service)
+    seen = []
+    change_events.subscribe(seen.append)
+    try:
+        results = [
+            mod.sync_to_mongodb(
+                db, settings=_settings(tmp_path), to_doc=mod.build_event_doc, key="google_id"
+            )
+            for _ in range(4)
+        ]
+    finally:
+        change_events.unsubscribe(seen.append)
+
+    assert [r.unchanged for r in results] == [0, 1, 0, 0]
+    assert [c.kind for c in seen] == ["created", "updated", "cancelled"]
+    assert seen[1].payload()["title"] == "Moved"
+    assert db.calendar_events.count_documents({}) == 0
+
+
+def test_sync_multiple_calendars_tags_and_tracks_each(monkeypatch, tmp_path):
+    import mongomock
+
+    db = mongomock.MongoClient().db
+    service = MagicMock()
+    pages = {
+        "raids": {"items": [{"id": "r1", "summary": "Raid"}], "nextSyncToken": "tr"},
+        "diplo": RuntimeError("boom"),
+        "bank": {"items": [{"id": "b1"}, {"id": "b2"}], "nextSyncToken": "tb"},
+    }
+
+    def list_(**params):
+        request = MagicMock()
+        page = pages[params["calendarId"]]
+        if isinstance(page, Exception):
+            request.execute.side_effect = page
+        else:
+            request.execute.return_value = page
+        return request
+
+    service.events.return_value.list.side_effect = list_
+    monkeypatch.setattr(mod, "get_service", lambda settings=None: service)
+    creds = object()
+    https = []
+    monkeypatch.setattr(mod, "load_credentials", lambda settings=None: creds)
+    monkeypatch.setattr(mod, "authorized_http", lambda c: https.append(c) or MagicMock())
+    settings = mod.CalendarSettings(
+        token_path=tmp_path / "t.json",
+        calendar_id="raids",
+        scopes=[],
+        calendar_ids=["diplo", "bank"],
+    )
+
+    result = mod.sync_to_mongodb(db, settings=settings, to_doc=mod.build_event_doc, key="google_id")
+
+    assert settings.calendars() == ["raids", "diplo", "bank"]
+    assert result.changed == 3 and set(result.calendars) == {"raids", "bank"}
+    assert db.calendar_events.find_one({"google_id": "b1"})["calendar_id"] == "bank"
+    status = {row["calendar_id"]: row for row in mod.sync_status(db)}
+    assert status["bank"]["event_count"] == 2 and status["raids"]["event_count"] == 1
+    assert status["bank"]["lag_seconds"] >= 0
+    assert status["diplo"]["last_error"] == "boom" and status["diplo"]["synced_at"] is None
+    assert https == [creds] * 3
+    assert all(status[cal]["last_result"]["fetch_ms"] >= 0 for cal in ("raids", "bank"))
+
+
+def test_same_event_id_is_stored_per_calendar(monkeypatch, tmp_path):
+    import mongomock
+
+    db = mongomock.MongoClient().db
+    # Untagged document written before multi-calendar sync.
+    db.calendar_events.insert_one({"google_id": "shared", "title": "Old"})
+    service = MagicMock()
+    pages = {
+        "raids": {"items": [{"id": "shared", "summary": "Raid"}], "nextSyncToken": "tr"},
+        "bank": {"items": [{"id": "shared", "summary": "Bank"}], "nextSyncToken": "tb"},
+    }
+    service.events.return_value.list.side_effect = lambda **params: MagicMock(
+        execute=MagicMock(return_value=pages[params["calendarId"]])
+    )
+    monkeypatch.setattr(mod, "get_service", lambda settings=None: service)
+    monkeypatch.setattr(mod, "load_credentials", lambda settings=None: object())
+    monkeypatch.setattr(mod, "authorized_http", lambda c: None)
+    monkeypatch.setattr(mod, "_sync_concurrency", lambda: 1)
+    settings = mod.CalendarSettings(
+        token_path=tmp_path / "t.json", calendar_id="raids", scopes=[], calendar_ids=["bank"]
+    )
+
+    mod.sync_to_mongodb(db, settings=settings, to_doc=mod.build_event_doc, key="google_id")
+    pages["bank"] = {"items": [{"id": "shared", "status": "cancelled"}], "nextSyncToken": "tb2"}
+    pages["raids"] = {"items": [], "nextSyncToken": "tr2"}
+    result = mod.sync_to_mongodb(db, settings=settings, to_doc=mod.build_event_doc, key="google_id")
+
+    assert result.deleted == 1
+    docs = list(db.calendar_events.find({"google_id": "shared"}))
+    assert [(d["calendar_id"], d["title"]) for d in docs] == [("raids", "Raid")]
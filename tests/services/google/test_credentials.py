@@ -0,0 +1,95 @@
+import json
+from datetime import datetime, timedelta
+
+import services.google.calendar_sync as sync_mod
+import services.google.credentials as mod
+
+
+class FakeCreds:
+    def __init__(self, token="t1", expiry=None):
+        self.token = token
+        self.refresh_token = "r"
+        self.expiry = expiry
+        self.refreshed = 0
+
+    @property
+    def expired(self):
+        return self.expiry is not None and datetime.utcnow() >= self.expiry
+
+    def refresh(self, request):
+        self.refreshed += 1
+        self.token = f"t{self.refreshed + 1}"
+        self.expiry = datetime.utcnow() + timedelta(hours=1)
+
+    def to_json(self):
+        return json.dumps({"token": self.token})
+
+
+def test_manager_loads_once_and_reloads_replaced_file(tmp_path):
+    path = tmp_path / "token.json"
+    path.write_text("{}")
+    loads = []
+    manager = mod.CredentialManager(path, lambda: loads.append(1) or FakeCreds(), background=False)
+
+    first = manager.get()
+    assert manager.get() is first and len(loads) == 1 and manager.generation == 1
+
+    path.write_text('{"rotated": true}')
+    assert manager.get() is not first and manager.generation == 2
+
+
+def test_manager_refreshes_before_expiry_and_persists_atomically(monkeypatch, tmp_path):
+    monkeypatch.setattr(mod, "Request", lambda: object())
+    path = tmp_path / "token.json"
+    path.write_text("{}")
+    creds = FakeCreds(expiry=datetime.utcnow() + timedelta(seconds=60))
+    manager = mod.CredentialManager(path, lambda: creds, margin=300, background=False)
+
+    assert manager.get() is creds and creds.refreshed == 0  # still valid
+    assert manager._due(manager.margin)  # the background refresher would act now
+
+    manager.refresh()
+
+    assert creds.refreshed == 1
+    assert json.loads(path.read_text()) == {"token": "t2"}
+    assert list(tmp_path.iterdir()) == [path]
+    # Our own write is not mistaken for an external token rotation.
+    assert manager.get() is creds and manager.generation == 1
+
+    creds.expiry = datetime.utcnow() - timedelta(seconds=1)
+    manager.get()
+    assert creds.refreshed == 2
+
+
+def test_get_service_rebuilds_after_token_rotation(monkeypatch, tmp_path):
+    monkeypatch.setenv("GOOGLE_TOKEN_BACKGROUND_REFRESH", "0")
+    monkeypatch.setattr(sync_mod, "build", lambda *a, **k: object())
+    path = tmp_path / "token.json"
+    info = {
+        "client_id": "id",
+        "client_secret": "s",
+        "refresh_token": "r",
+        "token": "a",
+        "expiry": "2999-01-01T00:00:00Z",
+    }
+    path.write_text(json.dumps(info))
+    settings = sync_mod.CalendarSettings(token_path=path, calendar_id="cal", scopes=[])
+
+    service = sync_mod.get_service(settings)
+    assert sync_mod.get_service(settings) is service
+
+    path.write_text(json.dumps({**info, "token": "rotated"}))
+    assert sync_mod.get_service(settings) is not service
+
+
+def test_write_token_atomic_keeps_private_mode(tmp_path):
+    path = tmp_path / "token.json"
+    path.write_text("{}")
+    path.chmod(0o600)
+
+    mod.write_token_atomic(path, '{"token": "new"}')
+    assert path.stat().st_mode & 0o777 == 0o600
+
+    fresh = tmp_path / "fresh.json"
+    mod.write_token_atomic(fresh, "{}")
+    assert fresh.stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,151 @@
+from datetime import datetime, timedelta, timezone
+
+import mongomock
+import pytest
+from flask import Flask
+
+import services.google.sync_coordinator as coord_mod
+from services.google.push_channel import LocalPushNotifier, PushChannelManager
+
+
+@pytest.fixture
+def db():
+    return mongomock.MongoClient().db
+
+
+def _manager(db, notifier, **kwargs):
+    return PushChannelManager(db, lambda: notifier, address="https://example/notify", **kwargs)
+
+
+def test_channel_is_renewed_before_expiry(db):
+    notifier = LocalPushNotifier()
+    manager = _manager(db, notifier, ttl=timedelta(hours=2), renew_before=timedelta(hours=1))
+    now = datetime.now(timezone.utc)
+
+    assert manager.ensure_channel("cal", now)
+    first = next(iter(notifier.registered))
+    assert manager.ensure_channel("cal", now)
+    assert len(notifier.registered) == 1
+
+    assert manager.ensure_channel("cal", now + timedelta(minutes=90))
+    assert notifier.stopped == [first]
+    assert len(notifier.registered) == 1 and first not in notifier.registered
+
+
+def test_notification_triggers_sync_via_endpoint(db, monkeypatch):
+    from web.calendar_push_routes import calendar_push_blueprint
+
+    notifier = LocalPushNotifier()
+    syncs = []
+    monkeypatch.setenv("GOOGLE_PUSH_ADDRESS", "https://example/notify")
+    monkeypatch.setattr(coord_mod, "get_service", lambda settings=None: notifier)
+    monkeypatch.setattr(coord_mod, "sync_to_mongodb", lambda mongo_db, **kw: syncs.append(kw) or 1)
+    settings = type("S", (), {"calendar_id": "cal", "calendars": lambda self: ["cal"]})()
+    coordinator = coord_mod.CalendarSyncCoordinator(db, settings=settings, owner="me")
+    monkeypatch.setattr("web.calendar_push_routes.get_coordinator", lambda _db: coordinator)
+
+    monkeypatch.setattr(coordinator, "request_sync", coordinator.tick)
+
+    # First tick registers the channel and does the initial sync.
+    assert coordinator.tick() == 1
+    # Nothing pending and push active – idle ticks cost no Google call.
+    assert coordinator.tick() is None
+    assert len(syncs) == 1
+
+    app = Flask("push")
+    app.register_blueprint(calendar_push_blueprint)
+    client = app.test_client()
+    assert notifier.notify(client, "/google/calendar/notify", state="sync").status_code == 204
+    assert coordinator.tick() is None
+
+    assert notifier.notify(client, "/google/calendar/notify").status_code == 204
+    assert len(syncs) == 2
+    assert coordinator.tick() is None
+
+    bad = client.post("/google/calendar/notify", headers={"X-Goog-Channel-ID": "nope"})
+    assert bad.status_code == 403
+
+
+def test_pending_push_survives_failed_sync(db, monkeypatch):
+    notifier = LocalPushNotifier()
+    outcomes = [RuntimeError("Google down"), 1]
+
+    def fake_sync(mongo_db, **kw):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setenv("GOOGLE_PUSH_ADDRESS", "https://example/notify")
+    monkeypatch.setattr(coord_mod, "get_service", lambda settings=None: notifier)
+    monkeypatch.setattr(coord_mod, "sync_to_mongodb", fake_sync)
+    settings = type("S", (), {"calendar_id": "cal", "calendars": lambda self: ["cal"]})()
+    coordinator = coord_mod.CalendarSyncCoordinator(db, settings=settings, owner="me")
+    coordinator._last_sync = __import__("time").monotonic()  # fallback not due
+
+    coordinator.push.ensure_channel("cal")
+    channel_id, body = next(iter(notifier.registered.items()))
+    headers = {
+        "X-Goog-Channel-ID": channel_id,
+        "X-Goog-Channel-Token": body["token"],
+        "X-Goog-Resource-State": "exists",
+    }
+    assert coordinator.push.handle_notification(headers) == "cal"
+
+    assert coordinator.tick() is None  # sync failed, flag kept
+    assert coordinator.push.pending_since("cal") is not None
+    assert coordinator.tick() == 1
+    assert coordinator.push.pending_since("cal") is None
+
+    with pytest.raises(PermissionError):
+        coordinator.push.handle_notification({**headers, "X-Goog-Channel-Token": "wrong"})
+
+
+def test_tick_polls_when_push_unavailable(db, monkeypatch):
+    syncs = []
+    monkeypatch.setenv("GOOGLE_PUSH_ADDRESS", "https://example/notify")
+    monkeypatch.setattr(coord_mod, "get_service", lambda settings=None: None)
+    monkeypatch.setattr(coord_mod, "sync_to_mongodb", lambda mongo_db, **kw: syncs.append(kw) or 1)
+    settings = type("S", (), {"calendar_id": "cal", "calendars": lambda self: ["cal"]})()
+    coordinator = coord_mod.CalendarSyncCoordinator(db, settings=settings, owner="me")
+
+    coordinator.tick()
+    coordinator.tick()
+    assert len(syncs) == 2
+
+
+def test_push_bursts_coalesce_on_one_worker(db, monkeypatch):
+    import threading
+
+    settings = type("S", (), {"calendar_id": "cal", "calendars": lambda self: ["cal"]})()
+    coordinator = coord_mod.CalendarSyncCoordinator(db, settings=settings, owner="me")
+    started, release, done = threading.Event(), threading.Event(), threading.Event()
+    ticks = []
+
+    def slow_tick():
+        ticks.append(threading.current_thread().name)
+        started.set()
+        release.wait(5)
+        if len(ticks) == 2:
+            done.set()
+
+    monkeypatch.setattr(coordinator, "tick", slow_tick)
+
+    coordinator.request_sync()
+    assert started.wait(5)
+    worker = coordinator._worker
+    for _ in range(20):
+        coordinator.request_sync()
+    release.set()
+    assert done.wait(5)
+
+    assert coordinator._worker is worker
+    assert len(ticks) == 2  # one running tick, the burst folded into one more
+
+
+def test_push_mode_ticks_on_the_short_check_interval(monkeypatch):
+    monkeypatch.delenv("GOOGLE_PUSH_ADDRESS", raising=False)
+    assert coord_mod.tick_interval_minutes(5) == 5
+    monkeypatch.setenv("GOOGLE_PUSH_ADDRESS", "https://example/notify")
+    monkeypatch.setenv("GOOGLE_PUSH_CHECK_SECONDS", "30")
+    assert coord_mod.tick_interval_minutes(5) == 0.5
@@ -9,14 +9,18 @@ def test_start_google_sync_runs_job_with_app_context(monkeypatch):
     mongo_db = object()
     called = {}
 
-    def fake_sync_to_mongodb(*, mongo_db: object, **kwargs):
-        from flask import current_app
+    class FakeCoordinator:
+        def __init__(self, db):
+            self.db = db
 
-        called["app"] = current_app.name
-        called["db"] = mongo_db
-        return 1
+        def tick(self):
+            from flask import current_app
 
-    monkeypatch.setattr(task_mod, "sync_to_mongodb", fake_sync_to_mongodb)
+            called["app"] = current_app.name
+            called["db"] = self.db
+            return 1
+
+    monkeypatch.setattr(task_mod, "get_coordinator", FakeCoordinator)
 
     class DummyScheduler:
         def __init__(self):
@@ -40,3 +44,74 @@ def test_start_google_sync_runs_job_with_app_context(monkeypatch):
     scheduler.jobs[0]()
     assert called["app"] == app.name
     assert called["db"] is mongo_db
+
+
+def test_coordinator_syncs_only_with_lease(monkeypatch):
+    import mongomock
+
+    import services.google.sync_coordinator as coord_mod
+
+    db = mongomock.MongoClient().db
+    calls = []
+    monkeypatch.setattr(
+        coord_mod, "sync_to_mongodb", lambda mongo_db, **kw: calls.append(kw) or "ok"
+    )
+
+    leader = coord_mod.CalendarSyncCoordinator(db, settings=object(), owner="a")
+    follower = coord_mod.CalendarSyncCoordinator(db, settings=object(), owner="b")
+
+    assert leader.sync_once() == "ok"
+    assert follower.sync_once() is None
+    assert leader.sync_once() == "ok"
+    assert [c["collection_name"] for c in calls] == ["events", "events"]
+
+    leader.lease.release()
+    assert follower.sync_once() == "ok"
+
+
+def test_coordinator_rearms_reminders_for_moved_events():
+    from datetime import datetime, timezone
+
+    import mongomock
+
+    import services.google.sync_coordinator as coord_mod
+    from services.google.change_events import EventChange
+
+    db = mongomock.MongoClient().db
+    db.reminders_sent.insert_many([{"event_id": 1, "user_id": 7}, {"event_id": 2, "user_id": 7}])
+    coordinator = coord_mod.CalendarSyncCoordinator(db, settings=object(), owner="a")
+    old = datetime(2025, 1, 1, 10, 0)
+    moved = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    same = {"event_time": old.replace(tzinfo=timezone.utc)}
+    coordinator._reschedule_reminders(
+        EventChange("updated", "g1", event_id=1, doc=same, previous_time=old)
+    )
+    assert db.reminders_sent.count_documents({}) == 2
+
+    coordinator._reschedule_reminders(
+        EventChange("updated", "g1", event_id=1, doc={"event_time": moved}, previous_time=old)
+    )
+    coordinator._reschedule_reminders(EventChange("cancelled", "g2", event_id=2))
+    assert db.reminders_sent.count_documents({}) == 0
+
+
+def test_only_the_shared_coordinator_listens_for_changes(monkeypatch):
+    import mongomock
+
+    import services.google.sync_coordinator as coord_mod
+    from services.google import change_events
+
+    monkeypatch.setattr(change_events, "_listeners", [])
+    monkeypatch.setattr(coord_mod, "_coordinators", {})
+    db = mongomock.MongoClient().db
+
+    coord_mod.CalendarSyncCoordinator(db, settings=object(), owner="a")
+    assert change_events._listeners == []
+
+    shared = coord_mod.get_coordinator(db)
+    assert coord_mod.get_coordinator(db) is shared
+    assert change_events._listeners == [shared._reschedule_reminders]
+
+    shared.close()
+    assert change_events._listeners == []
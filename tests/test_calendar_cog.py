@@ -1,5 +1,4 @@
 import importlib
-import logging
 import pathlib
 import sys
 import types
@@ -138,7 +137,7 @@ async def test_setup_skips_duplicate_registration(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_sync_loop_builds_and_syncs(monkeypatch):
+async def test_sync_loop_ticks_coordinator(monkeypatch):
     cog = CalendarCog.__new__(CalendarCog)
 
     async def ready():
@@ -146,26 +145,26 @@ async def test_sync_loop_builds_and_syncs(monkeypatch):
 
     cog.bot = types.SimpleNamespace(wait_until_ready=ready)
 
-    called: dict[str, bool] = {}
+    called: dict[str, object] = {}
 
-    def setup_service(self):
-        called["setup"] = True
-
-        async def sync():
+    class FakeCoordinator:
+        def tick(self):
             called["sync"] = True
 
-        self.service = types.SimpleNamespace(service=object(), sync=sync)
+    def fake_get_coordinator(db):
+        called["db"] = db
+        return FakeCoordinator()
 
-    monkeypatch.setattr(CalendarCog, "setup_service", setup_service)
+    monkeypatch.setattr(CalendarCogModule, "get_coordinator", fake_get_coordinator)
 
     await CalendarCog.sync_loop(cog)
 
-    assert called.get("setup")
     assert called.get("sync")
+    assert called["db"] is not None
 
 
 @pytest.mark.asyncio
-async def test_sync_loop_skips_when_unconfigured(monkeypatch, caplog):
+async def test_sync_loop_survives_a_failing_tick(monkeypatch):
     cog = CalendarCog.__new__(CalendarCog)
 
     async def ready():
@@ -173,20 +172,55 @@ async def test_sync_loop_skips_when_unconfigured(monkeypatch, caplog):
 
     cog.bot = types.SimpleNamespace(wait_until_ready=ready)
 
-    called: dict[str, bool] = {}
+    class FailingCoordinator:
+        def tick(self):
+            raise RuntimeError("mongo down")
+
+    monkeypatch.setattr(CalendarCogModule, "get_coordinator", lambda db: FailingCoordinator())
+
+    await CalendarCog.sync_loop(cog)
+
+
+class GuildMember(DummyUser):
+    def __init__(self, uid: int) -> None:
+        super().__init__()
+        self.id = uid
+        self.bot = False
 
-    def setup_service(self):
-        called["setup"] = True
 
-        async def sync():
-            called["sync"] = True  # pragma: no cover - should not run
+@pytest.mark.asyncio
+async def test_send_reminders_renders_once_per_timezone(monkeypatch):
+    members = [GuildMember(1), GuildMember(2), GuildMember(3)]
+    guild = types.SimpleNamespace(members=members)
+    cog = CalendarCog.__new__(CalendarCog)
+    cog.bot = types.SimpleNamespace(get_guild=lambda gid: guild)
+
+    queries = []
 
-        self.service = types.SimpleNamespace(service=None, sync=sync)
+    class Users:
+        def find(self, query, projection=None):
+            queries.append(query)
+            return [
+                {"discord_id": "1", "timezone": "Asia/Tokyo"},
+                {"discord_id": "2", "timezone": "Asia/Tokyo"},
+            ]
 
-    monkeypatch.setattr(CalendarCog, "setup_service", setup_service)
+    monkeypatch.setattr(CalendarCogModule, "get_collection", lambda name: Users())
+    monkeypatch.setattr(CalendarCogModule, "t", lambda key, **k: key)
+    built = []
+    original = CalendarCog._build_events_embed
 
-    with caplog.at_level(logging.WARNING):
-        await CalendarCog.sync_loop(cog)
+    def counting_build(*args, **kwargs):
+        built.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(CalendarCog, "_build_events_embed", staticmethod(counting_build))
+
+    events = [{"title": "Ping", "event_time": datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)}]
+    await CalendarCog._send_reminders(cog, events, "calendar_today_title")
 
-    assert called.get("setup")
-    assert "Calendar service not configured" in caplog.text
+    assert len(queries) == 1
+    assert len(built) == 2
+    assert members[0].embed is members[1].embed
+    assert "21:00" in members[0].embed.fields[0].value
+    assert "12:00" in members[2].embed.fields[0].value
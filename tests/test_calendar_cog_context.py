@@ -4,7 +4,7 @@ import sys
 import types
 
 import pytest
-from flask import Flask, has_app_context
+from flask import Flask
 
 services_pkg = types.ModuleType("services")
 services_pkg.__path__ = [str(pathlib.Path(__file__).resolve().parents[1] / "services")]
@@ -56,38 +56,12 @@ async def test_calendar_cog_loops_without_app_context(monkeypatch):
 
     monkeypatch.setattr(calendar_cog, "should_send_daily", lambda dt: False)
     monkeypatch.setattr(calendar_cog, "should_send_weekly", lambda dt: False)
+    monkeypatch.setattr(
+        calendar_cog,
+        "get_coordinator",
+        lambda db: types.SimpleNamespace(tick=lambda: None),
+    )
 
     await cog.sync_loop()
     await cog.daily_loop()
     await cog.weekly_loop()
-
-
-@pytest.mark.asyncio
-async def test_sync_loop_builds_service_with_app_context(monkeypatch):
-    monkeypatch.setattr(calendar_cog.tasks.Loop, "start", lambda self: None)
-
-    called: dict[str, bool] = {}
-
-    class DummyService:
-        def __init__(self, *_, **__):
-            self.service = None
-
-        def _build_service(self) -> None:
-            called["build"] = has_app_context()
-            self.service = object()
-
-        async def sync(self) -> None:
-            called["sync"] = True
-
-    monkeypatch.setattr(calendar_cog, "CalendarService", DummyService)
-
-    async def ready():
-        return None
-
-    bot = types.SimpleNamespace(wait_until_ready=ready)
-    cog = calendar_cog.CalendarCog(bot)
-
-    await cog.sync_loop()
-
-    assert called.get("build") is True
-    assert called.get("sync")
@@ -78,12 +78,23 @@ async def test_list_upcoming_events_defaults(monkeypatch):
 @pytest.mark.asyncio
 async def test_sync_and_range_query_includes_date(monkeypatch):
     tokens_collection = InMemoryCollection()
-    service = CalendarService(events_collection=DummyCollection(), tokens_collection=tokens_collection)
+    service = CalendarService(
+        calendar_id="primary",
+        events_collection=DummyCollection(),
+        tokens_collection=tokens_collection,
+    )
 
     stored_docs: dict[str, dict] = {}
+    upserts: list[int] = []
+
+    async def fake_get_content_hashes(ids, *, calendar_id=None, col):  # noqa: D401
+        return {i: stored_docs[i] for i in ids if i in stored_docs}
 
-    async def fake_upsert_event(data, *, col):  # noqa: D401
-        stored_docs[data["google_id"]] = data
+    async def fake_upsert_events(docs, *, col):  # noqa: D401
+        upserts.append(len(docs))
+        for data in docs:
+            stored_docs[data["google_id"]] = data
+        return len(docs)
 
     async def fake_get_events_in_range(start, end, *, col):  # noqa: D401
         results = []
@@ -105,7 +116,9 @@ async def test_sync_and_range_query_includes_date(monkeypatch):
                     "summary": "Kickoff",
                     "start": {"dateTime": start_time.isoformat().replace("+00:00", "Z")},
                     "end": {
-                        "dateTime": (start_time + timedelta(hours=1)).isoformat().replace("+00:00", "Z")
+                        "dateTime": (start_time + timedelta(hours=1))
+                        .isoformat()
+                        .replace("+00:00", "Z")
                     },
                     "status": "confirmed",
                     "updated": "2024-12-31T00:00:00+00:00",
@@ -114,13 +127,17 @@ async def test_sync_and_range_query_includes_date(monkeypatch):
             "nextSyncToken": "token-1",
         }
 
-    monkeypatch.setattr(event_crud, "upsert_event", fake_upsert_event)
+    monkeypatch.setattr(event_crud, "get_content_hashes", fake_get_content_hashes)
+    monkeypatch.setattr(event_crud, "upsert_events", fake_upsert_events)
     monkeypatch.setattr(event_crud, "get_events_in_range", fake_get_events_in_range)
     monkeypatch.setattr(CalendarService, "_build_service", fake_build_service, raising=False)
     monkeypatch.setattr(CalendarService, "_api_list", fake_api_list, raising=False)
 
     count = await service.sync()
     assert count == 1
+    # Same content again: hash matches, nothing is written.
+    assert await service.sync() == 1
+    assert upserts == [1]
 
     stored_doc = stored_docs["event-1"]
     assert stored_doc["date"].startswith("2025-01-01T12:00:00")
@@ -131,3 +148,94 @@ async def test_sync_and_range_query_includes_date(monkeypatch):
 
     assert events
     assert events[0]["date"] == stored_doc["date"]
+
+
+@pytest.mark.asyncio
+async def test_sync_keeps_token_per_calendar(monkeypatch):
+    tokens_collection = InMemoryCollection()
+    tokens_collection.data["google"] = {"token": "legacy"}
+    service = CalendarService(
+        calendar_id="raids",
+        calendar_ids=["bank"],
+        events_collection=DummyCollection(),
+        tokens_collection=tokens_collection,
+    )
+    stored: list[dict] = []
+    seen_params: list[dict] = []
+
+    async def fake_get_content_hashes(ids, *, calendar_id=None, col):  # noqa: D401
+        return {}
+
+    async def fake_upsert_events(docs, *, col):  # noqa: D401
+        stored.extend(docs)
+        return len(docs)
+
+    def fake_build_service(self):  # noqa: D401
+        self.service = object()
+
+    async def fake_api_list(self, params):  # noqa: D401
+        seen_params.append(params)
+        cal = params["calendarId"]
+        return {"items": [{"id": f"{cal}-1", "summary": cal}], "nextSyncToken": f"t-{cal}"}
+
+    monkeypatch.setattr(event_crud, "get_content_hashes", fake_get_content_hashes)
+    monkeypatch.setattr(event_crud, "upsert_events", fake_upsert_events)
+    monkeypatch.setattr(CalendarService, "_build_service", fake_build_service, raising=False)
+    monkeypatch.setattr(CalendarService, "_api_list", fake_api_list, raising=False)
+
+    assert await service.sync() == 2
+
+    by_cal = {p["calendarId"]: p for p in seen_params}
+    assert by_cal["raids"]["syncToken"] == "legacy"
+    assert "syncToken" not in by_cal["bank"]
+    assert {d["google_id"]: d["calendar_id"] for d in stored} == {
+        "raids-1": "raids",
+        "bank-1": "bank",
+    }
+    assert tokens_collection.data["bank"]["token"] == "t-bank"
+    assert tokens_collection.data["raids"]["changed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_ensure_service_rebuilds_only_on_new_credential_generation(monkeypatch):
+    import threading
+    import types
+
+    service = CalendarService(
+        events_collection=DummyCollection(), tokens_collection=DummyCollection()
+    )
+    manager = types.SimpleNamespace(generation=1)
+    builds = []
+    loop_thread = threading.get_ident()
+
+    def fake_build_service(self):  # noqa: D401
+        builds.append(threading.get_ident())
+        self.service = object()
+        self._credentials = manager
+        self._generation = manager.generation
+        self._checked_at = __import__("time").monotonic()
+
+    monkeypatch.setattr(CalendarService, "_build_service", fake_build_service, raising=False)
+
+    await service._ensure_service()
+    await service._ensure_service()
+    assert len(builds) == 1 and builds[0] != loop_thread  # built off the event loop
+
+    manager.generation = 2  # token file replaced and reloaded elsewhere
+    await service._ensure_service()
+    assert len(builds) == 2
+
+
+def test_unconfigured_primary_calendar_is_not_synced(monkeypatch):
+    import services.calendar_service as calendar_service_module
+
+    settings = type("S", (), {"calendar_id": None, "calendar_ids": ["bank"]})()
+    settings.token_path = "token.json"
+    settings.scopes = []
+    monkeypatch.setattr(calendar_service_module, "get_google_calendar_settings", lambda: settings)
+
+    service = CalendarService(
+        events_collection=DummyCollection(), tokens_collection=InMemoryCollection()
+    )
+
+    assert service.calendar_ids == ["bank"]
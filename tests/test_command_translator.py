@@ -22,3 +22,51 @@ def test_translator_command_name(monkeypatch):
         translator.translate(app_commands.locale_str("cmd_ping_name"), discord.Locale.german, ctx)
     )
     assert result == "ping"
+
+
+def _ctx():
+    return app_commands.TranslationContext(
+        location=app_commands.TranslationContextLocation.command_name, data=None
+    )
+
+
+def test_table_is_persisted_and_reused(monkeypatch, tmp_path):
+    source = tmp_path / "translations"
+    source.mkdir()
+    (source / "de.json").write_text('{"cmd_ping_name": "ping"}')
+    monkeypatch.setattr("bot.translator.TRANSLATION_FOLDER", str(source))
+    calls = []
+    monkeypatch.setattr(
+        "bot.translator.t", lambda key, default=None, lang=None: calls.append(key) or "ping"
+    )
+    path = tmp_path / "command_table.cache"
+    string = app_commands.locale_str("cmd_ping_name")
+
+    first = MyTranslator(str(path))
+    asyncio.run(first.translate(string, discord.Locale.german, _ctx()))
+    asyncio.run(first.translate(string, discord.Locale.german, _ctx()))
+    assert calls == ["cmd_ping_name"]
+    asyncio.run(first.unload())
+
+    second = MyTranslator(str(path))
+    asyncio.run(second.load())
+    assert asyncio.run(second.translate(string, discord.Locale.german, _ctx())) == "ping"
+    assert calls == ["cmd_ping_name"]
+
+    # Changed translation files invalidate the persisted table.
+    (source / "de.json").write_text('{"cmd_ping_name": "pong!"}')
+    third = MyTranslator(str(path))
+    asyncio.run(third.load())
+    assert third.table == {}
+
+
+def test_unload_unregisters_the_reload_listener(monkeypatch, tmp_path):
+    monkeypatch.setattr(i18n, "_reload_listeners", [])
+    translator = MyTranslator(str(tmp_path / "command_table.cache"))
+
+    asyncio.run(translator.load())
+    asyncio.run(translator.load())
+    assert i18n._reload_listeners == [translator._forget]
+
+    asyncio.run(translator.unload())
+    assert i18n._reload_listeners == []
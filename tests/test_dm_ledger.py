@@ -0,0 +1,91 @@
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import discord
+import mongomock
+import pytest
+
+from bot import dm_ledger as mod
+
+
+@pytest.fixture
+def db(monkeypatch):
+    database = mongomock.MongoClient().db
+    monkeypatch.setattr(mod, "get_collection", lambda name: database[name])
+    return database
+
+
+def _forbidden() -> discord.Forbidden:
+    return discord.Forbidden(SimpleNamespace(status=403, reason="Forbidden"), "closed")
+
+
+class FakeUser:
+    def __init__(self, uid: int, error: Exception | None = None) -> None:
+        self.id = uid
+        self.error = error
+        self.sent: list = []
+
+    async def send(self, *args, **kwargs):
+        if self.error:
+            raise self.error
+        self.sent.append(args or kwargs)
+
+
+def test_forbidden_recipient_is_suppressed(db, monkeypatch):
+    ledger = mod.DeliveryLedger(batch_size=100, recheck_days=7)
+    monkeypatch.setattr(mod, "ledger", ledger)
+
+    outcome = asyncio.run(mod.deliver(FakeUser(1, _forbidden()), "newsletter", "hi"))
+    asyncio.run(mod.deliver(FakeUser(2), "newsletter", "hi"))
+    ledger.flush()
+
+    assert outcome == mod.OUTCOME_FORBIDDEN
+    assert db["dm_delivery_log"].count_documents({}) == 2
+    assert ledger.suppressed_ids([1, 2]) == {1}
+    # a fresh ledger (e.g. after restart) sees the persisted suppression
+    assert mod.DeliveryLedger().is_suppressed(1)
+
+
+def test_recheck_after_interval_and_release_on_success(db):
+    ledger = mod.DeliveryLedger(recheck_days=7)
+    ledger.record(5, "reminder", mod.OUTCOME_FORBIDDEN)
+    ledger.flush()
+
+    later = datetime.utcnow() + timedelta(days=8)
+    assert ledger.suppressed_ids([5], now=later) == set()
+
+    ledger.record(5, "reminder", mod.OUTCOME_SENT)
+    ledger.flush()
+    assert db["dm_suppression"].count_documents({}) == 0
+
+
+def test_repeated_failures_back_off(db):
+    ledger = mod.DeliveryLedger(recheck_days=7, max_recheck_days=10)
+    ledger.record(7, "intro", mod.OUTCOME_FORBIDDEN)
+    ledger.flush()
+    ledger.suppressed_ids([7], now=datetime.utcnow() + timedelta(days=8))
+    ledger.record(7, "intro", mod.OUTCOME_FORBIDDEN)
+    ledger.flush()
+
+    doc = db["dm_suppression"].find_one({"_id": 7})
+    assert doc["strikes"] == 2
+    assert doc["recheck_at"] - doc["last_failure"] == timedelta(days=10)
+
+
+def test_suppressed_outcome_writes_no_rows(db):
+    ledger = mod.DeliveryLedger()
+    ledger.record(9, "broadcast", mod.OUTCOME_SUPPRESSED)
+    ledger.flush()
+    assert db["dm_delivery_log"].count_documents({}) == 0
+
+
+def test_reset_drops_buffers_and_local_view(db):
+    ledger = mod.DeliveryLedger()
+    ledger.record(9, "newsletter", mod.OUTCOME_FORBIDDEN)
+    assert ledger.is_suppressed(9)
+
+    ledger.reset()
+    ledger.flush()
+    assert not ledger.is_suppressed(9)
+    assert db["dm_delivery_log"].count_documents({}) == 0
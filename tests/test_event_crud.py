@@ -40,3 +40,79 @@ async def test_get_and_delete_by_guild():
     assert len(events) == 1
     deleted = await event_crud.delete_event_by_id(events[0].id)
     assert deleted == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_event_removes_its_occurrences(monkeypatch):
+    from datetime import datetime
+
+    from utils import recurrence
+
+    # Materializers are cached per database name; start from a fresh cache.
+    monkeypatch.setattr(recurrence, "_materializers", {})
+    col = event_crud.collection
+    series = {"title": "Raid", "event_time": datetime(2025, 1, 1, 20), "recurrence": "daily"}
+    series_id = (await asyncio.to_thread(col.insert_one, series)).inserted_id
+    occurrences = col.database["event_occurrences"]
+    occurrences.insert_many(
+        [{"series_id": series_id, "occurrence_time": datetime(2025, 1, d, 20)} for d in (2, 3)]
+        + [{"series_id": "other", "occurrence_time": datetime(2025, 1, 2, 20)}]
+    )
+
+    assert await event_crud.delete_event_by_id(series_id) == 1
+    assert [o["series_id"] for o in occurrences.find()] == ["other"]
+
+
+@pytest.mark.asyncio
+async def test_upsert_events_in_chunks():
+    col = event_crud.collection
+    docs = [{"google_id": f"g{i}", "title": f"E{i}"} for i in range(5)] + [{"title": "no id"}]
+    assert await event_crud.upsert_events(docs, chunk_size=2) == 5
+
+    docs[0]["title"] = "changed"
+    assert await event_crud.upsert_events(docs[:2], chunk_size=2) == 1
+    assert col.count_documents({}) == 5
+    assert col.find_one({"google_id": "g0"})["title"] == "changed"
+
+
+@pytest.mark.asyncio
+async def test_upsert_events_keys_on_calendar_and_google_id():
+    col = event_crud.collection
+    col.insert_one({"google_id": "g", "title": "legacy"})
+    known = await event_crud.get_content_hashes(["g"], calendar_id="raids")
+    docs = [
+        {"_id": known["g"]["_id"], "google_id": "g", "calendar_id": "raids", "title": "R"},
+        {"google_id": "g", "calendar_id": "bank", "title": "B"},
+    ]
+    assert await event_crud.upsert_events(docs) == 2
+
+    titles = {d["calendar_id"]: d["title"] for d in col.find({"google_id": "g"})}
+    assert titles == {"raids": "R", "bank": "B"}
+    bank = await event_crud.get_content_hashes(["g"], calendar_id="bank")
+    assert bank["g"]["calendar_id"] == "bank"
+
+
+@pytest.mark.asyncio
+async def test_upsert_events_awaits_motor_futures_on_the_loop(monkeypatch):
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    backing = event_crud.collection
+    motor_col = AsyncIOMotorClient("mongodb://localhost:1", connect=False).testdb.events
+    loop = asyncio.get_running_loop()
+    calls = []
+
+    def bulk_write(ops, ordered=True):
+        # Motor resolves a Future from its executor; it must be called on the loop.
+        assert asyncio.get_running_loop() is loop
+        calls.append(len(ops))
+        fut = loop.create_future()
+        fut.set_result(backing.bulk_write(ops, ordered=ordered))
+        return fut
+
+    monkeypatch.setattr(motor_col, "bulk_write", bulk_write, raising=False)
+    monkeypatch.setattr(event_crud, "collection", motor_col)
+
+    docs = [{"google_id": f"m{i}", "title": f"M{i}"} for i in range(3)]
+    assert await event_crud.upsert_events(docs, chunk_size=2) == 3
+    assert calls == [2, 1]
+    assert backing.count_documents({}) == 3
@@ -10,18 +10,19 @@ class FakeEvents:
     def __init__(self, docs):
         self.docs = docs
 
-    def find(self, query):
+    def find(self, query, projection=None):
         self.query = query
         return self
 
     def sort(self, *_, **__):
-        start = self.query["event_time"]["$gte"]
-        end = self.query["event_time"]["$lt"]
-        result = [d for d in self.docs if start <= d["event_time"] < end]
-        return sorted(result, key=lambda d: d["event_time"])
+        ((field, bounds),) = self.query.items()
+        result = [d for d in self.docs if bounds["$gte"] <= d[field] < bounds["$lt"]]
+        return sorted(result, key=lambda d: d[field])
 
 
 def fake_get_collection(name):
+    if name == "event_occurrences":
+        return FakeEvents([])
     return FakeEvents(
         [
             {"title": "A", "event_time": datetime(2025, 1, 1, 22, 0, tzinfo=timezone.utc)},
@@ -46,6 +47,20 @@ def test_get_events_for_tomorrow(monkeypatch):
     assert events[0]["title"] == "B"
 
 
+def test_get_events_for_includes_occurrences(monkeypatch):
+    when = datetime(2025, 1, 1, 18, 0, tzinfo=timezone.utc)
+    occurrence = {"title": "Raid", "series_id": 7, "occurrence_time": when, "event_time": when}
+
+    def get_collection(name):
+        if name == "event_occurrences":
+            return FakeEvents([occurrence])
+        return fake_get_collection(name)
+
+    monkeypatch.setattr(mod, "get_collection", get_collection)
+    events = mod.get_events_for(datetime(2025, 1, 1, 12, 0, tzinfo=ZoneInfo("Europe/Berlin")))
+    assert [e["title"] for e in events] == ["Raid", "A"]
+
+
 def test_format_events(monkeypatch):
     events = [
         {"title": "X", "event_time": datetime(2025, 1, 1, 8, 0)},
@@ -0,0 +1,151 @@
+import json
+
+from fur_lang import i18n
+from fur_lang.catalog import LanguageCache
+
+
+def _catalogs(monkeypatch, data):
+    monkeypatch.setattr(i18n, "translations", data)
+    monkeypatch.setattr(i18n, "_negotiated", {})
+
+
+def test_negotiate_lang_normalizes_and_falls_back(monkeypatch):
+    _catalogs(monkeypatch, {"en": {}, "de": {}, "nb": {}, "pt-BR": {}})
+
+    assert i18n.negotiate_lang("de") == "de"
+    assert i18n.negotiate_lang("en-US") == "en"
+    assert i18n.negotiate_lang("pt_br") == "pt-BR"
+    assert i18n.negotiate_lang("no") == "nb"
+    assert i18n.negotiate_lang("zh-CN") == i18n.LANG_FALLBACK
+    assert i18n._negotiated["zh-CN"] == i18n.LANG_FALLBACK
+
+
+def test_t_never_reloads_for_unknown_locale(monkeypatch, tmp_path):
+    (tmp_path / "en.json").write_text('{"hello": "Hello {name}"}', encoding="utf-8")
+    loads = []
+
+    def loader(lang):
+        loads.append(lang)
+        return i18n._load_language(lang, str(tmp_path))
+
+    _catalogs(monkeypatch, LanguageCache(str(tmp_path), loader))
+
+    for _ in range(3):
+        assert i18n.t("hello", lang="es-ES", name="Ana") == "Hello Ana"
+    assert loads == ["en"]
+
+    i18n.reload_translations()
+    assert i18n._negotiated == {}
+    i18n.t("hello", lang="en", name="Ana")
+    assert loads == ["en", "en"]
+
+
+def test_missing_keys_are_written_behind_once(monkeypatch, tmp_path):
+    (tmp_path / "en.json").write_text('{"known": "Known"}', encoding="utf-8")
+    _catalogs(monkeypatch, {"en": {"known": "Known"}})
+    monkeypatch.setattr(i18n, "TRANSLATION_FOLDER", str(tmp_path))
+    monkeypatch.setattr(i18n, "_missing_seen", set())
+    monkeypatch.setattr(i18n, "_missing_pending", {})
+    monkeypatch.setattr(i18n, "MISSING_FLUSH_SECONDS", 3600)
+    monkeypatch.setenv("I18N_RECORD_MISSING", "1")
+
+    for _ in range(3):
+        assert i18n.t("new_key", default="New", lang="en") == "New"
+    # Nothing was written synchronously.
+    assert json.loads((tmp_path / "en.json").read_text()) == {"known": "Known"}
+    assert i18n._missing_pending == {"new_key": "New"}
+    i18n._flush_timer.cancel()
+
+    assert i18n.flush_missing() == 1
+    assert json.loads((tmp_path / "en.json").read_text()) == {"known": "Known", "new_key": "New"}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["en.json"]
+    assert i18n.flush_missing() == 0
+
+
+def test_missing_keys_not_recorded_in_production(monkeypatch):
+    _catalogs(monkeypatch, {"en": {}})
+    monkeypatch.setattr(i18n, "_missing_seen", set())
+    monkeypatch.setattr(i18n, "_missing_pending", {})
+    monkeypatch.setenv("FLASK_ENV", "production")
+    monkeypatch.delenv("I18N_RECORD_MISSING", raising=False)
+
+    assert i18n.t("other_key", default="Other", lang="en") == "Other"
+    assert i18n._missing_pending == {}
+
+
+def test_templates_are_compiled_once_and_render_like_format(monkeypatch):
+    _catalogs(
+        monkeypatch,
+        {
+            "en": {
+                "hi": "Hi {name:>5}!",
+                "plain": "Plain {{x}}",
+                "n": {"one": "{n} item", "other": "{n} items"},
+            }
+        },
+    )
+    monkeypatch.setattr(i18n, "_templates", {})
+
+    assert i18n.t("hi", lang="en", name="Bo") == "Hi    Bo!"
+    assert i18n.t("plain", lang="en") == "Plain {x}"
+    assert i18n.t("n", lang="en", count=2, n=2) == "2 items"
+    assert i18n.t("n", lang="en", count=1, n=1) == "1 item"
+    assert ("en", "n", "other") in i18n._templates
+
+    compiled = i18n._templates[("en", "hi", None)]
+    i18n.t("hi", lang="en", name="Al")
+    assert i18n._templates[("en", "hi", None)] is compiled
+
+
+def test_invalid_placeholders_fall_back_to_reference_language(monkeypatch):
+    _catalogs(
+        monkeypatch,
+        {
+            "en": {"greet": "Hello {name}"},
+            "sq": {"greet": "Përshëndetje {Emri}", "broken": "Gabim {"},
+        },
+    )
+    monkeypatch.setattr(i18n, "_invalid", {})
+    monkeypatch.setattr(i18n, "_templates", {})
+
+    i18n.validate_placeholders()
+
+    assert i18n._invalid["sq"] == {"greet", "broken"}
+    assert i18n.t("greet", lang="sq", name="Ana") == "Hello Ana"
+
+
+def test_language_table_is_built_once(monkeypatch):
+    _catalogs(monkeypatch, {"ar": {}, "de": {}, "xx": {}})
+    i18n.language_info.cache_clear()
+    parses = []
+    parse = i18n.Locale.parse
+    monkeypatch.setattr(i18n.Locale, "parse", lambda code: parses.append(code) or parse(code))
+
+    table = i18n.language_table()
+    parsed = len(parses)
+    assert list(table) == ["ar", "de", "xx"]
+    assert table["ar"].rtl and not table["de"].rtl
+    assert table["de"].native_name == "Deutsch"
+    assert table["de"].flag == "flags/de.png" and table["xx"].flag is None
+
+    assert i18n.language_table() is table
+    assert i18n.is_rtl("ar") and i18n.get_language_native_name("de") == "Deutsch"
+    assert len(parses) == parsed
+    i18n.language_info.cache_clear()
+
+
+def test_refresh_translations_revalidates_changed_language(monkeypatch, tmp_path):
+    (tmp_path / "en.json").write_text('{"hi": "Hi {name}"}', encoding="utf-8")
+    (tmp_path / "de.json").write_text('{"hi": "Hallo {nam}"}', encoding="utf-8")
+    cache = LanguageCache(str(tmp_path), lambda lang: i18n._load_language(lang, str(tmp_path)))
+    _catalogs(monkeypatch, cache)
+    monkeypatch.setattr(i18n, "_invalid", {})
+    seen = []
+    monkeypatch.setattr(i18n, "_reload_listeners", [seen.append])
+
+    assert i18n.t("hi", lang="de", name="Ana") == "Hi Ana"
+
+    (tmp_path / "de.json").write_text('{"hi": "Hallo {name}!"}', encoding="utf-8")
+    i18n.refresh_translations({"de"})
+    assert i18n.t("hi", lang="de", name="Ana") == "Hallo Ana!"
+    assert seen == [{"de"}]
@@ -30,6 +30,9 @@ async def test_maybe_send_intro(monkeypatch, tmp_path):
         def find_one(self, q):
             return flags.get("flag")
 
+        def find(self, q, projection=None):
+            return []
+
         def update_one(self, q, u, upsert=False):
             flags["flag"] = u["$set"]
 
@@ -45,14 +48,96 @@ async def test_maybe_send_intro(monkeypatch, tmp_path):
         return user
 
     fake_bot = types.SimpleNamespace(
+        get_user=lambda uid: None,
         fetch_user=dummy_fetch,
         wait_until_ready=dummy_wait,
         loop=asyncio.get_event_loop(),
     )
 
-    cog = mod.IntroCog.__new__(mod.IntroCog)
-    cog.bot = fake_bot
+    cog = mod.IntroCog(fake_bot)
     await mod.IntroCog._maybe_send_intro(cog)
 
     assert user.sent
     assert flags["flag"]["value"] is True
+
+
+@pytest.mark.asyncio
+async def test_rollout_resumes_without_resending(monkeypatch, tmp_path):
+    intro_json = tmp_path / "intro.json"
+    intro_json.write_text(json.dumps({"embeds": [{"title": "T"}]}))
+    monkeypatch.setattr(mod, "INTRO_JSON", intro_json)
+
+    markers = {2: {"outcome": "sent"}}
+
+    class Markers:
+        def find(self, q, projection=None):
+            return [{"_id": uid} for uid in q["_id"]["$in"] if uid in markers]
+
+        def update_one(self, q, u, upsert=False):
+            markers[q["_id"]] = u["$set"]
+
+    monkeypatch.setattr(mod, "get_collection", lambda name: Markers())
+    monkeypatch.setattr(mod, "get_dm_users", lambda: [1, 2, 3])
+
+    users = {uid: FakeUser() for uid in (1, 2, 3)}
+
+    async def dummy_fetch(uid):
+        return users[uid]
+
+    fake_bot = types.SimpleNamespace(get_user=lambda uid: None, fetch_user=dummy_fetch)
+    cog = mod.IntroCog(fake_bot)
+    await cog._send_intro()
+
+    assert not users[2].sent
+    assert users[1].sent and users[3].sent
+    assert set(markers) == {1, 2, 3}
+    assert cog.progress == {"total": 2, "done": 2, "sent": 2, "failed": 0}
+
+
+@pytest.mark.asyncio
+async def test_errored_users_keep_the_rollout_pending(monkeypatch, tmp_path):
+    intro_json = tmp_path / "intro.json"
+    intro_json.write_text(json.dumps({"embeds": [{"title": "T"}]}))
+    monkeypatch.setattr(mod, "INTRO_JSON", intro_json)
+
+    flags: dict = {}
+    markers: dict = {}
+
+    class FakeCollection:
+        def find_one(self, q):
+            flag = flags.get(q["_id"])
+            return flag if flag and flag["value"] == q["value"] else None
+
+        def find(self, q, projection=None):
+            return [{"_id": uid} for uid in q["_id"]["$in"] if uid in markers]
+
+        def update_one(self, q, u, upsert=False):
+            (flags if q["_id"] == "ai_intro_sent" else markers)[q["_id"]] = u["$set"]
+
+    monkeypatch.setattr(mod, "get_collection", lambda name: FakeCollection())
+    monkeypatch.setattr(mod, "get_dm_users", lambda: [1, 2])
+
+    users = {1: FakeUser(), 2: FakeUser()}
+    down = {2}
+
+    async def dummy_wait() -> None:
+        pass
+
+    async def dummy_fetch(uid):
+        if uid in down:
+            raise RuntimeError("gateway hiccup")
+        return users[uid]
+
+    fake_bot = types.SimpleNamespace(
+        get_user=lambda uid: None, fetch_user=dummy_fetch, wait_until_ready=dummy_wait
+    )
+    cog = mod.IntroCog(fake_bot)
+
+    await cog._maybe_send_intro()
+    assert flags["ai_intro_sent"]["value"] == "partial"
+    assert set(markers) == {1}
+
+    down.clear()
+    await cog._maybe_send_intro()
+    assert users[2].sent and set(markers) == {1, 2}
+    assert flags["ai_intro_sent"]["value"] is True
@@ -0,0 +1,50 @@
+import os
+
+from i18n_tools import key_extractor
+from i18n_tools.key_extractor import extract_jinja, extract_keys, extract_python
+
+
+def test_extract_python_reads_keys_and_defaults():
+    source = (
+        "from fur_lang import i18n\n"
+        "a = t('plain')\n"
+        'b = i18n.t("with_default", default="Hello {name}", name=user)\n'
+        "c = client.get('/not/a/key')\n"
+        "d = t(variable)\n"
+    )
+    assert extract_python(source) == {"plain": None, "with_default": "Hello {name}"}
+
+
+def test_extract_jinja_reads_calls_inside_expressions():
+    source = (
+        "{% extends 'layout.html' %}{% block content %}"
+        "<h1>{{ t('title') }}</h1>"
+        '{% if x %}{{ t("cta", default="Join now") }}{% endif %}'
+        "{% trans %}ignored{% endtrans %}{% endblock %}"
+    )
+    assert extract_jinja(source) == {"title": None, "cta": "Join now"}
+
+
+def test_extract_keys_skips_ignored_dirs_and_reparses_only_changes(tmp_path, monkeypatch):
+    (tmp_path / "app.py").write_text("t('one')\n")
+    (tmp_path / "templates").mkdir()
+    (tmp_path / "templates" / "page.html").write_text("{{ t('two') }}")
+    (tmp_path / "static").mkdir()
+    (tmp_path / "static" / "vendor.py").write_text("t('vendored')\n")
+    cache = str(tmp_path / "cache.json")
+    roots = [str(tmp_path), str(tmp_path / "templates")]
+
+    parsed = []
+    extract = key_extractor.extract_file
+    monkeypatch.setattr(key_extractor, "extract_file", lambda p: parsed.append(p) or extract(p))
+
+    assert extract_keys(roots, cache) == {"one": None, "two": None}
+    assert len(parsed) == 2  # templates/ visited once, static/ never
+
+    parsed.clear()
+    assert extract_keys(roots, cache) == {"one": None, "two": None}
+    assert parsed == []
+
+    (tmp_path / "app.py").write_text("t('one', default='One!')\nt('three')\n")
+    assert extract_keys(roots, cache) == {"one": "One!", "two": None, "three": None}
+    assert parsed == [os.path.normpath(str(tmp_path / "app.py"))]
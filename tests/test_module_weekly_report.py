@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 from config import Config
@@ -10,18 +10,15 @@ class FakeParticipants:
         return [{"_id": "user", "count": 1}]
 
 
-class FakeEvents:
-    def find(self, query, fields):
-        return self
-
-    def sort(self, *args):
-        return [{"title": "Event", "event_time": datetime.utcnow()}]
+def fake_get_collection(name):
+    assert name == "participants"
+    return FakeParticipants()
 
 
-def fake_get_collection(name):
-    if name == "participants":
-        return FakeParticipants()
-    return FakeEvents()
+def fake_get_events_between(start, end, projection=None):
+    # Shared with the digests so materialised recurring instances are included.
+    assert end - start == timedelta(days=7)
+    return [{"title": "Event", "event_time": datetime.utcnow()}]
 
 
 class FakeWebhook:
@@ -53,6 +50,7 @@ def test_post_report(monkeypatch):
     monkeypatch.setattr(Config, "DISCORD_WEBHOOK_URL", "http://example.com")
     monkeypatch.setattr(report_mod, "generate_markdown_report", fake_generate)
     monkeypatch.setattr(report_mod, "get_collection", fake_get_collection)
+    monkeypatch.setattr(report_mod, "get_events_between", fake_get_events_between)
     monkeypatch.setattr(report_mod, "WebhookAgent", FakeWebhook)
 
     assert report_mod.post_report() is True
@@ -0,0 +1,75 @@
+from i18n_tools.mt_pipeline import (
+    LocalTranslator,
+    TranslationMemory,
+    TranslationPipeline,
+    fill_missing,
+)
+
+
+class RenamingTranslator(LocalTranslator):
+    def translate_batch(self, texts, target, source):
+        super().translate_batch(texts, target, source)
+        return [text.replace("{name}", "{nombre}").replace("{n}", "") for text in texts]
+
+
+def test_pipeline_batches_dedupes_and_remembers(tmp_path):
+    memory = TranslationMemory(tmp_path / "tm.sqlite")
+    translator = LocalTranslator()
+    pipeline = TranslationPipeline(translator, memory, batch_size=2, concurrency=3, rate=0)
+
+    texts = ["Hello", "Bye", "Hello", "Save", ""]
+    result = pipeline.translate({"de": texts, "fr": texts, "en": texts}, "en")
+
+    assert result["de"] == {"Hello": "[de] Hello", "Bye": "[de] Bye", "Save": "[de] Save"}
+    assert result["en"]["Bye"] == "Bye"
+    # 3 unique texts, batches of 2 -> 2 requests per target language
+    assert sorted(len(batch) for _, batch in translator.batches) == [1, 1, 2, 2]
+    memory.close()
+
+    # A new process with the same memory file sends only unseen texts.
+    translator = LocalTranslator()
+    pipeline = TranslationPipeline(translator, TranslationMemory(tmp_path / "tm.sqlite"), rate=0)
+    result = pipeline.translate({"de": ["Hello", "New"]}, "en")
+    assert result["de"] == {"Hello": "[de] Hello", "New": "[de] New"}
+    assert translator.batches == [("de", ["New"])]
+    assert pipeline.stats["memory_hits"] == 1
+
+
+def test_pipeline_repairs_or_rejects_placeholders(tmp_path):
+    memory = TranslationMemory(tmp_path / "tm.sqlite")
+    pipeline = TranslationPipeline(RenamingTranslator(), memory, rate=0)
+
+    result = pipeline.translate({"es": ["Hi {name}", "{n} items"]}, "en")
+
+    assert result["es"]["Hi {name}"] == "Hi {name}"  # renamed placeholder restored
+    assert result["es"]["{n} items"] == "{n} items"  # lost placeholder -> source text
+    assert memory.get_many(["Hi {name}", "{n} items"], "es") == {"Hi {name}": "Hi {name}"}
+    assert pipeline.stats["failed"] == 1
+
+
+def test_fill_missing_uses_base_text_or_key(tmp_path):
+    catalogs = {"de": {"a": "schon da"}, "fr": {}}
+    missing = {"de": ["b"], "fr": ["a", "b"]}
+    pipeline = TranslationPipeline(
+        LocalTranslator(), TranslationMemory(tmp_path / "tm.sqlite"), rate=0
+    )
+
+    filled = fill_missing(catalogs, missing, {"a": "Apple"}, pipeline, "en")
+
+    assert filled == {"de": ["b"], "fr": ["a", "b"]}
+    assert catalogs == {
+        "de": {"a": "schon da", "b": "[de] b"},
+        "fr": {"a": "[fr] Apple", "b": "[fr] b"},
+    }
+
+
+def test_pipeline_stats_add_up_across_worker_threads():
+    pipeline = TranslationPipeline(
+        LocalTranslator(), TranslationMemory(":memory:"), batch_size=1, concurrency=8, rate=0
+    )
+    texts = [f"text {i}" for i in range(200)]
+
+    pipeline.translate({"de": texts, "fr": texts}, "en")
+
+    assert pipeline.stats["requests"] == 400
+    assert pipeline.stats["translated"] == 400
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from bot import outbound_queue as mod
+
+
+def _scheduler(max_concurrency=1, bulk_cap=1):
+    lanes = mod.default_lanes()
+    lanes[mod.LANE_BULK] = mod.LaneConfig(weight=1, max_concurrency=bulk_cap)
+    return mod.OutboundScheduler(lanes=lanes, max_concurrency=max_concurrency)
+
+
+@pytest.mark.asyncio
+async def test_reminder_preempts_queued_bulk():
+    scheduler = _scheduler()
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    async def send(label):
+        order.append(label)
+        if label == "bulk-0":
+            await gate.wait()
+
+    bulk = [asyncio.create_task(scheduler.run(mod.LANE_BULK, send, f"bulk-{i}")) for i in range(5)]
+    await asyncio.sleep(0)
+    reminder = asyncio.create_task(scheduler.run(mod.LANE_REMINDER, send, "reminder"))
+    await asyncio.sleep(0)
+    assert scheduler.depth(mod.LANE_BULK) == 4
+
+    gate.set()
+    await asyncio.gather(reminder, *bulk)
+
+    assert order[:2] == ["bulk-0", "reminder"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_cap_leaves_slots_for_reminders():
+    scheduler = _scheduler(max_concurrency=3, bulk_cap=2)
+    gate = asyncio.Event()
+    started: list[str] = []
+
+    async def send(label):
+        started.append(label)
+        await gate.wait()
+
+    tasks = [asyncio.create_task(scheduler.run(mod.LANE_BULK, send, "bulk")) for _ in range(10)]
+    tasks.append(asyncio.create_task(scheduler.run(mod.LANE_REMINDER, send, "reminder")))
+    await asyncio.sleep(0)
+
+    assert started.count("bulk") == 2
+    assert "reminder" in started
+    gate.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_weighted_sharing_does_not_starve_bulk():
+    scheduler = _scheduler()
+    order: list[str] = []
+
+    async def send(label):
+        order.append(label)
+
+    tasks = [asyncio.create_task(scheduler.run(mod.LANE_BULK, send, "b")) for _ in range(4)]
+    tasks += [asyncio.create_task(scheduler.run(mod.LANE_REMINDER, send, "r")) for _ in range(8)]
+    await asyncio.gather(*tasks)
+
+    # weight 4:1 – bulk gets a turn after every few reminders instead of waiting for all
+    assert "b" in order[1:7]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_removed():
+    scheduler = _scheduler()
+    gate = asyncio.Event()
+
+    async def send():
+        await gate.wait()
+
+    first = asyncio.create_task(scheduler.run(mod.LANE_BULK, send))
+    waiting = asyncio.create_task(scheduler.run(mod.LANE_BULK, send))
+    await asyncio.sleep(0)
+    waiting.cancel()
+    await asyncio.sleep(0)
+
+    assert scheduler.depth(mod.LANE_BULK) == 0
+    gate.set()
+    await first
+
+
+@pytest.mark.asyncio
+async def test_reset_keeps_lane_config_and_clears_state():
+    scheduler = _scheduler(bulk_cap=3)
+
+    async def send():
+        return None
+
+    await scheduler.run(mod.LANE_BULK, send)
+    scheduler.reset()
+
+    bulk = scheduler._lanes[mod.LANE_BULK]
+    assert bulk.vtime == 0.0 and bulk.config.max_concurrency == 3
+    assert scheduler._in_flight == 0
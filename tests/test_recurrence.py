@@ -0,0 +1,81 @@
+from datetime import datetime
+
+import mongomock
+
+from utils.recurrence import RecurrenceMaterializer, parse_rule
+
+
+def _db():
+    return mongomock.MongoClient().db
+
+
+def _times(db):
+    return [o["occurrence_time"] for o in db.event_occurrences.find().sort("occurrence_time", 1)]
+
+
+def test_parse_rule_accepts_presets_and_rrule_lines():
+    start = datetime(2025, 1, 1, 20, 0)
+    weekly = parse_rule("weekly", start)
+    assert weekly.after(start) == datetime(2025, 1, 8, 20, 0)
+    google = parse_rule(["RRULE:FREQ=DAILY;COUNT=2"], start)
+    assert list(google) == [start, datetime(2025, 1, 2, 20, 0)]
+    assert parse_rule("FREQ=NONSENSE", start) is None
+    assert parse_rule("", start) is None
+
+
+def test_extend_materialises_horizon_and_is_incremental():
+    db = _db()
+    db.events.insert_one(
+        {"_id": 1, "title": "Raid", "event_time": "2025-01-01T20:00:00", "recurrence": "weekly"}
+    )
+    db.events.insert_one({"_id": 2, "title": "Once", "event_time": datetime(2025, 1, 3)})
+    materializer = RecurrenceMaterializer(db, horizon_days=22)
+
+    assert materializer.extend(now=datetime(2025, 1, 1)) == 3
+    assert _times(db) == [datetime(2025, 1, d, 20, 0) for d in (8, 15, 22)]
+    occurrence = db.event_occurrences.find_one()
+    assert occurrence["series_id"] == 1 and occurrence["title"] == "Raid"
+    assert occurrence["event_time"] == occurrence["occurrence_time"]
+
+    # The next night only the newly reached week is added.
+    materializer.extend(now=datetime(2025, 1, 8))
+    assert _times(db)[-1] == datetime(2025, 1, 29, 20, 0)
+    assert db.event_occurrences.count_documents({}) == 4
+
+
+def test_materialize_recomputes_future_of_edited_series_only():
+    db = _db()
+    series = {
+        "_id": 1,
+        "title": "Raid",
+        "event_time": datetime(2025, 1, 1, 20),
+        "recurrence": "daily",
+    }
+    db.events.insert_one(series)
+    db.events.insert_one(
+        {"_id": 2, "title": "Other", "event_time": datetime(2025, 1, 1, 9), "recurrence": "weekly"}
+    )
+    materializer = RecurrenceMaterializer(db, horizon_days=7)
+    materializer.extend(now=datetime(2025, 1, 1))
+    other = db.event_occurrences.count_documents({"series_id": 2})
+
+    db.events.update_one({"_id": 1}, {"$set": {"recurrence": "weekly"}})
+    materializer.materialize(1, now=datetime(2025, 1, 4))
+
+    raid = [o["occurrence_time"] for o in db.event_occurrences.find({"series_id": 1})]
+    # Past instances stay, the future follows the new rule.
+    assert sorted(raid) == [datetime(2025, 1, d, 20) for d in (2, 3, 8)]
+    assert db.event_occurrences.count_documents({"series_id": 2}) == other
+
+    # Instances both rules produce keep their _id (reminders_sent points at it).
+    db.events.update_one({"_id": 1}, {"$set": {"recurrence": "daily"}})
+    kept = db.event_occurrences.find_one(
+        {"series_id": 1, "occurrence_time": datetime(2025, 1, 8, 20)}
+    )
+    materializer.materialize(1, now=datetime(2025, 1, 4))
+    assert db.event_occurrences.find_one({"_id": kept["_id"]}) is not None
+    assert db.event_occurrences.count_documents({"series_id": 1}) == 2 + 7
+
+    db.events.update_one({"_id": 1}, {"$set": {"recurrence": ""}})
+    assert materializer.materialize(1, now=datetime(2025, 1, 4)) == 0
+    assert db.event_occurrences.count_documents({"series_id": 1}) == 2
@@ -4,7 +4,6 @@ import sys
 import types
 
 import pytest
-from flask import current_app
 
 services_pkg = types.ModuleType("services")
 services_pkg.__path__ = [str(pathlib.Path(__file__).resolve().parents[1] / "services")]
@@ -22,7 +21,7 @@ class DummyUser:
 
 
 @pytest.mark.asyncio
-async def test_reminder_autopilot_sends_with_app_context(monkeypatch):
+async def test_reminder_autopilot_reads_synced_events(monkeypatch):
     monkeypatch.setattr(autopilot_mod.tasks.Loop, "start", lambda self, *a, **k: None)
 
     user = DummyUser()
@@ -34,23 +33,27 @@ async def test_reminder_autopilot_sends_with_app_context(monkeypatch):
     cog = autopilot_mod.ReminderAutopilot(bot)
 
     monkeypatch.setattr(autopilot_mod, "is_production", lambda: True)
-    monkeypatch.setattr(autopilot_mod, "is_opted_out", lambda _uid: False)
-    monkeypatch.setattr(
-        autopilot_mod.ReminderAutopilot, "get_user_language", lambda self, uid: "en"
-    )
+    monkeypatch.setattr(autopilot_mod, "opted_out_ids", lambda _ids: set())
+
+    async def fake_langs(self, uids):
+        return {uid: "en" for uid in uids}
+
+    monkeypatch.setattr(autopilot_mod.ReminderAutopilot, "get_user_languages", fake_langs)
     monkeypatch.setattr(autopilot_mod.Config, "REMINDER_ROLE_ID", 0, raising=False)
 
     class EventsCol:
-        def find_one(self, query):  # pragma: no cover - simple stub
-            return {"_id": "1", "google_id": "abc", "title": "Test Event"}
+        def find(self, query, projection=None):  # pragma: no cover - simple stub
+            assert "event_time" in query
+            return [{"_id": "1", "google_id": "abc", "title": "Test Event"}]
 
     class ParticipantsCol:
-        def find(self, query):  # pragma: no cover - simple stub
-            return [{"user_id": "123"}]
+        def find(self, query, projection=None):  # pragma: no cover - simple stub
+            assert query == {"event_id": {"$in": ["1"]}}
+            return [{"event_id": "1", "user_id": "123"}]
 
     class RemindersSentCol:
-        def find_one(self, query):  # pragma: no cover - simple stub
-            return None
+        def find(self, query, projection=None):  # pragma: no cover - simple stub
+            return []
 
         def insert_one(self, doc):  # pragma: no cover - simple stub
             self.inserted = doc
@@ -58,6 +61,7 @@ async def test_reminder_autopilot_sends_with_app_context(monkeypatch):
     def fake_get_collection(name):  # pragma: no cover - simple stub
         mapping = {
             "events": EventsCol(),
+            "event_occurrences": types.SimpleNamespace(find=lambda q, p=None: []),
             "event_participants": ParticipantsCol(),
             "reminders_sent": RemindersSentCol(),
         }
@@ -65,13 +69,25 @@ async def test_reminder_autopilot_sends_with_app_context(monkeypatch):
 
     monkeypatch.setattr(autopilot_mod, "get_collection", fake_get_collection)
 
-    def fake_list_upcoming_events(service, **kwargs):
-        current_app.name  # will raise if context missing
-        return [{"id": "abc", "title": "Test Event"}]
-
-    monkeypatch.setattr(autopilot_mod, "get_service", lambda settings: object())
-    monkeypatch.setattr(autopilot_mod, "list_upcoming_events", fake_list_upcoming_events)
     monkeypatch.setattr(autopilot_mod, "t", lambda key, title, lang: f"Reminder: {title}")
 
     await cog.run_reminder_check()
     assert user.sent == "Reminder: Test Event"
+
+
+@pytest.mark.asyncio
+async def test_user_languages_loaded_once_and_cached(monkeypatch):
+    queries = []
+
+    class UsersCol:
+        def find(self, query, projection=None):  # pragma: no cover - simple stub
+            queries.append(query)
+            return [{"discord_id": "1", "lang": "en"}]
+
+    monkeypatch.setattr(autopilot_mod, "get_collection", lambda name: UsersCol())
+    monkeypatch.setattr(autopilot_mod, "_languages", {})
+    cog = autopilot_mod.ReminderAutopilot.__new__(autopilot_mod.ReminderAutopilot)
+
+    assert await cog.get_user_languages([1, 2]) == {1: "en", 2: "de"}
+    assert await cog.get_user_language(2) == "de"
+    assert len(queries) == 1
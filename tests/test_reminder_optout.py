@@ -56,10 +56,12 @@ def test_autopilot_ignores_opted_out_user(monkeypatch):
     def get_coll(name):
         return {
             "events": events_col,
+            "event_occurrences": DummyCollection(),
             "event_participants": participants_col,
             "reminders_sent": sent_col,
             "reminder_optout": optout_col,
             "user_settings": user_settings_col,
+            "users": DummyCollection(),
         }[name]
 
     monkeypatch.setattr(autopilot_mod, "get_collection", get_coll)
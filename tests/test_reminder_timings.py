@@ -67,15 +67,15 @@ def test_autopilot_sends_with_role_mention(monkeypatch):
     def get_coll(name):
         return {
             "events": events_col,
+            "event_occurrences": DummyCollection(),
             "event_participants": participants_col,
             "reminders_sent": sent_col,
             "reminder_optout": optout_col,
             "user_settings": user_settings_col,
+            "users": DummyCollection(),
         }[name]
 
     monkeypatch.setattr(autopilot_mod, "get_collection", get_coll)
-    monkeypatch.setattr(autopilot_mod, "list_upcoming_events", lambda *a, **k: [{"id": "g1"}])
-    monkeypatch.setattr(autopilot_mod, "get_service", lambda: object())
     monkeypatch.setattr(event_helpers, "get_collection", get_coll)
     monkeypatch.setattr(autopilot_mod, "is_production", lambda: True)
     monkeypatch.setattr(Config, "REMINDER_ROLE_ID", 99)
@@ -86,6 +86,43 @@ def test_autopilot_sends_with_role_mention(monkeypatch):
     assert len(sent_col) == 1
 
 
+def test_autopilot_reminds_series_participants_for_occurrence(monkeypatch):
+    user = DummyUser()
+
+    async def fetch_user(uid):
+        return user
+
+    cog = autopilot_mod.ReminderAutopilot.__new__(autopilot_mod.ReminderAutopilot)
+    cog.bot = types.SimpleNamespace(fetch_user=fetch_user)
+
+    now = datetime.utcnow()
+    occurrence = {
+        "_id": "occ-1",
+        "series_id": 1,
+        "title": "Raid",
+        "event_time": now + timedelta(minutes=10, seconds=1),
+    }
+    monkeypatch.setattr(autopilot_mod, "datetime", types.SimpleNamespace(utcnow=lambda: now))
+    sent_col = DummyCollection()
+    collections = {
+        "events": DummyCollection(),
+        "event_occurrences": DummyCollection([occurrence]),
+        "event_participants": DummyCollection([{"user_id": "1", "event_id": 1}]),
+        "reminders_sent": sent_col,
+        "reminder_optout": DummyCollection(),
+        "user_settings": DummyCollection(),
+        "users": DummyCollection(),
+    }
+    monkeypatch.setattr(autopilot_mod, "get_collection", collections.__getitem__)
+    monkeypatch.setattr(autopilot_mod, "is_production", lambda: True)
+    monkeypatch.setattr(Config, "REMINDER_ROLE_ID", None)
+
+    asyncio.run(autopilot_mod.ReminderAutopilot.run_reminder_check(cog))
+
+    assert user.sent
+    assert sent_col[0]["event_id"] == "occ-1"
+
+
 def test_reminder_cog_sends_60min(monkeypatch):
     user = DummyUser()
 
@@ -109,10 +146,12 @@ def test_reminder_cog_sends_60min(monkeypatch):
     def get_coll(name):
         return {
             "events": events_col,
+            "event_occurrences": DummyCollection(),
             "event_participants": participants_col,
             "reminders_sent": sent_col,
             "reminder_optout": optout_col,
             "user_settings": user_settings_col,
+            "users": DummyCollection(),
         }[name]
 
     monkeypatch.setattr(cog_mod, "get_collection", get_coll)
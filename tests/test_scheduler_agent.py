@@ -1,3 +1,6 @@
+import importlib
+import sys
+
 from flask import Flask
 
 
@@ -19,3 +22,26 @@ def test_schedule_google_sync_injects_dependencies(monkeypatch):
 
     assert called["app"] is app
     assert called["db"] is db
+
+
+def test_schedule_recurrence_materializer_runs_now_and_nightly(monkeypatch):
+    # tests/test_health.py stubs the module in sys.modules.
+    monkeypatch.delitem(sys.modules, "agents.scheduler_agent", raising=False)
+    agent_mod = importlib.import_module("agents.scheduler_agent")
+
+    db = object()
+    extended = []
+
+    class FakeMaterializer:
+        def extend(self):
+            extended.append(True)
+
+    monkeypatch.setattr(agent_mod, "get_materializer", lambda mongo_db: FakeMaterializer())
+
+    agent = agent_mod.SchedulerAgent(Flask(__name__), db)
+    agent.schedule_recurrence_materializer(at="03:00")
+    try:
+        assert extended == [True]
+        assert agent.jobs[0].at_time.strftime("%H:%M") == "03:00"
+    finally:
+        agent_mod.schedule.cancel_job(agent.jobs[0])
@@ -0,0 +1,33 @@
+import discord
+import pytest
+
+from bot.sim_transport import SimBot, SimulatedTransport
+
+
+@pytest.mark.asyncio
+async def test_transport_counts_deliveries_and_forbidden():
+    transport = SimulatedTransport(latency=0, forbidden_rate=0.5, seed=1)
+    bot = SimBot(transport, recipients=20)
+    closed = [u for u in bot.users.values() if u.dm_closed]
+    assert closed
+
+    for user in bot.users.values():
+        if user.dm_closed:
+            with pytest.raises(discord.Forbidden):
+                await user.send("hi")
+        else:
+            await user.send("hi")
+
+    assert transport.stats.forbidden == len(closed)
+    assert transport.stats.delivered == 20 - len(closed)
+    assert len(transport.stats.latencies) == transport.stats.delivered
+
+
+@pytest.mark.asyncio
+async def test_bucket_limit_delays_requests():
+    transport = SimulatedTransport(latency=0, bucket_limit=2, bucket_window=0.05)
+    bot = SimBot(transport, recipients=3)
+    for user in bot.users.values():
+        await user.send("hi")
+    assert transport.stats.rate_limited >= 1
+    assert transport.stats.percentile(100) > 0
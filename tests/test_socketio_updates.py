@@ -10,3 +10,24 @@ def test_event_emission(app):
     received = client.get_received("/updates")
     assert any(r["name"] == "new_reminder" for r in received)
     client.disconnect(namespace="/updates")
+
+
+def test_changes_recorded_by_another_process_are_relayed(monkeypatch):
+    import mongomock
+
+    import web.socketio_events as events_mod
+    from services.google.change_events import ChangeFeed, EventChange, record
+
+    db = mongomock.MongoClient().db
+    record(db, [EventChange("created", "old", doc={"title": "Before start"})])
+    feed = ChangeFeed(db)
+    emitted: list[dict] = []
+    monkeypatch.setattr(events_mod, "emit_new_event", emitted.append)
+
+    # e.g. the bot holds the sync lease and records what it synced
+    record(db, [EventChange("created", "g1", "cal", doc={"title": "Raid"})])
+    assert events_mod.relay_once(feed) == 1
+    assert events_mod.relay_once(feed) == 0
+
+    assert [e["title"] for e in emitted] == ["Raid"]
+    assert emitted[0]["calendar_id"] == "cal"
@@ -16,22 +16,48 @@ def test_sync_adds_missing_keys(tmp_path):
     assert data.get("hello") == ""
 
 
-def test_auto_translate_missing(monkeypatch, tmp_path):
+def test_sync_parses_each_complete_catalog_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
     lang_dir = tmp_path / "translations"
     lang_dir.mkdir()
     (lang_dir / "en.json").write_text(json.dumps({"hello": "Hello"}))
-    (lang_dir / "de.json").write_text(json.dumps({"hello": ""}))
+    (lang_dir / "de.json").write_text(json.dumps({"hello": "Hallo"}))
+    (lang_dir / "fr.json").write_text(json.dumps({}))
+
+    agent = TranslationAgent(lang_dir=lang_dir)
+    loads: list[str] = []
+    load = agent._load_language
+    monkeypatch.setattr(agent, "_load_language", lambda lang: loads.append(lang) or load(lang))
+    agent.sync()
 
-    from i18n_tools import auto_fill
+    # Only the catalog that needs rewriting is read a second time.
+    assert sorted(loads) == ["de", "en", "fr", "fr"]
+    assert json.loads((lang_dir / "fr.json").read_text()) == {"hello": ""}
 
-    def fake_translate(text: str, target: str) -> str:
-        return f"{target}:{text}"
 
-    monkeypatch.setattr(auto_fill, "TRANSLATIONS_DIR", lang_dir)
-    monkeypatch.setattr(auto_fill, "translate", fake_translate)
+def test_auto_translate_missing(tmp_path, monkeypatch):
+    # sync() writes translation_keys.json into the working directory.
+    monkeypatch.chdir(tmp_path)
+    lang_dir = tmp_path / "translations"
+    lang_dir.mkdir()
+    (lang_dir / "en.json").write_text(json.dumps({"hello": "Hello", "bye": "Bye"}))
+    (lang_dir / "de.json").write_text(json.dumps({"hello": ""}))
+    (lang_dir / "fr.json").write_text(json.dumps({"hello": "Bonjour"}))
+
+    from i18n_tools.mt_pipeline import LocalTranslator
 
+    translator = LocalTranslator()
     agent = TranslationAgent(lang_dir=lang_dir)
-    agent.auto_translate_missing()
+    agent.auto_translate_missing(translator)
 
     data = json.loads((lang_dir / "de.json").read_text())
-    assert data["hello"] == "de:Hello"
+    assert data["hello"] == "[de] Hello"
+    assert json.loads((lang_dir / "fr.json").read_text())["bye"] == "[fr] Bye"
+    # One batch per language, not one request per key.
+    assert sorted(lang for lang, _ in translator.batches) == ["de", "fr"]
+
+    # Emptied again: answered from the translation memory, nothing is sent.
+    (lang_dir / "de.json").write_text(json.dumps({"hello": "", "bye": ""}))
+    agent.auto_translate_missing(translator)
+    assert json.loads((lang_dir / "de.json").read_text())["bye"] == "[de] Bye"
+    assert len(translator.batches) == 2
@@ -0,0 +1,131 @@
+import json
+import os
+
+from fur_lang import i18n
+from fur_lang.catalog import (
+    CatalogLanguage,
+    CatalogWatcher,
+    LanguageCache,
+    build_catalog,
+    open_catalog,
+    write_atomic,
+)
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def test_compiled_catalog_roundtrip(tmp_path):
+    src = tmp_path / "translations"
+    src.mkdir()
+    _write(src / "en.json", {"hi": "Hi {name}", "n": {"one": "1 item", "other": "{n} items"}})
+    _write(src / "de.json", {"hi": "Hallo {name}", "empty": None, "ü": "Grüße"})
+    out = build_catalog(str(src), str(tmp_path / "catalog.bin"))
+
+    catalog = open_catalog(out)
+    assert sorted(catalog.languages) == ["de", "en"]
+    de = catalog.language("de")
+    assert dict(de.items()) == {"hi": "Hallo {name}", "empty": None, "ü": "Grüße"}
+    assert catalog.language("en")["n"] == {"one": "1 item", "other": "{n} items"}
+    assert "n" not in de and de.get("n") is None
+    assert catalog.is_fresh("de", str(src / "de.json"))
+
+
+def test_language_cache_prefers_fresh_catalog_and_reads_edited_json(tmp_path):
+    src = tmp_path / "translations"
+    src.mkdir()
+    _write(src / "en.json", {"hi": "Hi"})
+    _write(src / "de.json", {"hi": "Hallo"})
+    out = build_catalog(str(src), str(tmp_path / "catalog.bin"))
+
+    _write(src / "de.json", {"hi": "Servus"})
+    os.utime(src / "de.json", ns=(1, 1))
+    loaded = LanguageCache(
+        str(src), lambda lang: i18n._load_language(lang, str(src)), catalog_path=out
+    )
+
+    assert isinstance(loaded["en"], CatalogLanguage)
+    assert loaded["de"] == {"hi": "Servus"}
+    assert loaded.stats["en"]["source"] == "mmap" and loaded.stats["de"]["source"] == "json"
+
+
+def test_language_cache_loads_lazily_and_evicts_lru(tmp_path):
+    for lang in ("en", "de", "fr"):
+        _write(tmp_path / f"{lang}.json", {"text": lang * 200})
+    loads = []
+
+    def loader(lang):
+        loads.append(lang)
+        return json.loads((tmp_path / f"{lang}.json").read_text())
+
+    # Room for two of the three catalogs.
+    cache = LanguageCache(str(tmp_path), loader, pinned=("en",), budget_bytes=1500)
+
+    assert sorted(cache) == ["de", "en", "fr"] and "fr" in cache
+    assert loads == []  # listing and membership never parse files
+
+    cache.get("en"), cache.get("de"), cache.get("fr")
+    assert loads == ["en", "de", "fr"]
+    assert "en" in cache.resident() and "de" not in cache.resident()
+    stats = cache.residency()["de"]
+    assert stats["loads"] == 1 and stats["source"] == "json" and not stats["resident"]
+
+    cache.get("de")
+    assert loads[-1] == "de"
+    assert cache.get("xx") is None and loads[-1] == "de"
+
+
+def test_open_catalog_ignores_missing_or_foreign_files(tmp_path):
+    assert open_catalog(str(tmp_path / "nope.bin")) is None
+    junk = tmp_path / "junk.bin"
+    junk.write_bytes(b"x" * 64)
+    assert open_catalog(str(junk)) is None
+
+
+def test_watcher_swaps_only_changed_languages(tmp_path):
+    _write(tmp_path / "en.json", {"hi": "Hi"})
+    _write(tmp_path / "de.json", {"hi": "Hallo"})
+    loads = []
+
+    def loader(lang):
+        loads.append(lang)
+        return i18n._load_language(lang, str(tmp_path))
+
+    cache = LanguageCache(str(tmp_path), loader)
+    old_en, old_de = cache["en"], cache["de"]
+    watcher = CatalogWatcher(str(tmp_path), cache.refresh)
+    assert watcher.check() == set()
+
+    _write(tmp_path / "de.json", {"hi": "Servus!"})
+    _write(tmp_path / "fr.json", {"hi": "Salut"})
+    assert watcher.check() == {"de", "fr"}
+    assert cache["de"] == {"hi": "Servus!"} and cache["de"] is not old_de
+    assert cache["en"] is old_en
+    assert "fr" in cache and loads == ["en", "de", "de"]
+
+    # A broken write keeps serving the previous catalog.
+    (tmp_path / "de.json").write_text("{broken", encoding="utf-8")
+    assert watcher.check() == {"de"}
+    assert cache["de"] == {"hi": "Servus!"}
+
+
+def test_write_atomic_keeps_mode_and_uses_private_temp_files(tmp_path):
+    import threading
+
+    path = tmp_path / "de.json"
+    _write(path, {})
+    os.chmod(path, 0o640)
+
+    def writer(i):
+        write_atomic(str(path), json.dumps({"n": i}))
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert json.loads(path.read_text())["n"] in range(8)
+    assert os.stat(path).st_mode & 0o777 == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["de.json"]
@@ -14,6 +14,7 @@ class GoogleCalendarSettings:
     token_path: str = DEFAULT_TOKEN_PATH
     credentials_file: str = DEFAULT_TOKEN_PATH
     scopes: List[str] = field(default_factory=lambda: DEFAULT_SCOPES.copy())
+    calendar_ids: List[str] = field(default_factory=list)
 
 
 def get_google_calendar_settings() -> GoogleCalendarSettings:
@@ -22,16 +23,20 @@ def get_google_calendar_settings() -> GoogleCalendarSettings:
     Returns a :class:`GoogleCalendarSettings` instance with sensible defaults.
     ``GOOGLE_TOKEN_STORAGE_PATH`` falls back to ``GOOGLE_CREDENTIALS_FILE``
     which itself defaults to ``/data/google_token.json``.
-    ``GOOGLE_CALENDAR_SCOPES`` is parsed as a comma separated list.
+    ``GOOGLE_CALENDAR_SCOPES`` and ``GOOGLE_CALENDAR_IDS`` are parsed as comma
+    separated lists; ``GOOGLE_CALENDAR_ID`` defaults to the first listed calendar.
     """
 
     credentials_file = os.getenv("GOOGLE_CREDENTIALS_FILE", DEFAULT_TOKEN_PATH)
     token_path = os.getenv("GOOGLE_TOKEN_STORAGE_PATH", credentials_file)
     scopes_env = os.getenv("GOOGLE_CALENDAR_SCOPES", ",".join(DEFAULT_SCOPES))
     scopes = [s.strip() for s in scopes_env.split(",") if s.strip()]
+    calendar_ids = [c.strip() for c in os.getenv("GOOGLE_CALENDAR_IDS", "").split(",") if c.strip()]
+    calendar_id = os.getenv("GOOGLE_CALENDAR_ID") or (calendar_ids[0] if calendar_ids else None)
     return GoogleCalendarSettings(
-        calendar_id=os.getenv("GOOGLE_CALENDAR_ID"),
+        calendar_id=calendar_id,
         token_path=token_path,
         credentials_file=credentials_file,
         scopes=scopes,
+        calendar_ids=calendar_ids,
     )
@@ -9,6 +9,7 @@ from babel.dates import format_datetime
 
 from fur_lang import i18n
 from mongo_service import get_collection
+from utils.recurrence import OCCURRENCES_COLLECTION
 
 
 def parse_event_time(value: Any) -> datetime | None:
@@ -38,12 +39,37 @@ def get_events_for(dt: datetime | date_type, tz: str | ZoneInfo = "Europe/Berlin
     start = start_local.astimezone(timezone.utc)
     end = end_local.astimezone(timezone.utc)
 
-    events = (
+    return get_events_between(start, end)
+
+
+def get_events_between(
+    start: datetime, end: datetime, projection: dict | None = None
+) -> list[dict]:
+    """Return events with ``start <= event_time < end`` sorted by ``event_time``.
+
+    Instances of recurring series are materialised ahead of time in
+    ``event_occurrences`` and merged in.
+    """
+    events = list(
         get_collection("events")
-        .find({"event_time": {"$gte": start, "$lt": end}})
+        .find({"event_time": {"$gte": start, "$lt": end}}, projection)
         .sort("event_time", 1)
     )
-    return list(events)
+    occurrences = list(
+        get_collection(OCCURRENCES_COLLECTION)
+        .find({"occurrence_time": {"$gte": start, "$lt": end}}, projection)
+        .sort("occurrence_time", 1)
+    )
+    if not occurrences:
+        return events
+    return sorted(events + occurrences, key=lambda ev: _sort_key(ev.get("event_time")))
+
+
+def _sort_key(value: Any) -> datetime:
+    parsed = parse_event_time(value) if value is not None else None
+    if parsed is None:
+        return datetime.max.replace(tzinfo=timezone.utc)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
 
 
 def format_events(events: Iterable[dict]) -> str:
@@ -0,0 +1,121 @@
+"""Chunked MongoDB bulk upserts shared by the sync (PyMongo) and async (Motor) paths."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Sequence
+
+from pymongo import UpdateOne
+
+_MOTOR_COLLECTIONS: tuple[type, ...]
+try:
+    from motor.motor_asyncio import AsyncIOMotorCollection
+
+    _MOTOR_COLLECTIONS = (AsyncIOMotorCollection,)
+except ImportError:  # pragma: no cover - Motor is optional for sync-only callers
+    _MOTOR_COLLECTIONS = ()
+
+log = logging.getLogger(__name__)
+
+
+def _default_chunk_size() -> int:
+    return int(os.getenv("MONGO_BULK_CHUNK_SIZE", "500"))
+
+
+@dataclass
+class BulkStats:
+    """Summed ``BulkWriteResult`` counters over all chunks."""
+
+    upserted: int = 0
+    modified: int = 0
+    matched: int = 0
+    deleted: int = 0
+
+    def add(self, res: Any) -> None:
+        self.upserted += getattr(res, "upserted_count", 0) or 0
+        self.modified += getattr(res, "modified_count", 0) or 0
+        self.matched += getattr(res, "matched_count", 0) or 0
+        self.deleted += getattr(res, "deleted_count", 0) or 0
+
+    @property
+    def changed(self) -> int:
+        return self.upserted + self.modified
+
+
+def upsert_ops(docs: Iterable[dict], key: str | Sequence[str]) -> list[UpdateOne]:
+    """Return one ``UpdateOne(..., upsert=True)`` per doc, matched on ``key``.
+
+    ``key`` may name several fields; those a doc lacks are left out of the
+    filter. A doc carrying ``_id`` updates exactly that document. Docs without
+    a value for the (first) key are skipped.
+    """
+    keys = [key] if isinstance(key, str) else list(key)
+    ops = []
+    for d in docs:
+        if not d.get(keys[0]):
+            continue
+        if "_id" in d:
+            match = {"_id": d["_id"]}
+            d = {k: v for k, v in d.items() if k != "_id"}
+        else:
+            match = {k: d[k] for k in keys if k in d}
+        ops.append(UpdateOne(match, {"$set": d}, upsert=True))
+    return ops
+
+
+def _chunks(ops: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for i in range(0, len(ops), max(1, size)):
+        yield ops[i : i + size]
+
+
+def _log_chunk(col: Any, index: int, count: int, started: float) -> None:
+    log.debug(
+        "bulk_write %s chunk %d: %d ops in %.1f ms",
+        getattr(col, "name", col),
+        index,
+        count,
+        (time.perf_counter() - started) * 1000,
+    )
+
+
+def bulk_upsert(col: Any, ops: Sequence[Any], chunk_size: int | None = None) -> BulkStats:
+    """Write ``ops`` to a PyMongo collection with unordered, chunked ``bulk_write``."""
+    stats = BulkStats()
+    for index, chunk in enumerate(_chunks(ops, chunk_size or _default_chunk_size())):
+        started = time.perf_counter()
+        stats.add(col.bulk_write(list(chunk), ordered=False))
+        _log_chunk(col, index, len(chunk), started)
+    return stats
+
+
+async def bulk_upsert_async(
+    col: Any, ops: Sequence[Any], chunk_size: int | None = None
+) -> BulkStats:
+    """Async variant of :func:`bulk_upsert`.
+
+    Motor collections are awaited directly; plain PyMongo collections fall back
+    to one thread hop per chunk (not per document).
+    """
+    stats = BulkStats()
+    # Motor wraps PyMongo methods so they return Futures – they are no
+    # coroutine functions and must be called on the loop, not in a thread.
+    is_async = isinstance(col, _MOTOR_COLLECTIONS) or asyncio.iscoroutinefunction(col.bulk_write)
+    for index, chunk in enumerate(_chunks(ops, chunk_size or _default_chunk_size())):
+        started = time.perf_counter()
+        if is_async:
+            res = col.bulk_write(list(chunk), ordered=False)
+            if inspect.isawaitable(res):
+                res = await res
+        else:
+            res = await asyncio.to_thread(col.bulk_write, list(chunk), ordered=False)
+        stats.add(res)
+        _log_chunk(col, index, len(chunk), started)
+    return stats
+
+
+__all__ = ["BulkStats", "bulk_upsert", "bulk_upsert_async", "upsert_ops"]
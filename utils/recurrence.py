@@ -0,0 +1,189 @@
+"""Materialised occurrences of recurring events.
+
+Admin events may carry a ``recurrence``: one of the editor presets
+(``daily``/``weekly``/``monthly``) or RFC 5545 ``RRULE`` lines as Google uses
+them. Instead of every reader expanding rules at query time,
+:class:`RecurrenceMaterializer` writes each instance within a rolling horizon
+(``EVENT_OCCURRENCE_HORIZON_DAYS``) to ``event_occurrences``, indexed by
+``occurrence_time``. The series document in ``events`` keeps its own
+``event_time``; occurrences hold every later instance and point back to it via
+``series_id``.
+
+A nightly job (:meth:`RecurrenceMaterializer.extend`) moves the horizon
+forward; editing a series recomputes only its future occurrences
+(:meth:`RecurrenceMaterializer.materialize`).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from dateutil.rrule import rrulestr
+from pymongo import ASCENDING, UpdateOne
+
+from utils.mongo_bulk import bulk_upsert
+
+log = logging.getLogger(__name__)
+
+EVENTS_COLLECTION = "events"
+OCCURRENCES_COLLECTION = "event_occurrences"
+
+_PRESETS = {"daily": "FREQ=DAILY", "weekly": "FREQ=WEEKLY", "monthly": "FREQ=MONTHLY"}
+_RULE_PREFIXES = ("RRULE:", "EXRULE:", "RDATE", "EXDATE")
+_COPY_FIELDS = ("title", "description", "role", "location", "calendar_id")
+
+
+def _naive_utc(value: Any) -> datetime | None:
+    """Return ``value`` as naive UTC ``datetime`` (how MongoDB stores it)."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _utcnow(now: datetime | None = None) -> datetime:
+    """Return ``now`` (default: the current time) as naive UTC ``datetime``."""
+    now = now or datetime.now(timezone.utc)
+    return now.astimezone(timezone.utc).replace(tzinfo=None) if now.tzinfo else now
+
+
+def parse_rule(recurrence: Any, dtstart: datetime):
+    """Return a ``dateutil`` rule set for ``recurrence`` or ``None``."""
+    if not recurrence:
+        return None
+    lines = recurrence if isinstance(recurrence, (list, tuple)) else [recurrence]
+    text = []
+    for line in lines:
+        line = str(line).strip()
+        if line.lower() in _PRESETS:
+            line = "RRULE:" + _PRESETS[line.lower()]
+        elif not line.upper().startswith(_RULE_PREFIXES):
+            line = "RRULE:" + line
+        text.append(line)
+    try:
+        return rrulestr("\n".join(text), dtstart=dtstart, forceset=True)
+    except (ValueError, TypeError):
+        log.warning("Ignoring invalid recurrence %r", recurrence)
+        return None
+
+
+class RecurrenceMaterializer:
+    """Expand recurring ``events`` into ``event_occurrences``."""
+
+    def __init__(self, mongo_db: Any, horizon_days: int | None = None) -> None:
+        self.events = mongo_db[EVENTS_COLLECTION]
+        self.occurrences = mongo_db[OCCURRENCES_COLLECTION]
+        self.horizon = timedelta(
+            days=horizon_days or int(os.getenv("EVENT_OCCURRENCE_HORIZON_DAYS", "60"))
+        )
+        self._indexed = False
+
+    def ensure_indexes(self) -> None:
+        if self._indexed:
+            return
+        self.occurrences.create_index([("occurrence_time", ASCENDING)])
+        self.occurrences.create_index(
+            [("series_id", ASCENDING), ("occurrence_time", ASCENDING)], unique=True
+        )
+        self._indexed = True
+
+    def materialize(self, event: Any, now: datetime | None = None) -> int:
+        """Recompute the future occurrences of one series (e.g. after an edit).
+
+        ``event`` is the series document or its ``_id``. Past occurrences are
+        kept; returns the number of occurrences written.
+
+        Instances the new rule still produces are updated in place so their
+        ``_id`` – which ``reminders_sent`` refers to – survives the edit; only
+        instances it no longer produces are deleted.
+        """
+        if not isinstance(event, dict):
+            event = self.events.find_one({"_id": event}) or {"_id": event}
+        now = _utcnow(now)
+        until = now + self.horizon
+        self.ensure_indexes()
+        produced = self._expand(event, now, until)
+        self.occurrences.delete_many(
+            {"series_id": event["_id"], "occurrence_time": {"$gte": now, "$nin": produced}}
+        )
+        if event.get("recurrence"):
+            self.events.update_one({"_id": event["_id"]}, {"$set": {"occurrences_until": until}})
+        return len(produced)
+
+    def extend(self, now: datetime | None = None) -> int:
+        """Extend every series up to ``now + horizon`` (nightly job)."""
+        now = _utcnow(now)
+        until = now + self.horizon
+        self.ensure_indexes()
+        written = 0
+        for event in self.events.find({"recurrence": {"$nin": [None, "", []]}}):
+            start = max(_naive_utc(event.get("occurrences_until")) or now, now)
+            if start < until:
+                written += len(self._expand(event, start, until))
+            self.events.update_one({"_id": event["_id"]}, {"$set": {"occurrences_until": until}})
+        log.info("Materialised %d event occurrences up to %s", written, until)
+        return written
+
+    def remove(self, series_id: Any) -> None:
+        """Drop all occurrences of a deleted series."""
+        self.occurrences.delete_many({"series_id": series_id})
+
+    def _expand(self, event: dict, start: datetime, until: datetime) -> list[datetime]:
+        """Upsert the instances in ``[start, until]`` and return their times."""
+        dtstart = _naive_utc(event.get("event_time"))
+        rule = parse_rule(event.get("recurrence"), dtstart) if dtstart else None
+        if rule is None:
+            return []
+        # The series' own event_time is served from ``events``.
+        times = [when for when in rule.between(start, until, inc=True) if when > dtstart]
+        ops = [
+            UpdateOne(
+                {"series_id": event["_id"], "occurrence_time": when},
+                {"$set": self._occurrence(event, when)},
+                upsert=True,
+            )
+            for when in times
+        ]
+        if ops:
+            bulk_upsert(self.occurrences, ops)
+        return times
+
+    @staticmethod
+    def _occurrence(event: dict, when: datetime) -> dict:
+        doc = {name: event.get(name) for name in _COPY_FIELDS if event.get(name) is not None}
+        doc.update(
+            series_id=event["_id"],
+            occurrence_time=when,
+            event_time=when,
+            date=when.isoformat(),
+            source="recurrence",
+        )
+        return doc
+
+
+_materializers: dict[Any, RecurrenceMaterializer] = {}
+
+
+def get_materializer(mongo_db: Any) -> RecurrenceMaterializer:
+    """Return the per-process materializer for ``mongo_db``."""
+    key = getattr(mongo_db, "name", id(mongo_db))
+    if key not in _materializers:
+        _materializers[key] = RecurrenceMaterializer(mongo_db)
+    return _materializers[key]
+
+
+__all__ = [
+    "OCCURRENCES_COLLECTION",
+    "RecurrenceMaterializer",
+    "get_materializer",
+    "parse_rule",
+]
@@ -15,6 +15,8 @@ from fur_lang.i18n import (
     get_language_native_name,
     get_supported_languages,
     is_rtl,
+    language_table,
+    start_watcher,
     t,
 )
 from web.auth_routes import auth_bp
@@ -94,6 +96,8 @@ def create_app() -> Flask:
         )
 
     babel.init_app(app, locale_selector=get_locale)
+    # Geänderte translations/*.json in jedem Worker nachladen
+    start_watcher()
 
     @app.before_request
     def set_language_from_request() -> None:
@@ -109,6 +113,7 @@ def create_app() -> Flask:
             "resolve_background_template": resolve_background_template,
             "language_native_name": get_language_native_name,
             "is_rtl": is_rtl,
+            "languages": language_table(),
         }
 
     # ---------------------------------------------------------------------
@@ -0,0 +1,31 @@
+"""Receiver for Google Calendar push notifications (``events.watch``)."""
+
+import logging
+
+from flask import Blueprint, request
+
+import mongo_service
+from services.google.sync_coordinator import get_coordinator
+
+log = logging.getLogger(__name__)
+
+calendar_push_blueprint = Blueprint("calendar_push", __name__)
+
+
+@calendar_push_blueprint.post("/google/calendar/notify")
+def calendar_notify():
+    coordinator = get_coordinator(mongo_service.db)
+    try:
+        calendar_id = coordinator.push.handle_notification(request.headers)
+    except PermissionError:
+        log.warning("Rejected push for channel %s", request.headers.get("X-Goog-Channel-ID"))
+        return "", 403
+    if calendar_id:
+        # Answer Google immediately; if this worker is the leader the sync runs
+        # now, otherwise the leader picks up the pending flag on its next
+        # short push-mode tick. Bursts coalesce into one background tick.
+        coordinator.request_sync()
+    return "", 204
+
+
+__all__ = ["calendar_push_blueprint"]
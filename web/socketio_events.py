@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import logging
+import os
+from typing import TYPE_CHECKING, Any
+
 from flask_socketio import Namespace, SocketIO, emit
 
+if TYPE_CHECKING:
+    from services.google.change_events import ChangeFeed
+
+log = logging.getLogger(__name__)
+
 socketio = SocketIO(async_mode="threading")
+_relay_started = False
 
 
 class UpdatesNamespace(Namespace):
@@ -19,6 +29,40 @@ def init_socketio(app) -> SocketIO:
     return socketio
 
 
+def start_change_relay(mongo_db: Any, interval: float | None = None) -> None:
+    """Emit calendar changes recorded by the sync leader – in whichever process.
+
+    The leader may be the bot, so the web server tails the shared change log
+    instead of listening in-process.
+    """
+    from services.google.change_events import ChangeFeed
+
+    global _relay_started
+    if _relay_started:
+        return
+    _relay_started = True
+    interval = interval or float(os.getenv("CALENDAR_CHANGES_POLL_SECONDS", "2"))
+    socketio.start_background_task(_relay_changes, ChangeFeed(mongo_db), interval)
+
+
+def _relay_changes(feed: ChangeFeed, interval: float) -> None:  # pragma: no cover - loop
+    while True:
+        relay_once(feed)
+        socketio.sleep(interval)
+
+
+def relay_once(feed: ChangeFeed) -> int:
+    """Emit every change recorded since the last poll; return how many."""
+    try:
+        payloads = feed.poll()
+    except Exception:  # noqa: BLE001
+        log.exception("Polling calendar changes failed")
+        return 0
+    for payload in payloads:
+        emit_new_event(payload)
+    return len(payloads)
+
+
 def emit_new_event(event: dict) -> None:
     socketio.emit("new_event", event, namespace="/updates")
 